@@ -14,6 +14,7 @@
 # under the License.
 
 from kmip.core import enums
+from kmip.core import validation
 
 from kmip.core.enums import CertificateTypeEnum
 from kmip.core.enums import HashingAlgorithm as HashingAlgorithmEnum
@@ -36,12 +37,14 @@ from enum import Enum
 
 # 3.1
 class UniqueIdentifier(TextString):
+    __slots__ = ()
 
     def __init__(self, value=None, tag=Tags.UNIQUE_IDENTIFIER):
         super(UniqueIdentifier, self).__init__(value, tag)
 
 
 class PrivateKeyUniqueIdentifier(UniqueIdentifier):
+    __slots__ = ()
 
     def __init__(self, value=None):
         super(PrivateKeyUniqueIdentifier, self).__init__(
@@ -49,6 +52,7 @@ class PrivateKeyUniqueIdentifier(UniqueIdentifier):
 
 
 class PublicKeyUniqueIdentifier(UniqueIdentifier):
+    __slots__ = ()
 
     def __init__(self, value=None):
         super(PublicKeyUniqueIdentifier, self).__init__(
@@ -57,13 +61,16 @@ class PublicKeyUniqueIdentifier(UniqueIdentifier):
 
 # 3.2
 class Name(Struct):
+    __slots__ = ('name_value', 'name_type')
 
     class NameValue(TextString):
+        __slots__ = ()
 
         def __init__(self, value=None):
             super(Name.NameValue, self).__init__(value, Tags.NAME_VALUE)
 
     class NameType(Enumeration):
+        __slots__ = ()
 
         ENUM_TYPE = enums.NameType
 
@@ -74,11 +81,11 @@ class Name(Struct):
         super(Name, self).__init__(tag=Tags.NAME)
         self.name_value = name_value
         self.name_type = name_type
-        self.validate()
+        validation.validate_created(self)
 
     def read(self, istream):
         super(Name, self).read(istream)
-        tstream = BytearrayStream(istream.read(self.length))
+        tstream = BytearrayStream(istream.read_view(self.length))
 
         # Read the value and type of the name
         self.name_value = Name.NameValue()
@@ -89,16 +96,14 @@ class Name(Struct):
         self.is_oversized(tstream)
 
     def write(self, ostream):
-        tstream = BytearrayStream()
+        start = self.reserve_header(ostream)
 
         # Write the value and type of the name
-        self.name_value.write(tstream)
-        self.name_type.write(tstream)
+        self.name_value.write(ostream)
+        self.name_type.write(ostream)
 
         # Write the length and value of the template attribute
-        self.length = tstream.length()
-        super(Name, self).write(ostream)
-        ostream.write(tstream.buffer)
+        self.patch_header(ostream, start)
 
     def validate(self):
         self.__validate()
@@ -153,6 +158,7 @@ class Name(Struct):
 
 # 3.3
 class ObjectType(Enumeration):
+    __slots__ = ()
 
     ENUM_TYPE = enums.ObjectType
 
@@ -162,6 +168,7 @@ class ObjectType(Enumeration):
 
 # 3.4
 class CryptographicAlgorithm(Enumeration):
+    __slots__ = ()
 
     ENUM_TYPE = enums.CryptographicAlgorithm
 
@@ -172,6 +179,7 @@ class CryptographicAlgorithm(Enumeration):
 
 # 3.5
 class CryptographicLength(Integer):
+    __slots__ = ()
 
     def __init__(self, value=None):
         super(CryptographicLength, self).__init__(
@@ -187,6 +195,8 @@ class HashingAlgorithm(Enumeration):
     Object. See Sections 3.17 and 9.1.3.2.16 of the KMIP v1.1 specification
     for more information.
     """
+    __slots__ = ()
+
     ENUM_TYPE = enums.HashingAlgorithm
 
     def __init__(self, value=HashingAlgorithmEnum.SHA_256):
@@ -202,8 +212,13 @@ class HashingAlgorithm(Enumeration):
 
 
 class CryptographicParameters(Struct):
+    __slots__ = (
+        'block_cipher_mode', 'padding_method', 'hashing_algorithm',
+        'key_role_type')
 
     class BlockCipherMode(Enumeration):
+        __slots__ = ()
+
         ENUM_TYPE = enums.BlockCipherMode
 
         def __init__(self, value=None):
@@ -211,6 +226,8 @@ class CryptographicParameters(Struct):
                 value, Tags.BLOCK_CIPHER_MODE)
 
     class PaddingMethod(Enumeration):
+        __slots__ = ()
+
         ENUM_TYPE = enums.PaddingMethod
 
         def __init__(self, value=None):
@@ -218,6 +235,8 @@ class CryptographicParameters(Struct):
                 value, Tags.PADDING_METHOD)
 
     class KeyRoleType(Enumeration):
+        __slots__ = ()
+
         ENUM_TYPE = enums.KeyRoleType
 
         def __init__(self, value=None):
@@ -238,7 +257,7 @@ class CryptographicParameters(Struct):
 
     def read(self, istream):
         super(CryptographicParameters, self).read(istream)
-        tstream = BytearrayStream(istream.read(self.length))
+        tstream = BytearrayStream(istream.read_view(self.length))
 
         if self.is_tag_next(Tags.BLOCK_CIPHER_MODE, tstream):
             self.block_cipher_mode = CryptographicParameters.BlockCipherMode()
@@ -257,25 +276,23 @@ class CryptographicParameters(Struct):
             self.key_role_type.read(tstream)
 
         self.is_oversized(tstream)
-        self.validate()
+        validation.validate_decoded(self)
 
     def write(self, ostream):
-        tstream = BytearrayStream()
+        start = self.reserve_header(ostream)
 
         # Write the contents of the request payload
         if self.block_cipher_mode is not None:
-            self.block_cipher_mode.write(tstream)
+            self.block_cipher_mode.write(ostream)
         if self.padding_method is not None:
-            self.padding_method.write(tstream)
+            self.padding_method.write(ostream)
         if self.hashing_algorithm is not None:
-            self.hashing_algorithm.write(tstream)
+            self.hashing_algorithm.write(ostream)
         if self.key_role_type is not None:
-            self.key_role_type.write(tstream)
+            self.key_role_type.write(ostream)
 
         # Write the length and value of the request payload
-        self.length = tstream.length()
-        super(CryptographicParameters, self).write(ostream)
-        ostream.write(tstream.buffer)
+        self.patch_header(ostream, start)
 
     def validate(self):
         self.__validate()
@@ -293,6 +310,8 @@ class CertificateType(Enumeration):
     Object. See Sections 2.2.1 and 3.8 of the KMIP v1.1 specification for more
     information.
     """
+    __slots__ = ()
+
     ENUM_TYPE = enums.CertificateTypeEnum
 
     def __init__(self, value=CertificateTypeEnum.X_509):
@@ -319,6 +338,7 @@ class DigestValue(ByteString):
     Attributes:
         value: The bytes of the hash.
     """
+    __slots__ = ()
 
     def __init__(self, value=b''):
         """
@@ -345,6 +365,7 @@ class Digest(Struct):
         digest_value: The bytes representing the hash digest value.
         key_format_type: The type of the key the hash was generated for.
     """
+    __slots__ = ('hashing_algorithm', 'digest_value', 'key_format_type')
 
     def __init__(self,
                  hashing_algorithm=None,
@@ -379,7 +400,7 @@ class Digest(Struct):
         else:
             self.key_format_type = key_format_type
 
-        self.validate()
+        validation.validate_created(self)
 
     def read(self, istream):
         """
@@ -391,14 +412,14 @@ class Digest(Struct):
                 supporting a read method; usually a BytearrayStream object.
         """
         super(Digest, self).read(istream)
-        tstream = BytearrayStream(istream.read(self.length))
+        tstream = BytearrayStream(istream.read_view(self.length))
 
         self.hashing_algorithm.read(tstream)
         self.digest_value.read(tstream)
         self.key_format_type.read(tstream)
 
         self.is_oversized(tstream)
-        self.validate()
+        validation.validate_decoded(self)
 
     def write(self, ostream):
         """
@@ -408,15 +429,13 @@ class Digest(Struct):
             ostream (Stream): A data stream in which to encode object data,
                 supporting a write method; usually a BytearrayStream object.
         """
-        tstream = BytearrayStream()
+        start = self.reserve_header(ostream)
 
-        self.hashing_algorithm.write(tstream)
-        self.digest_value.write(tstream)
-        self.key_format_type.write(tstream)
+        self.hashing_algorithm.write(ostream)
+        self.digest_value.write(ostream)
+        self.key_format_type.write(ostream)
 
-        self.length = tstream.length()
-        super(Digest, self).write(ostream)
-        ostream.write(tstream.buffer)
+        self.patch_header(ostream, start)
 
     def validate(self):
         """
@@ -505,12 +524,12 @@ class Digest(Struct):
             >>> x.hashing_algorithm
             HashingAlgorithm(value=HashingAlgorithm.MD5)
             >>> x.digest_value
-            DigestValue(value=bytearray(b'\x00'))
+            DigestValue(value=b'\x00')
             >>> x.key_format_type
             KeyFormatType(value=KeyFormatType.RAW)
         """
         algorithm = HashingAlgorithm(hashing_algorithm)
-        value = DigestValue(bytearray(digest_value))
+        value = DigestValue(digest_value)
         format_type = KeyFormatType(key_format_type)
 
         return Digest(hashing_algorithm=algorithm,
@@ -520,6 +539,7 @@ class Digest(Struct):
 
 # 3.18
 class OperationPolicyName(TextString):
+    __slots__ = ()
 
     def __init__(self, value=None):
         super(OperationPolicyName, self).__init__(
@@ -528,6 +548,7 @@ class OperationPolicyName(TextString):
 
 # 3.19
 class CryptographicUsageMask(Integer):
+    __slots__ = ()
 
     ENUM_TYPE = enums.CryptographicUsageMask
 
@@ -538,6 +559,7 @@ class CryptographicUsageMask(Integer):
 
 # 3.33
 class ObjectGroup(TextString):
+    __slots__ = ()
 
     def __init__(self, value=None):
         super(ObjectGroup, self).__init__(value, Tags.OBJECT_GROUP)
@@ -552,6 +574,7 @@ class ApplicationNamespace(TextString):
     responses to a Query request. See Sections 3.36 and 4.25 of the KMIP v1.1
     specification for more information.
     """
+    __slots__ = ()
 
     def __init__(self, value=None):
         """
@@ -572,6 +595,7 @@ class ApplicationData(TextString):
     A part of ApplicationSpecificInformation. See Section 3.36 of the KMIP v1.1
     specification for more information.
     """
+    __slots__ = ()
 
     def __init__(self, value=None):
         """
@@ -598,6 +622,7 @@ class ApplicationSpecificInformation(Struct):
 
     See Section 3.36 of the KMIP v1.1 specification for more information.
     """
+    __slots__ = ('application_namespace', 'application_data')
 
     def __init__(self, application_namespace=None, application_data=None):
         """
@@ -622,7 +647,7 @@ class ApplicationSpecificInformation(Struct):
         else:
             self.application_data = application_data
 
-        self.validate()
+        validation.validate_created(self)
 
     def read(self, istream):
         """
@@ -634,13 +659,13 @@ class ApplicationSpecificInformation(Struct):
                 supporting a read method; usually a BytearrayStream object.
         """
         super(ApplicationSpecificInformation, self).read(istream)
-        tstream = BytearrayStream(istream.read(self.length))
+        tstream = BytearrayStream(istream.read_view(self.length))
 
         self.application_namespace.read(tstream)
         self.application_data.read(tstream)
 
         self.is_oversized(tstream)
-        self.validate()
+        validation.validate_decoded(self)
 
     def write(self, ostream):
         """
@@ -651,14 +676,12 @@ class ApplicationSpecificInformation(Struct):
             ostream (Stream): A data stream in which to encode object data,
                 supporting a write method; usually a BytearrayStream object.
         """
-        tstream = BytearrayStream()
+        start = self.reserve_header(ostream)
 
-        self.application_namespace.write(tstream)
-        self.application_data.write(tstream)
+        self.application_namespace.write(ostream)
+        self.application_data.write(ostream)
 
-        self.length = tstream.length()
-        super(ApplicationSpecificInformation, self).write(ostream)
-        ostream.write(tstream.buffer)
+        self.patch_header(ostream, start)
 
     def validate(self):
         """
@@ -709,6 +732,7 @@ class ApplicationSpecificInformation(Struct):
 
 # 3.37
 class ContactInformation(TextString):
+    __slots__ = ()
 
     def __init__(self, value=None):
         super(ContactInformation, self).__init__(
@@ -720,6 +744,7 @@ class ContactInformation(TextString):
 # TODO (peter-hamilton) cover all potential custom attributes. This is a
 # TODO (peter-hamilton) temporary stopgap.
 class CustomAttribute(TextString):
+    __slots__ = ()
 
     def __init__(self, value=None):
         super(CustomAttribute, self).__init__(value, Tags.ATTRIBUTE_VALUE)
@@ -629,3 +629,41 @@ class RevocationReasonCode(Enum):
     SUPERSEDED             = 0x00000005
     CESSATION_OF_OPERATION = 0x00000006
     PRIVILEGE_WITHDRAWN    = 0x00000007
+
+
+def _build_value_tables(namespace):
+    tables = dict()
+    for obj in list(namespace.values()):
+        if isinstance(obj, type) and issubclass(obj, Enum) and obj is not Enum:
+            tables[obj] = dict((member.value, member) for member in obj)
+    return tables
+
+
+# Tables mapping the value of each member of the enumerations defined above
+# to the member itself, built once at import time. Looking members up here is
+# an order of magnitude cheaper than calling the enumeration, which matters
+# when decoding every item of a large message.
+VALUE_TABLES = _build_value_tables(globals())
+
+
+def lookup_member(enum_type, value):
+    """
+    Look up the member of an enumeration with the given value.
+
+    Args:
+        enum_type (class): The enumeration to search. Enumerations not defined
+            in this module are supported, but are not accelerated.
+        value (object): The value of the requested member.
+
+    Returns:
+        Enum: The member of the enumeration with the given value.
+
+    Raises:
+        ValueError: if the enumeration has no member with the given value.
+    """
+    table = VALUE_TABLES.get(enum_type)
+    if table is not None:
+        member = table.get(value)
+        if member is not None:
+            return member
+    return enum_type(value)
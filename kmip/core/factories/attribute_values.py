@@ -38,96 +38,46 @@ from kmip.core import utils
 
 class AttributeValueFactory(object):
 
+    def __init__(self):
+        # Map each attribute type to the method creating its value, so that
+        # create_attribute_value is a single lookup
+        self._constructors = dict()
+        for attribute_type in AttributeType:
+            self._constructors[attribute_type] = getattr(
+                self, '_create_{0}'.format(attribute_type.name.lower()))
+        self._constructors[AttributeType.DIGEST] = \
+            lambda value: self._create_digest()
+
     def create_attribute_value(self, name, value):
-        # Switch on the name of the attribute
-        if name is AttributeType.UNIQUE_IDENTIFIER:
-            value = self._create_unique_identifier(value)
-        elif name is AttributeType.NAME:
-            value = self._create_name(value)
-        elif name is AttributeType.OBJECT_TYPE:
-            value = self._create_object_type(value)
-        elif name is AttributeType.CRYPTOGRAPHIC_ALGORITHM:
-            value = self._create_cryptographic_algorithm(value)
-        elif name is AttributeType.CRYPTOGRAPHIC_LENGTH:
-            value = self._create_cryptographic_length(value)
-        elif name is AttributeType.CRYPTOGRAPHIC_PARAMETERS:
-            value = self._create_cryptographic_parameters(value)
-        elif name is AttributeType.CRYPTOGRAPHIC_DOMAIN_PARAMETERS:
-            value = self._create_cryptographic_domain_parameters(value)
-        elif name is AttributeType.CERTIFICATE_TYPE:
-            value = self._create_certificate_type(value)
-        elif name is AttributeType.CERTIFICATE_LENGTH:
-            value = self._create_certificate_length(value)
-        elif name is AttributeType.X_509_CERTIFICATE_IDENTIFIER:
-            value = self._create_x_509_certificate_identifier(value)
-        elif name is AttributeType.X_509_CERTIFICATE_SUBJECT:
-            value = self._create_x_509_certificate_subject(value)
-        elif name is AttributeType.X_509_CERTIFICATE_ISSUER:
-            value = self._create_x_509_certificate_issuer(value)
-        elif name is AttributeType.CERTIFICATE_IDENTIFIER:
-            value = self._create_certificate_identifier(value)
-        elif name is AttributeType.CERTIFICATE_SUBJECT:
-            value = self._create_certificate_subject(value)
-        elif name is AttributeType.CERTIFICATE_ISSUER:
-            value = self._create_certificate_issuer(value)
-        elif name is AttributeType.DIGITAL_SIGNATURE_ALGORITHM:
-            value = self._create_digital_signature_algorithm(value)
-        elif name is AttributeType.DIGEST:
-            value = self._create_digest()
-        elif name is AttributeType.OPERATION_POLICY_NAME:
-            value = self._create_operation_policy_name(value)
-        elif name is AttributeType.CRYPTOGRAPHIC_USAGE_MASK:
-            value = self._create_cryptographic_usage_mask(value)
-        elif name is AttributeType.LEASE_TIME:
-            value = self._create_lease_time(value)
-        elif name is AttributeType.USAGE_LIMITS:
-            value = self._create_usage_limits(value)
-        elif name is AttributeType.STATE:
-            value = self._create_state(value)
-        elif name is AttributeType.INITIAL_DATE:
-            value = self._create_initial_date(value)
-        elif name is AttributeType.ACTIVATION_DATE:
-            value = self._create_activation_date(value)
-        elif name is AttributeType.PROCESS_START_DATE:
-            value = self._create_process_start_date(value)
-        elif name is AttributeType.PROTECT_STOP_DATE:
-            value = self._create_protect_stop_date(value)
-        elif name is AttributeType.DEACTIVATION_DATE:
-            value = self._create_deactivation_date(value)
-        elif name is AttributeType.DESTROY_DATE:
-            value = self._create_destroy_date(value)
-        elif name is AttributeType.COMPROMISE_OCCURRENCE_DATE:
-            value = self._create_compromise_occurrence_date(value)
-        elif name is AttributeType.COMPROMISE_DATE:
-            value = self._create_compromise_date(value)
-        elif name is AttributeType.REVOCATION_REASON:
-            value = self._create_revocation_reason(value)
-        elif name is AttributeType.ARCHIVE_DATE:
-            value = self._create_archive_date(value)
-        elif name is AttributeType.OBJECT_GROUP:
-            value = self._create_object_group(value)
-        elif name is AttributeType.FRESH:
-            value = self._create_fresh(value)
-        elif name is AttributeType.LINK:
-            value = self._create_link(value)
-        elif name is AttributeType.APPLICATION_SPECIFIC_INFORMATION:
-            value = self._create_application_specific_information(value)
-        elif name is AttributeType.CONTACT_INFORMATION:
-            value = self._create_contact_information(value)
-        elif name is AttributeType.LAST_CHANGE_DATE:
-            value = self._create_last_change_date(value)
-        elif name is AttributeType.CUSTOM_ATTRIBUTE:
+        constructor = self._constructors.get(name)
+        if constructor is not None:
+            return constructor(value)
+
+        if not isinstance(name, str):
+            raise ValueError('Unrecognized attribute type: '
+                             '{0}'.format(name))
+        elif name.startswith('x-'):
+            # Custom attribute indicated
             value = self._create_custom_attribute(value)
-        else:
-            if not isinstance(name, str):
-                raise ValueError('Unrecognized attribute type: '
-                                 '{0}'.format(name))
-            elif name.startswith('x-'):
-                # Custom attribute indicated
-                value = self._create_custom_attribute(value)
 
         return value
 
+    def register(self, name, constructor):
+        """
+        Register the value constructor for an attribute.
+
+        Replaces the constructor of a standard attribute, or adds a custom
+        attribute identified by its name.
+
+        Args:
+            name (AttributeType|string): The attribute type, or the name of a
+                custom attribute as found in Attribute encodings.
+            constructor (callable): A callable taking the value passed to
+                create_attribute_value, which is None when decoding, and
+                returning a new attribute value.
+        """
+        self._constructors[name] = constructor
+
     def _create_unique_identifier(self, uuid):
         return UniqueIdentifier(uuid)
 
@@ -320,3 +270,8 @@ class AttributeValueFactory(object):
 
     def _create_custom_attribute(self, data):
         return CustomAttribute(data)
+
+
+# A shared factory, holding the value constructors registered for custom
+# attributes
+attribute_value_factory = AttributeValueFactory()
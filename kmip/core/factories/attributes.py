@@ -15,7 +15,7 @@
 
 from enum import Enum
 
-from kmip.core.factories.attribute_values import AttributeValueFactory
+from kmip.core.factories.attribute_values import attribute_value_factory
 
 from kmip.core.objects import Attribute
 
@@ -25,7 +25,7 @@ from kmip.core import utils
 class AttributeFactory(object):
 
     def __init__(self):
-        self.value_factory = AttributeValueFactory()
+        self.value_factory = attribute_value_factory
 
     def _create_attribute(self, name, value, index):
         attribute_name = Attribute.AttributeName(name)
@@ -18,70 +18,34 @@ from kmip.core.enums import Operation
 
 class PayloadFactory():
 
+    def __init__(self):
+        # Map each operation to the method creating its payload, so that
+        # create is a single lookup
+        self._constructors = dict()
+        for operation in Operation:
+            self._constructors[operation] = getattr(
+                self, '_create_{0}_payload'.format(operation.name.lower()))
+
     def create(self, operation):
-        # Switch on Operation enum
-        if operation is Operation.CREATE:
-            return self._create_create_payload()
-        elif operation is Operation.CREATE_KEY_PAIR:
-            return self._create_create_key_pair_payload()
-        elif operation is Operation.REGISTER:
-            return self._create_register_payload()
-        elif operation is Operation.REKEY:
-            return self._create_rekey_payload()
-        elif operation is Operation.DERIVE_KEY:
-            return self._create_derive_key_payload()
-        elif operation is Operation.CERTIFY:
-            return self._create_certify_payload()
-        elif operation is Operation.RECERTIFY:
-            return self._create_recertify_payload()
-        elif operation is Operation.LOCATE:
-            return self._create_locate_payload()
-        elif operation is Operation.CHECK:
-            return self._create_check_payload()
-        elif operation is Operation.GET:
-            return self._create_get_payload()
-        elif operation is Operation.GET_ATTRIBUTES:
-            return self._create_get_attributes_payload()
-        elif operation is Operation.GET_ATTRIBUTE_LIST:
-            return self._create_get_attribute_list_payload()
-        elif operation is Operation.ADD_ATTRIBUTE:
-            return self._create_add_attribute_payload()
-        elif operation is Operation.MODIFY_ATTRIBUTE:
-            return self._create_modify_attribute_payload()
-        elif operation is Operation.DELETE_ATTRIBUTE:
-            return self._create_delete_attribute_payload()
-        elif operation is Operation.OBTAIN_LEASE:
-            return self._create_obtain_lease_payload()
-        elif operation is Operation.GET_USAGE_ALLOCATION:
-            return self._create_get_usage_allocation_payload()
-        elif operation is Operation.ACTIVATE:
-            return self._create_activate_payload()
-        elif operation is Operation.REVOKE:
-            return self._create_revoke_payload()
-        elif operation is Operation.DESTROY:
-            return self._create_destroy_payload()
-        elif operation is Operation.ARCHIVE:
-            return self._create_archive_payload()
-        elif operation is Operation.RECOVER:
-            return self._create_recover_payload()
-        elif operation is Operation.VALIDATE:
-            return self._create_validate_payload()
-        elif operation is Operation.QUERY:
-            return self._create_query_payload()
-        elif operation is Operation.CANCEL:
-            return self._create_cancel_payload()
-        elif operation is Operation.POLL:
-            return self._create_poll_payload()
-        elif operation is Operation.NOTIFY:
-            return self._create_notify_payload()
-        elif operation is Operation.PUT:
-            return self._create_put_payload()
-        elif operation is Operation.REKEY_KEY_PAIR:
-            return self._create_rekey_key_pair_payload()
-        elif operation is Operation.DISCOVER_VERSIONS:
-            return self._create_discover_versions_payload()
-        else:
+        constructor = self._constructors.get(operation)
+        if constructor is None:
             raise ValueError('unsupported operation: {0}'.format(operation))
+        return constructor()
+
+    def register(self, operation, constructor):
+        """
+        Register the payload constructor for an operation.
+
+        Replaces the constructor of a standard operation, or adds a vendor
+        operation that is not part of the Operation enumeration.
+
+        Args:
+            operation (Operation): The operation, or any other hashable value
+                identifying a vendor operation.
+            constructor (callable): A callable taking no arguments and
+                returning a new payload for the operation.
+        """
+        self._constructors[operation] = constructor
 
     def _create_create_payload(self):
         raise NotImplementedError()
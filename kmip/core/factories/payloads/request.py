@@ -66,3 +66,8 @@ class RequestPayloadFactory(PayloadFactory):
 
     def _create_revoke_payload(self):
         return revoke.RevokeRequestPayload()
+
+
+# A shared factory, holding the payload constructors registered for vendor
+# operations
+request_payload_factory = RequestPayloadFactory()
@@ -66,3 +66,8 @@ class ResponsePayloadFactory(PayloadFactory):
 
     def _create_revoke_payload(self):
         return revoke.RevokeResponsePayload()
+
+
+# A shared factory, holding the payload constructors registered for vendor
+# operations
+response_payload_factory = ResponsePayloadFactory()
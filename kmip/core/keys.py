@@ -24,6 +24,8 @@ from kmip.core.primitives import ByteString
 
 from kmip.core.utils import BytearrayStream
 
+from kmip.core import validation
+
 
 class RawKey(ByteString):
 
@@ -72,27 +74,25 @@ class TransparentSymmetricKey(Struct):
     def __init__(self, key=None):
         super(TransparentSymmetricKey, self).__init__(Tags.KEY_MATERIAL)
         self.key = key
-        self.validate()
+        validation.validate_created(self)
 
     def read(self, istream):
         super(TransparentSymmetricKey, self).read(istream)
-        tstream = BytearrayStream(istream.read(self.length))
+        tstream = BytearrayStream(istream.read_view(self.length))
 
         self.key = TransparentSymmetricKey.Key()
         self.key.read(tstream)
 
         self.is_oversized(tstream)
-        self.validate()
+        validation.validate_decoded(self)
 
     def write(self, ostream):
-        tstream = BytearrayStream()
+        start = self.reserve_header(ostream)
 
-        self.key.write(tstream)
+        self.key.write(ostream)
 
         # Write the length and value of the key wrapping data
-        self.length = tstream.length()
-        super(TransparentSymmetricKey, self).write(ostream)
-        ostream.write(tstream.buffer)
+        self.patch_header(ostream, start)
 
     def validate(self):
         self.__validate()
@@ -22,6 +22,7 @@ from kmip.core.enums import Tags
 
 from kmip.core import objects
 from kmip.core import utils
+from kmip.core import validation
 
 from kmip.core.primitives import Struct
 from kmip.core.primitives import Integer
@@ -62,11 +63,11 @@ class ProtocolVersion(Struct):
         else:
             self.protocol_version_minor = protocol_version_minor
 
-        self.validate()
+        validation.validate_created(self)
 
     def read(self, istream):
         super(ProtocolVersion, self).read(istream)
-        tstream = utils.BytearrayStream(istream.read(self.length))
+        tstream = utils.BytearrayStream(istream.read_view(self.length))
 
         # Read the major and minor portions of the version number
         self.protocol_version_major.read(tstream)
@@ -75,16 +76,14 @@ class ProtocolVersion(Struct):
         self.is_oversized(tstream)
 
     def write(self, ostream):
-        tstream = utils.BytearrayStream()
+        start = self.reserve_header(ostream)
 
         # Write the major and minor portions of the protocol version
-        self.protocol_version_major.write(tstream)
-        self.protocol_version_minor.write(tstream)
+        self.protocol_version_major.write(ostream)
+        self.protocol_version_minor.write(ostream)
 
         # Write the length and value of the protocol version
-        self.length = tstream.length()
-        super(ProtocolVersion, self).write(ostream)
-        ostream.write(tstream.buffer)
+        self.patch_header(ostream, start)
 
     def validate(self):
         self.__validate()
@@ -174,7 +173,7 @@ class Authentication(Struct):
 
     def read(self, istream):
         super(Authentication, self).read(istream)
-        tstream = utils.BytearrayStream(istream.read(self.length))
+        tstream = utils.BytearrayStream(istream.read_view(self.length))
 
         # Read the credential
         self.credential = objects.Credential()
@@ -183,15 +182,13 @@ class Authentication(Struct):
         self.is_oversized(tstream)
 
     def write(self, ostream):
-        tstream = utils.BytearrayStream()
+        start = self.reserve_header(ostream)
 
         # Write the credential
-        self.credential.write(tstream)
+        self.credential.write(ostream)
 
         # Write the length and value of the protocol version
-        self.length = tstream.length()
-        super(Authentication, self).write(ostream)
-        ostream.write(tstream.buffer)
+        self.patch_header(ostream, start)
 
     def validate(self):
         # TODO (peter-hamilton) Finish implementation.
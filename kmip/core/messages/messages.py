@@ -19,13 +19,16 @@ from kmip.core.messages import contents
 from kmip.core.messages.contents import AsynchronousCorrelationValue
 from kmip.core.messages.contents import BatchErrorContinuationOption
 
-from kmip.core.factories.payloads.request import RequestPayloadFactory
-from kmip.core.factories.payloads.response import ResponsePayloadFactory
+from kmip.core.factories.payloads.request import request_payload_factory
+from kmip.core.factories.payloads.response import \
+    response_payload_factory
 
 from kmip.core.primitives import Struct
 
 from kmip.core.utils import BytearrayStream
 
+from kmip.core import validation
+
 
 class RequestHeader(Struct):
 
@@ -50,7 +53,7 @@ class RequestHeader(Struct):
 
     def read(self, istream):
         super(RequestHeader, self).read(istream)
-        tstream = BytearrayStream(istream.read(self.length))
+        tstream = BytearrayStream(istream.read_view(self.length))
 
         self.protocol_version = contents.ProtocolVersion()
         self.protocol_version.read(tstream)
@@ -91,28 +94,26 @@ class RequestHeader(Struct):
         self.is_oversized(tstream)
 
     def write(self, ostream):
-        tstream = BytearrayStream()
+        start = self.reserve_header(ostream)
 
         # Write the contents of a request header to the stream
-        self.protocol_version.write(tstream)
+        self.protocol_version.write(ostream)
         if self.maximum_response_size is not None:
-            self.maximum_response_size.write(tstream)
+            self.maximum_response_size.write(ostream)
         if self.asynchronous_indicator is not None:
-            self.asynchronous_indicator.write(tstream)
+            self.asynchronous_indicator.write(ostream)
         if self.authentication is not None:
-            self.authentication.write(tstream)
+            self.authentication.write(ostream)
         if self.batch_error_cont_option is not None:
-            self.batch_error_cont_option.write(tstream)
+            self.batch_error_cont_option.write(ostream)
         if self.batch_order_option is not None:
-            self.batch_order_option.write(tstream)
+            self.batch_order_option.write(ostream)
         if self.time_stamp is not None:
-            self.time_stamp.write(tstream)
-        self.batch_count.write(tstream)
+            self.time_stamp.write(ostream)
+        self.batch_count.write(ostream)
 
         # Write the length and value of the request header
-        self.length = tstream.length()
-        super(RequestHeader, self).write(ostream)
-        ostream.write(tstream.buffer)
+        self.patch_header(ostream, start)
 
 
 class ResponseHeader(Struct):
@@ -125,11 +126,11 @@ class ResponseHeader(Struct):
         self.protocol_version = protocol_version
         self.time_stamp = time_stamp
         self.batch_count = batch_count
-        self.validate()
+        validation.validate_created(self)
 
     def read(self, istream):
         super(ResponseHeader, self).read(istream)
-        tstream = BytearrayStream(istream.read(self.length))
+        tstream = BytearrayStream(istream.read_view(self.length))
 
         self.protocol_version = contents.ProtocolVersion()
         self.protocol_version.read(tstream)
@@ -141,20 +142,18 @@ class ResponseHeader(Struct):
         self.batch_count.read(tstream)
 
         self.is_oversized(tstream)
-        self.validate()
+        validation.validate_decoded(self)
 
     def write(self, ostream):
-        tstream = BytearrayStream()
+        start = self.reserve_header(ostream)
 
         # Write the contents of a response header to the stream
-        self.protocol_version.write(tstream)
-        self.time_stamp.write(tstream)
-        self.batch_count.write(tstream)
+        self.protocol_version.write(ostream)
+        self.time_stamp.write(ostream)
+        self.batch_count.write(ostream)
 
         # Write the length and value of the request header
-        self.length = tstream.length()
-        super(ResponseHeader, self).write(ostream)
-        ostream.write(tstream.buffer)
+        self.patch_header(ostream, start)
 
     def validate(self):
         if self.protocol_version is not None:
@@ -170,6 +169,8 @@ class ResponseHeader(Struct):
 
 class RequestBatchItem(Struct):
 
+    payload_factory = request_payload_factory
+
     def __init__(self,
                  operation=None,
                  unique_batch_item_id=None,
@@ -177,16 +178,14 @@ class RequestBatchItem(Struct):
                  message_extension=None):
         super(RequestBatchItem, self).__init__(tag=Tags.REQUEST_BATCH_ITEM)
 
-        self.payload_factory = RequestPayloadFactory()
-
         self.operation = operation
         self.unique_batch_item_id = unique_batch_item_id
         self.request_payload = request_payload
         self.message_extension = message_extension
 
-    def read(self, istream):
+    def read(self, istream, lazy=False):
         super(RequestBatchItem, self).read(istream)
-        tstream = BytearrayStream(istream.read(self.length))
+        tstream = BytearrayStream(istream.read_view(self.length))
 
         # Read the batch item operation
         self.operation = contents.Operation()
@@ -201,7 +200,10 @@ class RequestBatchItem(Struct):
         # operation
         self.request_payload = self.payload_factory.create(
             self.operation.enum)
-        self.request_payload.read(tstream)
+        if lazy:
+            self.request_payload.read_lazy(tstream)
+        else:
+            self.request_payload.read(tstream)
 
         # Read the message extension if it is present
         if self.is_tag_next(Tags.MESSAGE_EXTENSION, tstream):
@@ -211,27 +213,27 @@ class RequestBatchItem(Struct):
         self.is_oversized(tstream)
 
     def write(self, ostream):
-        tstream = BytearrayStream()
+        start = self.reserve_header(ostream)
 
         # Write the contents of the batch item to the stream
-        self.operation.write(tstream)
+        self.operation.write(ostream)
 
         if self.unique_batch_item_id is not None:
-            self.unique_batch_item_id.write(tstream)
+            self.unique_batch_item_id.write(ostream)
 
-        self.request_payload.write(tstream)
+        self.request_payload.write(ostream)
 
         if self.message_extension is not None:
-            self.message_extension.write(tstream)
+            self.message_extension.write(ostream)
 
         # Write the length and value of the batch item
-        self.length = tstream.length()
-        super(RequestBatchItem, self).write(ostream)
-        ostream.write(tstream.buffer)
+        self.patch_header(ostream, start)
 
 
 class ResponseBatchItem(Struct):
 
+    payload_factory = response_payload_factory
+
     def __init__(self,
                  operation=None,
                  unique_batch_item_id=None,
@@ -243,8 +245,6 @@ class ResponseBatchItem(Struct):
                  message_extension=None):
         super(ResponseBatchItem, self).__init__(tag=Tags.RESPONSE_BATCH_ITEM)
 
-        self.payload_factory = ResponsePayloadFactory()
-
         self.operation = operation
         self.unique_batch_item_id = unique_batch_item_id
         self.result_status = result_status
@@ -253,11 +253,11 @@ class ResponseBatchItem(Struct):
         self.async_correlation_value = async_correlation_value
         self.response_payload = response_payload
         self.message_extension = message_extension
-        self.validate()
+        validation.validate_created(self)
 
-    def read(self, istream):
+    def read(self, istream, lazy=False):
         super(ResponseBatchItem, self).read(istream)
-        tstream = BytearrayStream(istream.read(self.length))
+        tstream = BytearrayStream(istream.read_view(self.length))
 
         # Read the batch item operation if it is present
         if self.is_tag_next(Tags.OPERATION, tstream):
@@ -293,7 +293,10 @@ class ResponseBatchItem(Struct):
         expected = self.payload_factory.create(self.operation.enum)
         if self.is_tag_next(expected.tag, tstream):
             self.response_payload = expected
-            self.response_payload.read(tstream)
+            if lazy:
+                self.response_payload.read_lazy(tstream)
+            else:
+                self.response_payload.read(tstream)
 
         # Read the message extension if it is present
         if self.is_tag_next(Tags.MESSAGE_EXTENSION, tstream):
@@ -301,34 +304,32 @@ class ResponseBatchItem(Struct):
             self.message_extension.read(tstream)
 
         self.is_oversized(tstream)
-        self.validate()
+        validation.validate_decoded(self)
 
     def write(self, ostream):
-        tstream = BytearrayStream()
+        start = self.reserve_header(ostream)
 
         # Write the contents of the batch item to the stream
         if self.operation is not None:
-            self.operation.write(tstream)
+            self.operation.write(ostream)
         if self.unique_batch_item_id is not None:
-            self.unique_batch_item_id.write(tstream)
+            self.unique_batch_item_id.write(ostream)
 
-        self.result_status.write(tstream)
+        self.result_status.write(ostream)
 
         if self.result_reason is not None:
-            self.result_reason.write(tstream)
+            self.result_reason.write(ostream)
         if self.result_message is not None:
-            self.result_message.write(tstream)
+            self.result_message.write(ostream)
         if self.async_correlation_value is not None:
-            self.async_correlation_value.write(tstream)
+            self.async_correlation_value.write(ostream)
         if self.response_payload is not None:
-            self.response_payload.write(tstream)
+            self.response_payload.write(ostream)
         if self.message_extension is not None:
-            self.message_extension.write(tstream)
+            self.message_extension.write(ostream)
 
         # Write the length and value of the batch item
-        self.length = tstream.length()
-        super(ResponseBatchItem, self).write(ostream)
-        ostream.write(tstream.buffer)
+        self.patch_header(ostream, start)
 
     def validate(self):
         pass
@@ -341,7 +342,8 @@ class RequestMessage(Struct):
         self.request_header = request_header
         self.batch_items = batch_items
 
-    def read(self, istream):
+    def read(self, istream, lazy=False):
+        # In lazy mode, the request payloads are only decoded when first used
         super(RequestMessage, self).read(istream)
 
         self.request_header = RequestHeader()
@@ -350,21 +352,19 @@ class RequestMessage(Struct):
         self.batch_items = []
         for _ in range(self.request_header.batch_count.value):
             batch_item = RequestBatchItem()
-            batch_item.read(istream)
+            batch_item.read(istream, lazy=lazy)
             self.batch_items.append(batch_item)
 
     def write(self, ostream):
-        tstream = BytearrayStream()
+        start = self.reserve_header(ostream)
 
         # Write the request header and all batch items
-        self.request_header.write(tstream)
+        self.request_header.write(ostream)
         for batch_item in self.batch_items:
-            batch_item.write(tstream)
+            batch_item.write(ostream)
 
         # Write the TTLV encoding of the request message
-        self.length = tstream.length()
-        super(RequestMessage, self).write(ostream)
-        ostream.write(tstream.buffer)
+        self.patch_header(ostream, start)
 
 
 class ResponseMessage(Struct):
@@ -373,9 +373,10 @@ class ResponseMessage(Struct):
         super(ResponseMessage, self).__init__(tag=Tags.RESPONSE_MESSAGE)
         self.response_header = response_header
         self.batch_items = batch_items
-        self.validate()
+        validation.validate_created(self)
 
-    def read(self, istream):
+    def read(self, istream, lazy=False):
+        # In lazy mode, the response payloads are only decoded when first used
         super(ResponseMessage, self).read(istream)
 
         self.response_header = ResponseHeader()
@@ -384,22 +385,20 @@ class ResponseMessage(Struct):
         self.batch_items = []
         for _ in range(self.response_header.batch_count.value):
             batch_item = ResponseBatchItem()
-            batch_item.read(istream)
+            batch_item.read(istream, lazy=lazy)
             self.batch_items.append(batch_item)
-        self.validate()
+        validation.validate_decoded(self)
 
     def write(self, ostream):
-        tstream = BytearrayStream()
+        start = self.reserve_header(ostream)
 
         # Write the request header and all batch items
-        self.response_header.write(tstream)
+        self.response_header.write(ostream)
         for batch_item in self.batch_items:
-            batch_item.write(tstream)
+            batch_item.write(ostream)
 
         # Write the TTLV encoding of the request message
-        self.length = tstream.length()
-        super(ResponseMessage, self).write(ostream)
-        ostream.write(tstream.buffer)
+        self.patch_header(ostream, start)
 
     def validate(self):
         pass
@@ -15,6 +15,7 @@
 
 from kmip.core import attributes
 from kmip.core import enums
+from kmip.core import validation
 
 from kmip.core.primitives import Struct
 
@@ -43,7 +44,7 @@ class ActivateRequestPayload(Struct):
         super(ActivateRequestPayload, self).__init__(
             tag=enums.Tags.REQUEST_PAYLOAD)
         self.unique_identifier = unique_identifier
-        self.validate()
+        validation.validate_created(self)
 
     def read(self, istream):
         """
@@ -54,13 +55,13 @@ class ActivateRequestPayload(Struct):
                 supporting a read method; usually a BytearrayStream object.
         """
         super(ActivateRequestPayload, self).read(istream)
-        tstream = BytearrayStream(istream.read(self.length))
+        tstream = BytearrayStream(istream.read_view(self.length))
 
         self.unique_identifier = attributes.UniqueIdentifier()
         self.unique_identifier.read(tstream)
 
         self.is_oversized(tstream)
-        self.validate()
+        validation.validate_decoded(self)
 
     def write(self, ostream):
         """
@@ -69,16 +70,14 @@ class ActivateRequestPayload(Struct):
             ostream (Stream): A data stream in which to encode object data,
                 supporting a write method; usually a BytearrayStream object.
         """
-        tstream = BytearrayStream()
+        start = self.reserve_header(ostream)
 
         # Write the contents of the request payload
         if self.unique_identifier is not None:
-            self.unique_identifier.write(tstream)
+            self.unique_identifier.write(ostream)
 
         # Write the length and value of the request payload
-        self.length = tstream.length()
-        super(ActivateRequestPayload, self).write(ostream)
-        ostream.write(tstream.buffer)
+        self.patch_header(ostream, start)
 
     def validate(self):
         """
@@ -116,7 +115,7 @@ class ActivateResponsePayload(Struct):
             self.unique_identifier = attributes.UniqueIdentifier()
         else:
             self.unique_identifier = unique_identifier
-        self.validate()
+        validation.validate_created(self)
 
     def read(self, istream):
         """
@@ -128,13 +127,13 @@ class ActivateResponsePayload(Struct):
                 supporting a read method; usually a BytearrayStream object.
         """
         super(ActivateResponsePayload, self).read(istream)
-        tstream = BytearrayStream(istream.read(self.length))
+        tstream = BytearrayStream(istream.read_view(self.length))
 
         self.unique_identifier = attributes.UniqueIdentifier()
         self.unique_identifier.read(tstream)
 
         self.is_oversized(tstream)
-        self.validate()
+        validation.validate_decoded(self)
 
     def write(self, ostream):
         """
@@ -144,15 +143,13 @@ class ActivateResponsePayload(Struct):
             ostream (Stream): A data stream in which to encode object data,
                 supporting a write method; usually a BytearrayStream object.
         """
-        tstream = BytearrayStream()
+        start = self.reserve_header(ostream)
 
         # Write the contents of the response payload
-        self.unique_identifier.write(tstream)
+        self.unique_identifier.write(ostream)
 
         # Write the length and value of the request payload
-        self.length = tstream.length()
-        super(ActivateResponsePayload, self).write(ostream)
-        ostream.write(tstream.buffer)
+        self.patch_header(ostream, start)
 
     def validate(self):
         """
@@ -15,6 +15,7 @@
 
 from kmip.core import attributes
 from kmip.core import enums
+from kmip.core import validation
 from kmip.core.enums import Tags
 
 from kmip.core.objects import TemplateAttribute
@@ -33,11 +34,11 @@ class CreateRequestPayload(Struct):
             tag=enums.Tags.REQUEST_PAYLOAD)
         self.object_type = object_type
         self.template_attribute = template_attribute
-        self.validate()
+        validation.validate_created(self)
 
     def read(self, istream):
         super(CreateRequestPayload, self).read(istream)
-        tstream = BytearrayStream(istream.read(self.length))
+        tstream = BytearrayStream(istream.read_view(self.length))
 
         self.object_type = attributes.ObjectType()
         self.template_attribute = TemplateAttribute()
@@ -46,19 +47,17 @@ class CreateRequestPayload(Struct):
         self.template_attribute.read(tstream)
 
         self.is_oversized(tstream)
-        self.validate()
+        validation.validate_decoded(self)
 
     def write(self, ostream):
-        tstream = BytearrayStream()
+        start = self.reserve_header(ostream)
 
         # Write the object type and template attribute of the request payload
-        self.object_type.write(tstream)
-        self.template_attribute.write(tstream)
+        self.object_type.write(ostream)
+        self.template_attribute.write(ostream)
 
         # Write the length and value of the request payload
-        self.length = tstream.length()
-        super(CreateRequestPayload, self).write(ostream)
-        ostream.write(tstream.buffer)
+        self.patch_header(ostream, start)
 
     def validate(self):
         # TODO (peter-hamilton) Finish implementation.
@@ -76,11 +75,11 @@ class CreateResponsePayload(Struct):
         self.object_type = object_type
         self.unique_identifier = unique_identifier
         self.template_attribute = template_attribute
-        self.validate()
+        validation.validate_created(self)
 
     def read(self, istream):
         super(CreateResponsePayload, self).read(istream)
-        tstream = BytearrayStream(istream.read(self.length))
+        tstream = BytearrayStream(istream.read_view(self.length))
 
         self.object_type = attributes.ObjectType()
         self.unique_identifier = attributes.UniqueIdentifier()
@@ -93,22 +92,20 @@ class CreateResponsePayload(Struct):
             self.template_attribute.read(tstream)
 
         self.is_oversized(tstream)
-        self.validate()
+        validation.validate_decoded(self)
 
     def write(self, ostream):
-        tstream = BytearrayStream()
+        start = self.reserve_header(ostream)
 
         # Write the contents of the request payload
-        self.object_type.write(tstream)
-        self.unique_identifier.write(tstream)
+        self.object_type.write(ostream)
+        self.unique_identifier.write(ostream)
 
         if self.template_attribute is not None:
-            self.template_attribute.write(tstream)
+            self.template_attribute.write(ostream)
 
         # Write the length and value of the request payload
-        self.length = tstream.length()
-        super(CreateResponsePayload, self).write(ostream)
-        ostream.write(tstream.buffer)
+        self.patch_header(ostream, start)
 
     def validate(self):
         # TODO (peter-hamilton) Finish implementation.
@@ -15,6 +15,7 @@
 
 from kmip.core import attributes
 from kmip.core import objects
+from kmip.core import validation
 
 from kmip.core.enums import Tags
 
@@ -35,11 +36,11 @@ class CreateKeyPairRequestPayload(Struct):
         self.private_key_template_attribute = private_key_template_attribute
         self.public_key_template_attribute = public_key_template_attribute
 
-        self.validate()
+        validation.validate_created(self)
 
     def read(self, istream):
         super(CreateKeyPairRequestPayload, self).read(istream)
-        tstream = BytearrayStream(istream.read(self.length))
+        tstream = BytearrayStream(istream.read_view(self.length))
 
         if self.is_tag_next(Tags.COMMON_TEMPLATE_ATTRIBUTE, tstream):
             self.common_template_attribute = objects.CommonTemplateAttribute()
@@ -56,23 +57,21 @@ class CreateKeyPairRequestPayload(Struct):
             self.public_key_template_attribute.read(tstream)
 
         self.is_oversized(tstream)
-        self.validate()
+        validation.validate_decoded(self)
 
     def write(self, ostream):
-        tstream = BytearrayStream()
+        start = self.reserve_header(ostream)
 
         if self.common_template_attribute is not None:
-            self.common_template_attribute.write(tstream)
+            self.common_template_attribute.write(ostream)
 
         if self.private_key_template_attribute is not None:
-            self.private_key_template_attribute.write(tstream)
+            self.private_key_template_attribute.write(ostream)
 
         if self.public_key_template_attribute is not None:
-            self.public_key_template_attribute.write(tstream)
+            self.public_key_template_attribute.write(ostream)
 
-        self.length = tstream.length()
-        super(CreateKeyPairRequestPayload, self).write(ostream)
-        ostream.write(tstream.buffer)
+        self.patch_header(ostream, start)
 
     def validate(self):
         self.__validate()
@@ -130,11 +129,11 @@ class CreateKeyPairResponsePayload(Struct):
         self.private_key_template_attribute = private_key_template_attribute
         self.public_key_template_attribute = public_key_template_attribute
 
-        self.validate()
+        validation.validate_created(self)
 
     def read(self, istream):
         super(CreateKeyPairResponsePayload, self).read(istream)
-        tstream = BytearrayStream(istream.read(self.length))
+        tstream = BytearrayStream(istream.read_view(self.length))
 
         self.private_key_uuid.read(tstream)
         self.public_key_uuid.read(tstream)
@@ -150,23 +149,21 @@ class CreateKeyPairResponsePayload(Struct):
             self.public_key_template_attribute.read(tstream)
 
         self.is_oversized(tstream)
-        self.validate()
+        validation.validate_decoded(self)
 
     def write(self, ostream):
-        tstream = BytearrayStream()
+        start = self.reserve_header(ostream)
 
-        self.private_key_uuid.write(tstream)
-        self.public_key_uuid.write(tstream)
+        self.private_key_uuid.write(ostream)
+        self.public_key_uuid.write(ostream)
 
         if self.private_key_template_attribute is not None:
-            self.private_key_template_attribute.write(tstream)
+            self.private_key_template_attribute.write(ostream)
 
         if self.public_key_template_attribute is not None:
-            self.public_key_template_attribute.write(tstream)
+            self.public_key_template_attribute.write(ostream)
 
-        self.length = tstream.length()
-        super(CreateKeyPairResponsePayload, self).write(ostream)
-        ostream.write(tstream.buffer)
+        self.patch_header(ostream, start)
 
     def validate(self):
         self.__validate()
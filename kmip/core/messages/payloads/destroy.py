@@ -15,43 +15,29 @@
 
 from kmip.core import attributes
 from kmip.core import enums
+from kmip.core import validation
 from kmip.core.enums import Tags
 
 from kmip.core.primitives import Struct
 
-from kmip.core.utils import BytearrayStream
+from kmip.core.schema import codec
+from kmip.core.schema import Field
 
 
 # 4.21
+@codec
 class DestroyRequestPayload(Struct):
 
+    FIELDS = (
+        Field('unique_identifier', Tags.UNIQUE_IDENTIFIER,
+              attributes.UniqueIdentifier, optional=True),
+    )
+
     def __init__(self,
                  unique_identifier=None):
         super(DestroyRequestPayload, self).__init__(enums.Tags.REQUEST_PAYLOAD)
         self.unique_identifier = unique_identifier
-        self.validate()
-
-    def read(self, istream):
-        super(DestroyRequestPayload, self).read(istream)
-        tstream = BytearrayStream(istream.read(self.length))
-
-        if self.is_tag_next(Tags.UNIQUE_IDENTIFIER, tstream):
-            self.unique_identifier = attributes.UniqueIdentifier()
-            self.unique_identifier.read(tstream)
-
-        self.is_oversized(tstream)
-        self.validate()
-
-    def write(self, ostream):
-        tstream = BytearrayStream()
-
-        if self.unique_identifier is not None:
-            self.unique_identifier.write(tstream)
-
-        # Write the length and value of the request payload
-        self.length = tstream.length()
-        super(DestroyRequestPayload, self).write(ostream)
-        ostream.write(tstream.buffer)
+        validation.validate_created(self)
 
     def validate(self):
         self.__validate()
@@ -61,34 +47,20 @@ class DestroyRequestPayload(Struct):
         pass
 
 
+@codec
 class DestroyResponsePayload(Struct):
 
+    FIELDS = (
+        Field('unique_identifier', Tags.UNIQUE_IDENTIFIER,
+              attributes.UniqueIdentifier),
+    )
+
     def __init__(self,
                  unique_identifier=None):
         super(DestroyResponsePayload, self).__init__(
             enums.Tags.RESPONSE_PAYLOAD)
         self.unique_identifier = unique_identifier
-        self.validate()
-
-    def read(self, istream):
-        super(DestroyResponsePayload, self).read(istream)
-        tstream = BytearrayStream(istream.read(self.length))
-
-        self.unique_identifier = attributes.UniqueIdentifier()
-        self.unique_identifier.read(tstream)
-
-        self.is_oversized(tstream)
-        self.validate()
-
-    def write(self, ostream):
-        tstream = BytearrayStream()
-
-        self.unique_identifier.write(tstream)
-
-        # Write the length and value of the request payload
-        self.length = tstream.length()
-        super(DestroyResponsePayload, self).write(ostream)
-        ostream.write(tstream.buffer)
+        validation.validate_created(self)
 
     def validate(self):
         self.__validate()
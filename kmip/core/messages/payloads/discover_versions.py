@@ -23,6 +23,8 @@ from kmip.core.primitives import Struct
 
 from kmip.core.utils import BytearrayStream
 
+from kmip.core import validation
+
 
 class DiscoverVersionsRequestPayload(Struct):
 
@@ -35,11 +37,11 @@ class DiscoverVersionsRequestPayload(Struct):
         else:
             self.protocol_versions = protocol_versions
 
-        self.validate()
+        validation.validate_created(self)
 
     def read(self, istream):
         super(DiscoverVersionsRequestPayload, self).read(istream)
-        tstream = BytearrayStream(istream.read(self.length))
+        tstream = BytearrayStream(istream.read_view(self.length))
 
         while(self.is_tag_next(Tags.PROTOCOL_VERSION, tstream)):
             protocol_version = ProtocolVersion()
@@ -47,17 +49,15 @@ class DiscoverVersionsRequestPayload(Struct):
             self.protocol_versions.append(protocol_version)
 
         self.is_oversized(tstream)
-        self.validate()
+        validation.validate_decoded(self)
 
     def write(self, ostream):
-        tstream = BytearrayStream()
+        start = self.reserve_header(ostream)
 
         for protocol_version in self.protocol_versions:
-            protocol_version.write(tstream)
+            protocol_version.write(ostream)
 
-        self.length = tstream.length()
-        super(DiscoverVersionsRequestPayload, self).write(ostream)
-        ostream.write(tstream.buffer)
+        self.patch_header(ostream, start)
 
     def validate(self):
         self.__validate()
@@ -89,11 +89,11 @@ class DiscoverVersionsResponsePayload(Struct):
         else:
             self.protocol_versions = protocol_versions
 
-        self.validate()
+        validation.validate_created(self)
 
     def read(self, istream):
         super(DiscoverVersionsResponsePayload, self).read(istream)
-        tstream = BytearrayStream(istream.read(self.length))
+        tstream = BytearrayStream(istream.read_view(self.length))
 
         while(self.is_tag_next(Tags.PROTOCOL_VERSION, tstream)):
             protocol_version = ProtocolVersion()
@@ -101,17 +101,15 @@ class DiscoverVersionsResponsePayload(Struct):
             self.protocol_versions.append(protocol_version)
 
         self.is_oversized(tstream)
-        self.validate()
+        validation.validate_decoded(self)
 
     def write(self, ostream):
-        tstream = BytearrayStream()
+        start = self.reserve_header(ostream)
 
         for protocol_version in self.protocol_versions:
-            protocol_version.write(tstream)
+            protocol_version.write(ostream)
 
-        self.length = tstream.length()
-        super(DiscoverVersionsResponsePayload, self).write(ostream)
-        ostream.write(tstream.buffer)
+        self.patch_header(ostream, start)
 
     def validate(self):
         self.__validate()
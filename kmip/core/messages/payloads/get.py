@@ -17,6 +17,7 @@ from kmip.core.factories.secrets import SecretFactory
 
 from kmip.core import attributes
 from kmip.core import enums
+from kmip.core import validation
 from kmip.core.enums import Tags
 
 from kmip.core.objects import KeyWrappingSpecification
@@ -24,10 +25,12 @@ from kmip.core.objects import KeyWrappingSpecification
 from kmip.core.primitives import Struct
 from kmip.core.primitives import Enumeration
 
-from kmip.core.utils import BytearrayStream
+from kmip.core.schema import codec
+from kmip.core.schema import Field
 
 
 # 4.11
+@codec
 class GetRequestPayload(Struct):
 
     # 9.1.3.2.2
@@ -46,6 +49,16 @@ class GetRequestPayload(Struct):
             super(GetRequestPayload.KeyFormatType, self).__init__(
                 value, Tags.KEY_FORMAT_TYPE)
 
+    FIELDS = (
+        Field('unique_identifier', Tags.UNIQUE_IDENTIFIER,
+              attributes.UniqueIdentifier, optional=True),
+        Field('key_format_type', Tags.KEY_FORMAT_TYPE, KeyFormatType,
+              optional=True),
+        Field('key_compression_type', Tags.KEY_COMPRESSION_TYPE,
+              KeyCompressionType, optional=True),
+        Field('key_wrapping_specification', Tags.KEY_WRAPPING_SPECIFICATION,
+              KeyWrappingSpecification, optional=True))
+
     def __init__(self,
                  unique_identifier=None,
                  key_format_type=None,
@@ -56,48 +69,7 @@ class GetRequestPayload(Struct):
         self.key_format_type = key_format_type
         self.key_compression_type = key_compression_type
         self.key_wrapping_specification = key_wrapping_specification
-        self.validate()
-
-    def read(self, istream):
-        super(GetRequestPayload, self).read(istream)
-        tstream = BytearrayStream(istream.read(self.length))
-
-        if self.is_tag_next(Tags.UNIQUE_IDENTIFIER, tstream):
-            self.unique_identifier = attributes.UniqueIdentifier()
-            self.unique_identifier.read(tstream)
-
-        if self.is_tag_next(Tags.KEY_FORMAT_TYPE, tstream):
-            self.key_format_type = GetRequestPayload.KeyFormatType()
-            self.key_format_type.read(tstream)
-
-        if self.is_tag_next(Tags.KEY_COMPRESSION_TYPE, tstream):
-            self.key_compression_type = GetRequestPayload.KeyCompressionType()
-            self.key_compression_type.read(tstream)
-
-        if self.is_tag_next(Tags.KEY_WRAPPING_SPECIFICATION, tstream):
-            self.key_wrapping_specification = KeyWrappingSpecification()
-            self.key_wrapping_specification.read(tstream)
-
-        self.is_oversized(tstream)
-        self.validate()
-
-    def write(self, ostream):
-        tstream = BytearrayStream()
-
-        # Write the contents of the request payload
-        if self.unique_identifier is not None:
-            self.unique_identifier.write(tstream)
-        if self.key_format_type is not None:
-            self.key_format_type.write(tstream)
-        if self.key_compression_type is not None:
-            self.key_compression_type.write(tstream)
-        if self.key_wrapping_specification is not None:
-            self.key_wrapping_specification.write(tstream)
-
-        # Write the length and value of the request payload
-        self.length = tstream.length()
-        super(GetRequestPayload, self).write(ostream)
-        ostream.write(tstream.buffer)
+        validation.validate_created(self)
 
     def validate(self):
         self.__validate()
@@ -107,8 +79,16 @@ class GetRequestPayload(Struct):
         pass
 
 
+@codec
 class GetResponsePayload(Struct):
 
+    FIELDS = (
+        Field('object_type', Tags.OBJECT_TYPE, attributes.ObjectType),
+        Field('unique_identifier', Tags.UNIQUE_IDENTIFIER,
+              attributes.UniqueIdentifier),
+        Field('secret', None, factory=lambda payload:
+              payload.secret_factory.create(payload.object_type.enum)))
+
     def __init__(self,
                  object_type=None,
                  unique_identifier=None,
@@ -118,36 +98,7 @@ class GetResponsePayload(Struct):
         self.unique_identifier = unique_identifier
         self.secret = secret
         self.secret_factory = SecretFactory()
-        self.validate()
-
-    def read(self, istream):
-        super(GetResponsePayload, self).read(istream)
-        tstream = BytearrayStream(istream.read(self.length))
-
-        self.object_type = attributes.ObjectType()
-        self.unique_identifier = attributes.UniqueIdentifier()
-
-        self.object_type.read(tstream)
-        self.unique_identifier.read(tstream)
-
-        secret_type = self.object_type.enum
-        self.secret = self.secret_factory.create(secret_type)
-        self.secret.read(tstream)
-
-        self.is_oversized(tstream)
-        self.validate()
-
-    def write(self, ostream):
-        tstream = BytearrayStream()
-
-        self.object_type.write(tstream)
-        self.unique_identifier.write(tstream)
-        self.secret.write(tstream)
-
-        # Write the length and value of the request payload
-        self.length = tstream.length()
-        super(GetResponsePayload, self).write(ostream)
-        ostream.write(tstream.buffer)
+        validation.validate_created(self)
 
     def validate(self):
         self.__validate()
@@ -19,6 +19,7 @@ from kmip.core import enums
 from kmip.core import exceptions
 from kmip.core import primitives
 from kmip.core import utils
+from kmip.core import validation
 
 
 class GetAttributeListRequestPayload(primitives.Struct):
@@ -46,7 +47,7 @@ class GetAttributeListRequestPayload(primitives.Struct):
 
         self.uid = uid
 
-        self.validate()
+        validation.validate_created(self)
 
     def read(self, istream):
         """
@@ -58,7 +59,7 @@ class GetAttributeListRequestPayload(primitives.Struct):
                 supporting a read method; usually a BytearrayStream object.
         """
         super(GetAttributeListRequestPayload, self).read(istream)
-        tstream = utils.BytearrayStream(istream.read(self.length))
+        tstream = utils.BytearrayStream(istream.read_view(self.length))
 
         if self.is_tag_next(enums.Tags.UNIQUE_IDENTIFIER, tstream):
             uid = primitives.TextString(tag=enums.Tags.UNIQUE_IDENTIFIER)
@@ -68,7 +69,7 @@ class GetAttributeListRequestPayload(primitives.Struct):
             self.uid = None
 
         self.is_oversized(tstream)
-        self.validate()
+        validation.validate_decoded(self)
 
     def write(self, ostream):
         """
@@ -79,16 +80,14 @@ class GetAttributeListRequestPayload(primitives.Struct):
             ostream (stream): A data stream in which to encode object data,
                 supporting a write method; usually a BytearrayStream object.
         """
-        tstream = utils.BytearrayStream()
+        start = self.reserve_header(ostream)
 
         if self.uid:
             uid = primitives.TextString(
                 value=self.uid, tag=enums.Tags.UNIQUE_IDENTIFIER)
-            uid.write(tstream)
+            uid.write(ostream)
 
-        self.length = tstream.length()
-        super(GetAttributeListRequestPayload, self).write(ostream)
-        ostream.write(tstream.buffer)
+        self.patch_header(ostream, start)
 
     def validate(self):
         """
@@ -161,7 +160,7 @@ class GetAttributeListResponsePayload(primitives.Struct):
         else:
             self.attribute_names = list()
 
-        self.validate()
+        validation.validate_created(self)
 
     def read(self, istream):
         """
@@ -173,7 +172,7 @@ class GetAttributeListResponsePayload(primitives.Struct):
                 supporting a read method; usually a BytearrayStream object.
         """
         super(GetAttributeListResponsePayload, self).read(istream)
-        tstream = utils.BytearrayStream(istream.read(self.length))
+        tstream = utils.BytearrayStream(istream.read_view(self.length))
 
         if self.is_tag_next(enums.Tags.UNIQUE_IDENTIFIER, tstream):
             uid = primitives.TextString(tag=enums.Tags.UNIQUE_IDENTIFIER)
@@ -191,7 +190,7 @@ class GetAttributeListResponsePayload(primitives.Struct):
         self.attribute_names = names
 
         self.is_oversized(tstream)
-        self.validate()
+        validation.validate_decoded(self)
 
     def write(self, ostream):
         """
@@ -202,20 +201,18 @@ class GetAttributeListResponsePayload(primitives.Struct):
             ostream (stream): A data stream in which to encode object data,
                 supporting a write method; usually a BytearrayStream object.
         """
-        tstream = utils.BytearrayStream()
+        start = self.reserve_header(ostream)
 
         uid = primitives.TextString(
             value=self.uid, tag=enums.Tags.UNIQUE_IDENTIFIER)
-        uid.write(tstream)
+        uid.write(ostream)
 
         for name in self.attribute_names:
             name = primitives.TextString(
                 value=name, tag=enums.Tags.ATTRIBUTE_NAME)
-            name.write(tstream)
+            name.write(ostream)
 
-        self.length = tstream.length()
-        super(GetAttributeListResponsePayload, self).write(ostream)
-        ostream.write(tstream.buffer)
+        self.patch_header(ostream, start)
 
     def validate(self):
         """
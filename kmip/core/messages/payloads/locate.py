@@ -15,6 +15,7 @@
 
 from kmip.core import attributes
 from kmip.core import enums
+from kmip.core import validation
 from kmip.core.enums import Tags
 
 from kmip.core.objects import Attribute
@@ -23,9 +24,11 @@ from kmip.core.primitives import Struct
 from kmip.core.primitives import Enumeration
 from kmip.core.primitives import Integer
 
-from kmip.core.utils import BytearrayStream
+from kmip.core.schema import codec
+from kmip.core.schema import Field
 
 
+@codec
 class LocateRequestPayload(Struct):
 
     # 9.1.3.2.33
@@ -49,6 +52,15 @@ class LocateRequestPayload(Struct):
             super(LocateRequestPayload.StorageStatusMask, self).__init__(
                 value, Tags.STORAGE_STATUS_MASK)
 
+    FIELDS = (
+        Field('maximum_items', Tags.MAXIMUM_ITEMS, MaximumItems,
+              optional=True),
+        Field('storage_status_mask', Tags.STORAGE_STATUS_MASK,
+              StorageStatusMask, optional=True),
+        Field('object_group_member', Tags.OBJECT_GROUP_MEMBER,
+              ObjectGroupMember, optional=True),
+        Field('attributes', Tags.ATTRIBUTE, Attribute, repeated=True))
+
     def __init__(self, maximum_items=None, storage_status_mask=None,
                  object_group_member=None, attributes=None):
         super(LocateRequestPayload, self).__init__(enums.Tags.REQUEST_PAYLOAD)
@@ -56,41 +68,7 @@ class LocateRequestPayload(Struct):
         self.storage_status_mask = storage_status_mask
         self.object_group_member = object_group_member
         self.attributes = attributes or []
-        self.validate()
-
-    def read(self, istream):
-        super(LocateRequestPayload, self).read(istream)
-        tstream = BytearrayStream(istream.read(self.length))
-        if self.is_tag_next(Tags.MAXIMUM_ITEMS, tstream):
-            self.maximum_items = LocateRequestPayload.MaximumItems()
-            self.maximum_items.read()
-        if self.is_tag_next(Tags.STORAGE_STATUS_MASK, tstream):
-            self.storage_status_mask = LocateRequestPayload.StorageStatusMask()
-            self.storage_status_mask.read()
-        if self.is_tag_next(Tags.OBJECT_GROUP_MEMBER, tstream):
-            self.object_group_member = LocateRequestPayload.ObjectGroupMember()
-            self.object_group_member.read(tstream)
-        while self.is_tag_next(Tags.ATTRIBUTE, tstream):
-            attr = Attribute()
-            attr.read(tstream)
-            self.attributes.append(attr)
-
-        self.validate()
-
-    def write(self, ostream):
-        tstream = BytearrayStream()
-        if self.maximum_items is not None:
-            self.maximum_items.write(tstream)
-        if self.storage_status_mask is not None:
-            self.storage_status_mask.write(tstream)
-        if self.attributes is not None:
-            for a in self.attributes:
-                a.write(tstream)
-
-        # Write the length and value of the request payload
-        self.length = tstream.length()
-        super(LocateRequestPayload, self).write(ostream)
-        ostream.write(tstream.buffer)
+        validation.validate_created(self)
 
     def validate(self):
         self._validate()
@@ -100,36 +78,19 @@ class LocateRequestPayload(Struct):
         pass
 
 
+@codec
 class LocateResponsePayload(Struct):
 
+    FIELDS = (
+        Field('unique_identifiers', Tags.UNIQUE_IDENTIFIER,
+              attributes.UniqueIdentifier, repeated=True),
+    )
+
     def __init__(self, unique_identifiers=[]):
         super(LocateResponsePayload, self).__init__(
             enums.Tags.RESPONSE_PAYLOAD)
         self.unique_identifiers = unique_identifiers or []
-        self.validate()
-
-    def read(self, istream):
-        super(LocateResponsePayload, self).read(istream)
-        tstream = BytearrayStream(istream.read(self.length))
-
-        while self.is_tag_next(Tags.UNIQUE_IDENTIFIER, tstream):
-            ui = attributes.UniqueIdentifier()
-            ui.read(tstream)
-            self.unique_identifiers.append(ui)
-
-        self.is_oversized(tstream)
-        self.validate()
-
-    def write(self, ostream):
-        tstream = BytearrayStream()
-
-        for ui in self.unique_identifiers:
-            ui.write(tstream)
-
-        # Write the length and value of the request payload
-        self.length = tstream.length()
-        super(LocateResponsePayload, self).write(ostream)
-        ostream.write(tstream.buffer)
+        validation.validate_created(self)
 
     def validate(self):
         self.__validate()
@@ -29,6 +29,8 @@ from kmip.core.objects import ExtensionInformation
 from kmip.core.primitives import Struct
 from kmip.core.utils import BytearrayStream
 
+from kmip.core import validation
+
 
 class QueryRequestPayload(Struct):
     """
@@ -55,7 +57,7 @@ class QueryRequestPayload(Struct):
         else:
             self.query_functions = query_functions
 
-        self.validate()
+        validation.validate_created(self)
 
     def read(self, istream):
         """
@@ -67,7 +69,7 @@ class QueryRequestPayload(Struct):
                 supporting a read method; usually a BytearrayStream object.
         """
         super(QueryRequestPayload, self).read(istream)
-        tstream = BytearrayStream(istream.read(self.length))
+        tstream = BytearrayStream(istream.read_view(self.length))
 
         while(self.is_tag_next(Tags.QUERY_FUNCTION, tstream)):
             query_function = QueryFunction()
@@ -75,7 +77,7 @@ class QueryRequestPayload(Struct):
             self.query_functions.append(query_function)
 
         self.is_oversized(tstream)
-        self.validate()
+        validation.validate_decoded(self)
 
     def write(self, ostream):
         """
@@ -85,14 +87,12 @@ class QueryRequestPayload(Struct):
             ostream (Stream): A data stream in which to encode object data,
                 supporting a write method; usually a BytearrayStream object.
         """
-        tstream = BytearrayStream()
+        start = self.reserve_header(ostream)
 
         for query_function in self.query_functions:
-            query_function.write(tstream)
+            query_function.write(ostream)
 
-        self.length = tstream.length()
-        super(QueryRequestPayload, self).write(ostream)
-        ostream.write(tstream.buffer)
+        self.patch_header(ostream, start)
 
     def validate(self):
         """
@@ -180,7 +180,7 @@ class QueryResponsePayload(Struct):
         else:
             self.extension_information = extension_information
 
-        self.validate()
+        validation.validate_created(self)
 
     def read(self, istream):
         """
@@ -192,7 +192,7 @@ class QueryResponsePayload(Struct):
                 supporting a read method; usually a BytearrayStream object.
         """
         super(QueryResponsePayload, self).read(istream)
-        tstream = BytearrayStream(istream.read(self.length))
+        tstream = BytearrayStream(istream.read_view(self.length))
 
         while(self.is_tag_next(Tags.OPERATION, tstream)):
             operation = Operation()
@@ -223,7 +223,7 @@ class QueryResponsePayload(Struct):
             self.extension_information.append(extension_information)
 
         self.is_oversized(tstream)
-        self.validate()
+        validation.validate_decoded(self)
 
     def write(self, ostream):
         """
@@ -233,29 +233,27 @@ class QueryResponsePayload(Struct):
             ostream (Stream): A data stream in which to encode object data,
                 supporting a write method; usually a BytearrayStream object.
         """
-        tstream = BytearrayStream()
+        start = self.reserve_header(ostream)
 
         for operation in self.operations:
-            operation.write(tstream)
+            operation.write(ostream)
 
         for object_type in self.object_types:
-            object_type.write(tstream)
+            object_type.write(ostream)
 
         if self.vendor_identification is not None:
-            self.vendor_identification.write(tstream)
+            self.vendor_identification.write(ostream)
 
         if self.server_information is not None:
-            self.server_information.write(tstream)
+            self.server_information.write(ostream)
 
         for application_namespace in self.application_namespaces:
-            application_namespace.write(tstream)
+            application_namespace.write(ostream)
 
         for extension_information in self.extension_information:
-            extension_information.write(tstream)
+            extension_information.write(ostream)
 
-        self.length = tstream.length()
-        super(QueryResponsePayload, self).write(ostream)
-        ostream.write(tstream.buffer)
+        self.patch_header(ostream, start)
 
     def validate(self):
         """
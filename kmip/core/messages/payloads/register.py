@@ -16,6 +16,7 @@
 from kmip.core.factories.secrets import SecretFactory
 
 from kmip.core import attributes
+from kmip.core import validation
 from kmip.core.enums import Tags
 
 from kmip.core.objects import TemplateAttribute
@@ -39,11 +40,11 @@ class RegisterRequestPayload(Struct):
         self.template_attribute = template_attribute
         self.secret = secret
 
-        self.validate()
+        validation.validate_created(self)
 
     def read(self, istream):
         super(RegisterRequestPayload, self).read(istream)
-        tstream = BytearrayStream(istream.read(self.length))
+        tstream = BytearrayStream(istream.read_view(self.length))
 
         self.object_type = attributes.ObjectType()
         self.template_attribute = TemplateAttribute()
@@ -59,22 +60,20 @@ class RegisterRequestPayload(Struct):
             self.secret.read(tstream)
 
         self.is_oversized(tstream)
-        self.validate()
+        validation.validate_decoded(self)
 
     def write(self, ostream):
-        tstream = BytearrayStream()
+        start = self.reserve_header(ostream)
 
         # Write the contents of the request payload
-        self.object_type.write(tstream)
-        self.template_attribute.write(tstream)
+        self.object_type.write(ostream)
+        self.template_attribute.write(ostream)
 
         if self.secret is not None:
-            self.secret.write(tstream)
+            self.secret.write(ostream)
 
         # Write the length and value of the request payload
-        self.length = tstream.length()
-        super(RegisterRequestPayload, self).write(ostream)
-        ostream.write(tstream.buffer)
+        self.patch_header(ostream, start)
 
     def validate(self):
         self.__validate()
@@ -94,11 +93,11 @@ class RegisterResponsePayload(Struct):
         self.unique_identifier = unique_identifier
         self.template_attribute = template_attribute
 
-        self.validate()
+        validation.validate_created(self)
 
     def read(self, istream):
         super(RegisterResponsePayload, self).read(istream)
-        tstream = BytearrayStream(istream.read(self.length))
+        tstream = BytearrayStream(istream.read_view(self.length))
 
         self.unique_identifier = attributes.UniqueIdentifier()
         self.unique_identifier.read(tstream)
@@ -108,21 +107,19 @@ class RegisterResponsePayload(Struct):
             self.template_attribute.read(tstream)
 
         self.is_oversized(tstream)
-        self.validate()
+        validation.validate_decoded(self)
 
     def write(self, ostream):
-        tstream = BytearrayStream()
+        start = self.reserve_header(ostream)
 
         # Write the contents of the request payload
-        self.unique_identifier.write(tstream)
+        self.unique_identifier.write(ostream)
 
         if self.template_attribute is not None:
-            self.template_attribute.write(tstream)
+            self.template_attribute.write(ostream)
 
         # Write the length and value of the request payload
-        self.length = tstream.length()
-        super(RegisterResponsePayload, self).write(ostream)
-        ostream.write(tstream.buffer)
+        self.patch_header(ostream, start)
 
     def validate(self):
         self.__validate()
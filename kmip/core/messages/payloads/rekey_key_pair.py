@@ -16,6 +16,7 @@
 from kmip.core import attributes
 from kmip.core import misc
 from kmip.core import objects
+from kmip.core import validation
 
 from kmip.core.enums import Tags
 from kmip.core.messages.payloads.create_key_pair import \
@@ -40,11 +41,11 @@ class RekeyKeyPairRequestPayload(Struct):
         self.private_key_template_attribute = private_key_template_attribute
         self.public_key_template_attribute = public_key_template_attribute
 
-        self.validate()
+        validation.validate_created(self)
 
     def read(self, istream):
         super(RekeyKeyPairRequestPayload, self).read(istream)
-        tstream = BytearrayStream(istream.read(self.length))
+        tstream = BytearrayStream(istream.read_view(self.length))
 
         if self.is_tag_next(Tags.PRIVATE_KEY_UNIQUE_IDENTIFIER, tstream):
             self.private_key_uuid = attributes.PrivateKeyUniqueIdentifier()
@@ -69,29 +70,27 @@ class RekeyKeyPairRequestPayload(Struct):
             self.public_key_template_attribute.read(tstream)
 
         self.is_oversized(tstream)
-        self.validate()
+        validation.validate_decoded(self)
 
     def write(self, ostream):
-        tstream = BytearrayStream()
+        start = self.reserve_header(ostream)
 
         if self.private_key_uuid is not None:
-            self.private_key_uuid.write(tstream)
+            self.private_key_uuid.write(ostream)
 
         if self.offset is not None:
-            self.offset.write(tstream)
+            self.offset.write(ostream)
 
         if self.common_template_attribute is not None:
-            self.common_template_attribute.write(tstream)
+            self.common_template_attribute.write(ostream)
 
         if self.private_key_template_attribute is not None:
-            self.private_key_template_attribute.write(tstream)
+            self.private_key_template_attribute.write(ostream)
 
         if self.public_key_template_attribute is not None:
-            self.public_key_template_attribute.write(tstream)
+            self.public_key_template_attribute.write(ostream)
 
-        self.length = tstream.length()
-        super(RekeyKeyPairRequestPayload, self).write(ostream)
-        ostream.write(tstream.buffer)
+        self.patch_header(ostream, start)
 
     def validate(self):
         self.__validate()
@@ -17,6 +17,7 @@ from kmip.core import attributes
 from kmip.core import enums
 from kmip.core import objects
 from kmip.core import primitives
+from kmip.core import validation
 
 from kmip.core.primitives import Struct
 
@@ -58,7 +59,7 @@ class RevokeRequestPayload(Struct):
         self.revocation_reason = revocation_reason
         if self.revocation_reason is None:
             self.revocation_reason = objects.RevocationReason()
-        self.validate()
+        validation.validate_created(self)
 
     def read(self, istream):
         """
@@ -69,7 +70,7 @@ class RevokeRequestPayload(Struct):
                 supporting a read method; usually a BytearrayStream object.
         """
         super(RevokeRequestPayload, self).read(istream)
-        tstream = BytearrayStream(istream.read(self.length))
+        tstream = BytearrayStream(istream.read_view(self.length))
 
         self.unique_identifier = attributes.UniqueIdentifier()
         self.unique_identifier.read(tstream)
@@ -83,7 +84,7 @@ class RevokeRequestPayload(Struct):
             self.compromise_date.read(tstream)
 
         self.is_oversized(tstream)
-        self.validate()
+        validation.validate_decoded(self)
 
     def write(self, ostream):
         """
@@ -92,21 +93,19 @@ class RevokeRequestPayload(Struct):
             ostream (Stream): A data stream in which to encode object data,
                 supporting a write method; usually a BytearrayStream object.
         """
-        tstream = BytearrayStream()
+        start = self.reserve_header(ostream)
 
         # Write the contents of the request payload
         if self.unique_identifier is not None:
-            self.unique_identifier.write(tstream)
+            self.unique_identifier.write(ostream)
 
-        self.revocation_reason.write(tstream)
+        self.revocation_reason.write(ostream)
 
         if self.compromise_date is not None:
-            self.compromise_date.write(tstream)
+            self.compromise_date.write(ostream)
 
         # Write the length and value of the request payload
-        self.length = tstream.length()
-        super(RevokeRequestPayload, self).write(ostream)
-        ostream.write(tstream.buffer)
+        self.patch_header(ostream, start)
 
     def validate(self):
         """
@@ -148,7 +147,7 @@ class RevokeResponsePayload(Struct):
             self.unique_identifier = attributes.UniqueIdentifier()
         else:
             self.unique_identifier = unique_identifier
-        self.validate()
+        validation.validate_created(self)
 
     def read(self, istream):
         """
@@ -159,13 +158,13 @@ class RevokeResponsePayload(Struct):
                 supporting a read method; usually a BytearrayStream object.
         """
         super(RevokeResponsePayload, self).read(istream)
-        tstream = BytearrayStream(istream.read(self.length))
+        tstream = BytearrayStream(istream.read_view(self.length))
 
         self.unique_identifier = attributes.UniqueIdentifier()
         self.unique_identifier.read(tstream)
 
         self.is_oversized(tstream)
-        self.validate()
+        validation.validate_decoded(self)
 
     def write(self, ostream):
         """
@@ -174,15 +173,13 @@ class RevokeResponsePayload(Struct):
             ostream (Stream): A data stream in which to encode object data,
                 supporting a write method; usually a BytearrayStream object.
         """
-        tstream = BytearrayStream()
+        start = self.reserve_header(ostream)
 
         # Write the contents of the response payload
-        self.unique_identifier.write(tstream)
+        self.unique_identifier.write(ostream)
 
         # Write the length and value of the request payload
-        self.length = tstream.length()
-        super(RevokeResponsePayload, self).write(ostream)
-        ostream.write(tstream.buffer)
+        self.patch_header(ostream, start)
 
     def validate(self):
         """
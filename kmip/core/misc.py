@@ -25,6 +25,8 @@ from kmip.core.primitives import TextString
 
 from kmip.core.utils import BytearrayStream
 
+from kmip.core import validation
+
 
 class CertificateValue(ByteString):
     """
@@ -138,7 +140,7 @@ class ServerInformation(Struct):
 
         self.data = BytearrayStream()
 
-        self.validate()
+        validation.validate_created(self)
 
     def read(self, istream):
         """
@@ -150,12 +152,12 @@ class ServerInformation(Struct):
                 supporting a read method; usually a BytearrayStream object.
         """
         super(ServerInformation, self).read(istream)
-        tstream = BytearrayStream(istream.read(self.length))
+        tstream = BytearrayStream(istream.read_view(self.length))
 
         self.data = BytearrayStream(tstream.read())
 
         self.is_oversized(tstream)
-        self.validate()
+        validation.validate_decoded(self)
 
     def write(self, ostream):
         """
@@ -165,12 +167,10 @@ class ServerInformation(Struct):
             ostream (Stream): A data stream in which to encode object data,
                 supporting a write method; usually a BytearrayStream object.
         """
-        tstream = BytearrayStream()
-        tstream.write(self.data.buffer)
+        start = self.reserve_header(ostream)
+        ostream.write(self.data.getbuffer())
 
-        self.length = tstream.length()
-        super(ServerInformation, self).write(ostream)
-        ostream.write(tstream.buffer)
+        self.patch_header(ostream, start)
 
     def validate(self):
         """
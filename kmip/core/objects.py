@@ -16,9 +16,10 @@
 from six.moves import xrange
 
 from kmip.core import attributes
+from kmip.core import validation
 from kmip.core.attributes import CryptographicParameters
 
-from kmip.core.factories.attribute_values import AttributeValueFactory
+from kmip.core.factories.attribute_values import attribute_value_factory
 
 from kmip.core import enums
 from kmip.core.enums import AttributeType
@@ -40,29 +41,69 @@ from kmip.core.utils import BytearrayStream
 
 
 # 2.1
+# The attribute types, keyed by their names as found in Attribute encodings
+_ATTRIBUTE_TYPES = dict(
+    (attribute_type.value, attribute_type) for attribute_type in AttributeType)
+
+# Other attribute names already resolved, such as those of custom attributes,
+# bounded so that peers cannot grow it without limit
+_OTHER_ATTRIBUTE_TYPES = dict()
+_MAX_OTHER_ATTRIBUTE_TYPES = 1024
+
+
+def _attribute_type(name):
+    """
+    Return the attribute type with the given attribute name.
+
+    Names that do not name an attribute type, such as those of custom
+    attributes, are returned unchanged.
+    """
+    attribute_type = _ATTRIBUTE_TYPES.get(name)
+    if attribute_type is not None:
+        return attribute_type
+
+    attribute_type = _OTHER_ATTRIBUTE_TYPES.get(name)
+    if attribute_type is not None:
+        return attribute_type
+
+    enum_name = name.replace('.', '_').replace(' ', '_').upper()
+    try:
+        attribute_type = AttributeType[enum_name]
+    except KeyError:
+        # Likely custom attribute, pass raw name string as attribute type
+        attribute_type = name
+
+    if len(_OTHER_ATTRIBUTE_TYPES) < _MAX_OTHER_ATTRIBUTE_TYPES:
+        _OTHER_ATTRIBUTE_TYPES[name] = attribute_type
+    return attribute_type
+
+
 # 2.1.1
 class Attribute(Struct):
+    __slots__ = ('attribute_name', 'attribute_index', 'attribute_value')
 
     class AttributeName(TextString):
+        __slots__ = ()
 
         def __init__(self, value=None):
             super(Attribute.AttributeName, self).__init__(
                 value, Tags.ATTRIBUTE_NAME)
 
     class AttributeIndex(Integer):
+        __slots__ = ()
 
         def __init__(self, value=None):
             super(Attribute.AttributeIndex, self).__init__(
                 value, Tags.ATTRIBUTE_INDEX)
 
+    value_factory = attribute_value_factory
+
     def __init__(self,
                  attribute_name=None,
                  attribute_index=None,
                  attribute_value=None):
         super(Attribute, self).__init__(tag=Tags.ATTRIBUTE)
 
-        self.value_factory = AttributeValueFactory()
-
         self.attribute_name = attribute_name
         self.attribute_index = attribute_index
         self.attribute_value = attribute_value
@@ -72,7 +113,7 @@ class Attribute(Struct):
 
     def read(self, istream):
         super(Attribute, self).read(istream)
-        tstream = BytearrayStream(istream.read(self.length))
+        tstream = BytearrayStream(istream.read_view(self.length))
 
         # Read the name of the attribute
         self.attribute_name = Attribute.AttributeName()
@@ -84,15 +125,7 @@ class Attribute(Struct):
             self.attribute_index.read(tstream)
 
         # Lookup the attribute class that belongs to the attribute name
-        name = self.attribute_name.value
-        enum_name = name.replace('.', '_').replace(' ', '_').upper()
-        enum_type = None
-
-        try:
-            enum_type = AttributeType[enum_name]
-        except KeyError:
-            # Likely custom attribute, pass raw name string as attribute type
-            enum_type = name
+        enum_type = _attribute_type(self.attribute_name.value)
 
         value = self.value_factory.create_attribute_value(enum_type, None)
         self.attribute_value = value
@@ -102,17 +135,15 @@ class Attribute(Struct):
         self.is_oversized(tstream)
 
     def write(self, ostream):
-        tstream = BytearrayStream()
+        start = self.reserve_header(ostream)
 
-        self.attribute_name.write(tstream)
+        self.attribute_name.write(ostream)
         if self.attribute_index is not None:
-            self.attribute_index.write(tstream)
-        self.attribute_value.write(tstream)
+            self.attribute_index.write(ostream)
+        self.attribute_value.write(ostream)
 
         # Write the length and value of the attribute
-        self.length = tstream.length()
-        super(Attribute, self).write(ostream)
-        ostream.write(tstream.buffer)
+        self.patch_header(ostream, start)
 
     def __eq__(self, other):
         if isinstance(other, Attribute):
@@ -161,11 +192,11 @@ class Credential(Struct):
                 tag=Tags.CREDENTIAL_VALUE)
             self.username = username
             self.password = password
-            self.validate()
+            validation.validate_created(self)
 
         def read(self, istream):
             super(Credential.UsernamePasswordCredential, self).read(istream)
-            tstream = BytearrayStream(istream.read(self.length))
+            tstream = BytearrayStream(istream.read_view(self.length))
 
             # Read the username of the credential
             self.username = self.Username()
@@ -177,19 +208,17 @@ class Credential(Struct):
                 self.password.read(tstream)
 
             self.is_oversized(tstream)
-            self.validate()
+            validation.validate_decoded(self)
 
         def write(self, ostream):
-            tstream = BytearrayStream()
+            start = self.reserve_header(ostream)
 
-            self.username.write(tstream)
+            self.username.write(ostream)
             if self.password is not None:
-                self.password.write(tstream)
+                self.password.write(ostream)
 
             # Write the length and value of the credential
-            self.length = tstream.length()
-            super(Credential.UsernamePasswordCredential, self).write(ostream)
-            ostream.write(tstream.buffer)
+            self.patch_header(ostream, start)
 
         def validate(self):
             pass
@@ -250,7 +279,7 @@ class Credential(Struct):
 
         def read(self, istream):
             super(Credential.DeviceCredential, self).read(istream)
-            tstream = BytearrayStream(istream.read(self.length))
+            tstream = BytearrayStream(istream.read_view(self.length))
 
             # Read the password if it is next
             if self.is_tag_next(Tags.DEVICE_SERIAL_NUMBER, tstream):
@@ -283,28 +312,26 @@ class Credential(Struct):
                 self.media_identifier.read(tstream)
 
             self.is_oversized(tstream)
-            self.validate()
+            validation.validate_decoded(self)
 
         def write(self, ostream):
-            tstream = BytearrayStream()
+            start = self.reserve_header(ostream)
 
             if self.device_serial_number is not None:
-                self.device_serial_number.write(tstream)
+                self.device_serial_number.write(ostream)
             if self.password is not None:
-                self.password.write(tstream)
+                self.password.write(ostream)
             if self.device_identifier is not None:
-                self.device_identifier.write(tstream)
+                self.device_identifier.write(ostream)
             if self.network_identifier is not None:
-                self.network_identifier.write(tstream)
+                self.network_identifier.write(ostream)
             if self.machine_identifier is not None:
-                self.machine_identifier.write(tstream)
+                self.machine_identifier.write(ostream)
             if self.media_identifier is not None:
-                self.media_identifier.write(tstream)
+                self.media_identifier.write(ostream)
 
             # Write the length and value of the credential
-            self.length = tstream.length()
-            super(Credential.DeviceCredential, self).write(ostream)
-            ostream.write(tstream.buffer)
+            self.patch_header(ostream, start)
 
         def validate(self):
             pass
@@ -316,7 +343,7 @@ class Credential(Struct):
 
     def read(self, istream):
         super(Credential, self).read(istream)
-        tstream = BytearrayStream(istream.read(self.length))
+        tstream = BytearrayStream(istream.read_view(self.length))
 
         # Read the type of the credential
         self.credential_type = self.CredentialType()
@@ -333,18 +360,16 @@ class Credential(Struct):
         self.credential_value.read(tstream)
 
         self.is_oversized(tstream)
-        self.validate()
+        validation.validate_decoded(self)
 
     def write(self, ostream):
-        tstream = BytearrayStream()
+        start = self.reserve_header(ostream)
 
-        self.credential_type.write(tstream)
-        self.credential_value.write(tstream)
+        self.credential_type.write(ostream)
+        self.credential_value.write(ostream)
 
         # Write the length and value of the credential
-        self.length = tstream.length()
-        super(Credential, self).write(ostream)
-        ostream.write(tstream.buffer)
+        self.patch_header(ostream, start)
 
     def validate(self):
         pass
@@ -374,11 +399,11 @@ class KeyBlock(Struct):
         self.cryptographic_algorithm = cryptographic_algorithm
         self.cryptographic_length = cryptographic_length
         self.key_wrapping_data = key_wrapping_data
-        self.validate()
+        validation.validate_created(self)
 
     def read(self, istream):
         super(KeyBlock, self).read(istream)
-        tstream = BytearrayStream(istream.read(self.length))
+        tstream = BytearrayStream(istream.read_view(self.length))
 
         self.key_format_type = KeyFormatType()
         self.key_format_type.read(tstream)
@@ -403,29 +428,27 @@ class KeyBlock(Struct):
             self.key_wrapping_data.read(tstream)
 
         self.is_oversized(tstream)
-        self.validate()
+        validation.validate_decoded(self)
 
     def write(self, ostream):
-        tstream = BytearrayStream()
+        start = self.reserve_header(ostream)
 
-        self.key_format_type.write(tstream)
+        self.key_format_type.write(ostream)
 
         if self.key_compression_type is not None:
-            self.key_compression_type.write(tstream)
+            self.key_compression_type.write(ostream)
 
-        self.key_value.write(tstream)
+        self.key_value.write(ostream)
 
         if self.cryptographic_algorithm is not None:
-            self.cryptographic_algorithm.write(tstream)
+            self.cryptographic_algorithm.write(ostream)
         if self.cryptographic_length is not None:
-            self.cryptographic_length.write(tstream)
+            self.cryptographic_length.write(ostream)
         if self.key_wrapping_data is not None:
-            self.key_wrapping_data.write(tstream)
+            self.key_wrapping_data.write(ostream)
 
         # Write the length and value of the credential
-        self.length = tstream.length()
-        super(KeyBlock, self).write(ostream)
-        ostream.write(tstream.buffer)
+        self.patch_header(ostream, start)
 
     def validate(self):
         self.__validate()
@@ -456,24 +479,22 @@ class KeyMaterialStruct(Struct):
 
         self.data = BytearrayStream()
 
-        self.validate()
+        validation.validate_created(self)
 
     def read(self, istream):
         super(KeyMaterialStruct, self).read(istream)
-        tstream = BytearrayStream(istream.read(self.length))
+        tstream = BytearrayStream(istream.read_view(self.length))
 
         self.data = BytearrayStream(tstream.read())
 
         self.is_oversized(tstream)
-        self.validate()
+        validation.validate_decoded(self)
 
     def write(self, ostream):
-        tstream = BytearrayStream()
-        tstream.write(self.data.buffer)
+        start = self.reserve_header(ostream)
+        ostream.write(self.data.getbuffer())
 
-        self.length = tstream.length()
-        super(KeyMaterialStruct, self).write(ostream)
-        ostream.write(tstream.buffer)
+        self.patch_header(ostream, start)
 
     def validate(self):
         self.__validate()
@@ -500,11 +521,11 @@ class KeyValue(Struct):
         else:
             self.attributes = attributes
 
-        self.validate()
+        validation.validate_created(self)
 
     def read(self, istream):
         super(KeyValue, self).read(istream)
-        tstream = BytearrayStream(istream.read(self.length))
+        tstream = BytearrayStream(istream.read_view(self.length))
 
         # TODO (peter-hamilton) Replace this with a KeyMaterial factory.
         if self.is_type_next(Types.STRUCTURE, tstream):
@@ -520,19 +541,17 @@ class KeyValue(Struct):
             self.attributes.append(attribute)
 
         self.is_oversized(tstream)
-        self.validate()
+        validation.validate_decoded(self)
 
     def write(self, ostream):
-        tstream = BytearrayStream()
+        start = self.reserve_header(ostream)
 
-        self.key_material.write(tstream)
+        self.key_material.write(ostream)
 
         for attribute in self.attributes:
-            attribute.write(tstream)
+            attribute.write(ostream)
 
-        self.length = tstream.length()
-        super(KeyValue, self).write(ostream)
-        ostream.write(tstream.buffer)
+        self.patch_header(ostream, start)
 
     def validate(self):
         self.__validate()
@@ -584,11 +603,11 @@ class KeyInformation(Struct):
         super(KeyInformation, self).__init__(tag=tag)
         self.unique_identifier = unique_identifier
         self.cryptographic_parameters = cryptographic_parameters
-        self.validate()
+        validation.validate_created(self)
 
     def read(self, istream):
         super(KeyInformation, self).read(istream)
-        tstream = BytearrayStream(istream.read(self.length))
+        tstream = BytearrayStream(istream.read_view(self.length))
 
         self.unique_identifier = attributes.UniqueIdentifier()
         self.unique_identifier.read(tstream)
@@ -598,20 +617,18 @@ class KeyInformation(Struct):
             self.cryptographic_parameters.read(tstream)
 
         self.is_oversized(tstream)
-        self.validate()
+        validation.validate_decoded(self)
 
     def write(self, ostream):
-        tstream = BytearrayStream()
+        start = self.reserve_header(ostream)
 
-        self.unique_identifier.write(tstream)
+        self.unique_identifier.write(ostream)
 
         if self.cryptographic_parameters is not None:
-            self.cryptographic_parameters.write(tstream)
+            self.cryptographic_parameters.write(ostream)
 
         # Write the length and value of the template attribute
-        self.length = tstream.length()
-        super(KeyInformation, self).write(ostream)
-        ostream.write(tstream.buffer)
+        self.patch_header(ostream, start)
 
     def validate(self):
         self.__validate()
@@ -683,11 +700,11 @@ class KeyWrappingData(Struct):
         self.mac_signature = mac_signature
         self.iv_counter_nonce = iv_counter_nonce
         self.encoding_option = encoding_option
-        self.validate()
+        validation.validate_created(self)
 
     def read(self, istream):
         super(KeyWrappingData, self).read(istream)
-        tstream = BytearrayStream(istream.read(self.length))
+        tstream = BytearrayStream(istream.read_view(self.length))
 
         self.wrapping_method = WrappingMethod()
         self.wrapping_method.read(tstream)
@@ -713,29 +730,27 @@ class KeyWrappingData(Struct):
             self.encoding_option.read(tstream)
 
         self.is_oversized(tstream)
-        self.validate()
+        validation.validate_decoded(self)
 
     def write(self, ostream):
-        tstream = BytearrayStream()
+        start = self.reserve_header(ostream)
 
         # Write the contents of the key wrapping data
-        self.wrapping_method.write(tstream)
+        self.wrapping_method.write(ostream)
 
         if self.encryption_key_information is not None:
-            self.encryption_key_information.write(tstream)
+            self.encryption_key_information.write(ostream)
         if self.mac_signature_key_information is not None:
-            self.mac_signature_key_information.write(tstream)
+            self.mac_signature_key_information.write(ostream)
         if self.mac_signature is not None:
-            self.mac_signature.write(tstream)
+            self.mac_signature.write(ostream)
         if self.iv_counter_nonce is not None:
-            self.iv_counter_nonce.write(tstream)
+            self.iv_counter_nonce.write(ostream)
         if self.encoding_option is not None:
-            self.encoding_option.write(tstream)
+            self.encoding_option.write(ostream)
 
         # Write the length and value of the key wrapping data
-        self.length = tstream.length()
-        super(KeyWrappingData, self).write(ostream)
-        ostream.write(tstream.buffer)
+        self.patch_header(ostream, start)
 
     def validate(self):
         self.__validate()
@@ -770,7 +785,7 @@ class KeyWrappingSpecification(Struct):
 
     def read(self, istream):
         super(KeyWrappingSpecification, self).read(istream)
-        tstream = BytearrayStream(istream.read(self.length))
+        tstream = BytearrayStream(istream.read_view(self.length))
 
         self.wrapping_method = WrappingMethod()
         self.wrapping_method.read(tstream)
@@ -792,27 +807,25 @@ class KeyWrappingSpecification(Struct):
             self.encoding_option.read(tstream)
 
         self.is_oversized(tstream)
-        self.validate()
+        validation.validate_decoded(self)
 
     def write(self, ostream):
-        tstream = BytearrayStream()
+        start = self.reserve_header(ostream)
 
         # Write the contents of the key wrapping data
-        self.wrapping_method.write(tstream)
+        self.wrapping_method.write(ostream)
 
         if self.encryption_key_information is not None:
-            self.encryption_key_information.write(tstream)
+            self.encryption_key_information.write(ostream)
         if self.mac_signature_key_information is not None:
-            self.mac_signature_key_information.write(tstream)
+            self.mac_signature_key_information.write(ostream)
         if self.attribute_name is not None:
-            self.attribute_name.write(tstream)
+            self.attribute_name.write(ostream)
         if self.encoding_option is not None:
-            self.encoding_option.write(tstream)
+            self.encoding_option.write(ostream)
 
         # Write the length and value of the key wrapping data
-        self.length = tstream.length()
-        super(KeyWrappingSpecification, self).write(ostream)
-        ostream.write(tstream.buffer)
+        self.patch_header(ostream, start)
 
     def validate(self):
         self.__validate()
@@ -841,11 +854,11 @@ class TemplateAttribute(Struct):
         else:
             self.attributes = attributes
 
-        self.validate()
+        validation.validate_created(self)
 
     def read(self, istream):
         super(TemplateAttribute, self).read(istream)
-        tstream = BytearrayStream(istream.read(self.length))
+        tstream = BytearrayStream(istream.read_view(self.length))
 
         self.names = list()
         self.attributes = list()
@@ -863,21 +876,19 @@ class TemplateAttribute(Struct):
             self.attributes.append(attribute)
 
         self.is_oversized(tstream)
-        self.validate()
+        validation.validate_decoded(self)
 
     def write(self, ostream):
-        tstream = BytearrayStream()
+        start = self.reserve_header(ostream)
 
         # Write the names and attributes of the template attribute
         for name in self.names:
-            name.write(tstream)
+            name.write(ostream)
         for attribute in self.attributes:
-            attribute.write(tstream)
+            attribute.write(ostream)
 
         # Write the length and value of the template attribute
-        self.length = tstream.length()
-        super(TemplateAttribute, self).write(ostream)
-        ostream.write(tstream.buffer)
+        self.patch_header(ostream, start)
 
     def validate(self):
         self.__validate()
@@ -1040,7 +1051,7 @@ class ExtensionInformation(Struct):
         self.extension_tag = extension_tag
         self.extension_type = extension_type
 
-        self.validate()
+        validation.validate_created(self)
 
     def read(self, istream):
         """
@@ -1052,7 +1063,7 @@ class ExtensionInformation(Struct):
                 supporting a read method; usually a BytearrayStream object.
         """
         super(ExtensionInformation, self).read(istream)
-        tstream = BytearrayStream(istream.read(self.length))
+        tstream = BytearrayStream(istream.read_view(self.length))
 
         self.extension_name.read(tstream)
 
@@ -1064,7 +1075,7 @@ class ExtensionInformation(Struct):
             self.extension_type.read(tstream)
 
         self.is_oversized(tstream)
-        self.validate()
+        validation.validate_decoded(self)
 
     def write(self, ostream):
         """
@@ -1074,18 +1085,16 @@ class ExtensionInformation(Struct):
             ostream (Stream): A data stream in which to encode object data,
                 supporting a write method; usually a BytearrayStream object.
         """
-        tstream = BytearrayStream()
+        start = self.reserve_header(ostream)
 
-        self.extension_name.write(tstream)
+        self.extension_name.write(ostream)
 
         if self.extension_tag is not None:
-            self.extension_tag.write(tstream)
+            self.extension_tag.write(ostream)
         if self.extension_type is not None:
-            self.extension_type.write(tstream)
+            self.extension_type.write(ostream)
 
-        self.length = tstream.length()
-        super(ExtensionInformation, self).write(ostream)
-        ostream.write(tstream.buffer)
+        self.patch_header(ostream, start)
 
     def validate(self):
         """
@@ -1223,7 +1232,7 @@ class RevocationReason(Struct):
         else:
             self.revocation_message = None
 
-        self.validate()
+        validation.validate_created(self)
 
     def read(self, istream):
         """
@@ -1235,17 +1244,18 @@ class RevocationReason(Struct):
                 supporting a read method; usually a BytearrayStream object.
         """
         super(RevocationReason, self).read(istream)
-        tstream = BytearrayStream(istream.read(self.length))
+        tstream = BytearrayStream(istream.read_view(self.length))
 
         self.revocation_code = RevocationReasonCode()
         self.revocation_code.read(tstream)
 
         if self.is_tag_next(Tags.REVOCATION_MESSAGE, tstream):
-            self.revocation_message = TextString()
+            self.revocation_message = TextString(
+                tag=Tags.REVOCATION_MESSAGE)
             self.revocation_message.read(tstream)
 
         self.is_oversized(tstream)
-        self.validate()
+        validation.validate_decoded(self)
 
     def write(self, ostream):
         """
@@ -1255,16 +1265,14 @@ class RevocationReason(Struct):
             ostream (Stream): A data stream in which to encode object data,
                 supporting a write method; usually a BytearrayStream object.
         """
-        tstream = BytearrayStream()
+        start = self.reserve_header(ostream)
 
-        self.revocation_code.write(tstream)
+        self.revocation_code.write(ostream)
         if self.revocation_message is not None:
-            self.revocation_message.write(tstream)
+            self.revocation_message.write(ostream)
 
         # Write the length and value
-        self.length = tstream.length()
-        super(RevocationReason, self).write(ostream)
-        ostream.write(tstream.buffer)
+        self.patch_header(ostream, start)
 
     def validate(self):
         """
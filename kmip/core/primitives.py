@@ -13,9 +13,12 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import binascii
 import logging
 import six
+import struct
 import sys
+import weakref
 
 from struct import pack, unpack
 from enum import Enum
@@ -23,19 +26,142 @@ from enum import Enum
 from kmip.core.enums import Types
 from kmip.core.enums import Tags
 
+from kmip.core import enums
+
 from kmip.core.errors import ErrorStrings
 
 from kmip.core import errors
 from kmip.core import exceptions
 from kmip.core import utils
+from kmip.core import validation
+
+
+_PADDING = b'\x00' * 8
+
+# The tag and type of an item are decoded together as one unsigned 32-bit
+# integer, with the 24-bit tag in the high bytes and the type in the low byte.
+_TAG_TYPE = struct.Struct('!I')
+_HEADER = struct.Struct('!II')
+
+# Items of the fixed-width types always take 16 bytes, the header followed by
+# an 8-byte value or a 4-byte value and 4 bytes of padding, and are packed and
+# unpacked whole.
+_FIXED_SIZE = 16
+_INTEGER_ITEMS = {
+    '!i': (struct.Struct('!IIi4x'), struct.Struct('!IIiI')),
+    '!I': (struct.Struct('!III4x'), struct.Struct('!IIII')),
+}
+_LONG_INTEGER_ITEM = struct.Struct('!IIq')
+_BOOLEAN_ITEM = struct.Struct('!IIQ')
+
+
+if hasattr(int, 'from_bytes'):
+    def _signed_from_bytes(data):
+        return int.from_bytes(data, 'big', signed=True)
+
+    def _signed_to_bytes(value, length):
+        return value.to_bytes(length, 'big', signed=True)
+else:
+    def _signed_from_bytes(data):
+        value = int(binascii.hexlify(data), 16)
+        if bytearray(data[:1])[0] & 0x80:
+            value -= 1 << (len(data) * 8)
+        return value
+
+    def _signed_to_bytes(value, length):
+        if value < 0:
+            value += 1 << (length * 8)
+        return binascii.unhexlify('{0:0{1}x}'.format(value, length * 2))
+
+
+def _padding_length(length, padding_size):
+    """
+    Compute the number of padding bytes following a value of a given length.
+    """
+    return (padding_size - (length % padding_size)) % padding_size
+
+
+def _read_padded_value(cls, istream, length, padding_size):
+    """
+    Read a value of a given length and its zeroed padding from a stream.
+
+    Args:
+        cls (class): The primitive class reading the value, used for error
+            reporting.
+        istream (Stream): A buffer containing the encoded value and padding.
+            Usually a BytearrayStream object.
+        length (int): The length of the value, excluding padding.
+        padding_size (int): The alignment of the padded value.
+
+    Returns:
+        bytes: The value, with the padding removed.
+
+    Raises:
+        ReadValueError: if the stream is too short to contain the value or if
+            the padding is not zeroed.
+    """
+    value = istream.read(length)
+    if len(value) != length:
+        raise errors.ReadValueError(
+            cls.__name__, 'value', '{0} bytes'.format(length),
+            '{0} bytes'.format(len(value)))
+
+    num_pad_bytes = _padding_length(length, padding_size)
+    if num_pad_bytes:
+        pad = istream.read(num_pad_bytes)
+        if pad != _PADDING[:num_pad_bytes]:
+            raise errors.ReadValueError(cls.__name__, 'pad', 0, pad)
+
+    return value
+
+
+def _byte_view(value):
+    """
+    Return a value as bytes or as a flat view of its bytes, copying it only
+    if it does not support the buffer protocol.
+    """
+    if isinstance(value, bytes):
+        return value
+    elif isinstance(value, memoryview):
+        view = value
+    else:
+        try:
+            view = memoryview(value)
+        except TypeError:
+            return bytes(value)
+    if view.ndim != 1 or view.format != 'B':
+        try:
+            view = view.cast('B')
+        except (AttributeError, TypeError):
+            return view.tobytes()
+    return view
+
+
+def _write_padded_value(ostream, value, num_pad_bytes):
+    """
+    Write a value followed by the given number of zeroed padding bytes.
+    """
+    ostream.write(value)
+    if num_pad_bytes:
+        ostream.write(_PADDING[:num_pad_bytes])
 
 
 class Base(object):
+    # Encodings are created in large numbers, so they carry no __dict__
+    __slots__ = ('tag', 'type', 'length', '_encoding', '_owners',
+                 '__weakref__')
+
     TAG_SIZE = 3
     TYPE_SIZE = 1
     LENGTH_SIZE = 4
+    HEADER_SIZE = TAG_SIZE + TYPE_SIZE + LENGTH_SIZE
 
     def __init__(self, tag=Tags.DEFAULT, type=Types.DEFAULT):
+        # The encoding cached by freeze, and the frozen objects containing
+        # this one that are thawed along with it. Frozen objects always have
+        # a list of owners, so that setting an attribute only checks one.
+        self._encoding = None
+        self._owners = None
         self.tag = tag
         self.type = type
         self.length = None
@@ -52,7 +178,7 @@ class Base(object):
         tts = istream.read(self.TAG_SIZE)
         tag = unpack('!I', b'\x00' + tts[0:self.TAG_SIZE])[0]
 
-        enum_tag = Tags(tag)
+        enum_tag = enums.lookup_member(Tags, tag)
 
         # Verify that the tag matches for the current object
         if enum_tag is not self.tag:
@@ -69,7 +195,7 @@ class Base(object):
                                         '{0} bytes'.format(num_bytes))
         typ = unpack('!B', tts)[0]
 
-        enum_typ = Types(typ)
+        enum_typ = enums.lookup_member(Types, typ)
 
         if enum_typ is not self.type:
             raise errors.ReadValueError(Base.__name__, 'type',
@@ -89,9 +215,25 @@ class Base(object):
         raise NotImplementedError()
 
     def read(self, istream):
-        self.read_tag(istream)
-        self.read_type(istream)
-        self.read_length(istream)
+        header = istream.read(self.HEADER_SIZE)
+        num_bytes = len(header)
+        if num_bytes != self.HEADER_SIZE:
+            min_bytes = 'a minimum of {0} bytes'.format(self.HEADER_SIZE)
+            raise errors.ReadValueError(Base.__name__, 'header', min_bytes,
+                                        '{0} bytes'.format(num_bytes))
+        tag_type, self.length = _HEADER.unpack(header)
+
+        # The integer values are compared through _value_, which skips the
+        # value property of the enumeration members
+        tag = tag_type >> 8
+        if tag != self.tag._value_:
+            raise errors.ReadValueError(Base.__name__, 'tag',
+                                        hex(self.tag.value), hex(tag))
+
+        typ = tag_type & 0xff
+        if typ != self.type._value_:
+            raise errors.ReadValueError(Base.__name__, 'type',
+                                        self.type.value, typ)
 
     def write_tag(self, ostream):
         # Write the tag to the output stream
@@ -118,52 +260,411 @@ class Base(object):
     def write_value(self, ostream):
         raise NotImplementedError()
 
+    def pack_header(self):
+        """
+        Encode the tag, type, and length of the object as an item header.
+
+        Returns:
+            bytes: The 8-byte encoding of the item header.
+        """
+        if type(self.type) is not Types:
+            msg = ErrorStrings.BAD_EXP_RECV
+            raise TypeError(msg.format(Base.__name__, 'type',
+                                       Types, type(self.type)))
+        if type(self.length) is not int:
+            msg = ErrorStrings.BAD_EXP_RECV
+            raise TypeError(msg.format(Base.__name__, 'length',
+                                       int, type(self.length)))
+        if self.length > 0xffffffff:
+            raise errors.WriteOverflowError(
+                Base.__name__, 'length', self.LENGTH_SIZE,
+                utils.count_bytes(self.length))
+        return _HEADER.pack((self.tag.value << 8) | self.type.value,
+                            self.length)
+
     def write(self, ostream):
-        self.write_tag(ostream)
-        self.write_type(ostream)
-        self.write_length(ostream)
+        ostream.write(self.pack_header())
+
+    def _pack_fixed(self, item, value):
+        """
+        Encode a fixed-width object whole, returning None if its header or
+        value cannot be packed so that the caller can report the error.
+        """
+        try:
+            return item.pack(
+                (self.tag.value << 8) | self.type.value, self.length, value)
+        except (AttributeError, struct.error):
+            return None
+
+    def _unpack_fixed(self, data, item):
+        """
+        Decode a fixed-width object read whole, returning the fields following
+        the header, or None if the data is short or the header does not
+        match so that the caller can report the error.
+        """
+        if len(data) != _FIXED_SIZE:
+            return None
+        fields = item.unpack(data)
+        if fields[0] != (self.tag.value << 8) | self.type.value:
+            return None
+        if fields[1] != self.LENGTH:
+            return None
+        self.length = fields[1]
+        return fields[2:]
 
     def validate(self):
         raise NotImplementedError()
 
     @staticmethod
     def is_tag_next(tag, stream):
-        next_tag = stream.peek(Base.TAG_SIZE)
-        if len(next_tag) != Base.TAG_SIZE:
-            return False
-        next_tag = unpack('!I', b'\x00' + next_tag)[0]
-        if next_tag == tag.value:
-            return True
+        tag_type = stream.peek(Base.TAG_SIZE + Base.TYPE_SIZE)
+        if len(tag_type) == Base.TAG_SIZE + Base.TYPE_SIZE:
+            next_tag = _TAG_TYPE.unpack(tag_type)[0] >> 8
+        elif len(tag_type) == Base.TAG_SIZE:
+            next_tag = _TAG_TYPE.unpack(b'\x00' + tag_type)[0]
         else:
             return False
+        return next_tag == tag._value_
 
     @staticmethod
     def is_type_next(kmip_type, stream):
-        tag_type_size = Base.TAG_SIZE + Base.TYPE_SIZE
-        tt = stream.peek(tag_type_size)
-
-        if len(tt) != tag_type_size:
+        tag_type = stream.peek(Base.TAG_SIZE + Base.TYPE_SIZE)
+        if len(tag_type) != Base.TAG_SIZE + Base.TYPE_SIZE:
             return False
+        return _TAG_TYPE.unpack(tag_type)[0] & 0xff == kmip_type._value_
 
-        typ = unpack('!B', tt[Base.TAG_SIZE:])[0]
-
-        if typ == kmip_type.value:
-            return True
+    def freeze(self):
+        """
+        Cache the encoding of the object and of its children.
+
+        Writing a frozen object appends its cached encoding to the stream
+        instead of encoding it again. Setting or deleting an attribute of a
+        frozen object, or of any of its descendants, or changing one of their
+        list attributes in place thaws the object, dropping the cache. Byte
+        values that are views of a mutable buffer are copied when frozen, and
+        an object holding any other mutable value, such as a BytearrayStream,
+        is not frozen. Freezing is meant for values that are written many
+        times without changes, such as common attributes and protocol
+        versions.
+        """
+        # A frozen object has not changed since it was frozen, and thawing it
+        # would thaw the other frozen objects sharing it.
+        if self._encoding is not None:
+            return
+
+        cacheable = True
+        for name, value in _instance_state(self).items():
+            value, frozen = _freeze_value(self, value)
+            object.__setattr__(self, name, value)
+            cacheable = cacheable and frozen
+
+        if cacheable:
+            stream = utils.BytearrayStream()
+            self.write(stream)
+            _enable_caching(type(self))
+            object.__setattr__(self, '_encoding', bytes(stream.buffer))
+            object.__setattr__(self, '_owners', list())
+
+    def thaw(self):
+        """
+        Drop the cached encoding of a frozen object and of the objects frozen
+        with it as a descendant; see freeze.
+        """
+        owners = self._owners
+        object.__setattr__(self, '_encoding', None)
+        object.__setattr__(self, '_owners', None)
+        for owner in owners or ():
+            owner = owner()
+            if owner is not None:
+                owner.thaw()
+
+    def is_frozen(self):
+        return self._encoding is not None
+
+    def __getstate__(self):
+        return _instance_state(self)
+
+    def __setstate__(self, state):
+        # Copies and unpickled objects are never frozen.
+        object.__setattr__(self, '_encoding', None)
+        object.__setattr__(self, '_owners', None)
+        for name, value in state.items():
+            if type(value) is _FrozenList:
+                value = list(value)
+            object.__setattr__(self, name, value)
+
+
+_CACHING_CLASSES = set()
+
+
+def _enable_caching(cls):
+    # A class gets the write and attribute hooks of frozen objects when its
+    # first instance is frozen, so objects of classes that are never frozen
+    # pay nothing for them.
+    if cls in _CACHING_CLASSES:
+        return
+    if not getattr(cls.write, 'cached', False):
+        cls.write = _cached_write(cls.write)
+    cls.__setattr__ = _thawing_setattr
+    cls.__delattr__ = _thawing_delattr
+    _CACHING_CLASSES.add(cls)
+
+
+def _cached_write(write):
+    def cached_write(self, ostream):
+        encoding = self._encoding
+        if encoding is None:
+            write(self, ostream)
         else:
-            return False
+            ostream.write(encoding)
+
+    cached_write.__doc__ = write.__doc__
+    cached_write.cached = True
+    return cached_write
+
+
+def _thawing_setattr(self, name, value):
+    object.__setattr__(self, name, value)
+    try:
+        owners = self._owners
+    except AttributeError:
+        # Set by a subclass before Base.__init__
+        return
+    if owners is not None:
+        self.thaw()
+
+
+def _thawing_delattr(self, name):
+    object.__delattr__(self, name)
+    if self._owners is not None:
+        self.thaw()
+
+
+# Values that cannot change once created, which never thaw a frozen object
+_IMMUTABLE_TYPES = six.integer_types + six.string_types + (
+    type(None), float, bytes, six.text_type, Enum)
+
+# Bookkeeping slots of Base, which are not part of the state of an object
+_BOOKKEEPING = ('_encoding', '_owners', '__weakref__')
+
+_SLOT_NAMES = dict()
+
+
+def _slot_names(cls):
+    names = _SLOT_NAMES.get(cls)
+    if names is None:
+        names = list()
+        for klass in reversed(cls.__mro__):
+            slots = klass.__dict__.get('__slots__', ())
+            if isinstance(slots, str):
+                slots = (slots, )
+            names.extend(slot for slot in slots
+                         if slot not in names and slot not in _BOOKKEEPING)
+        names = _SLOT_NAMES[cls] = tuple(names)
+    return names
+
+
+def _instance_state(obj):
+    # Collect the attributes set on an object, whether they are stored in
+    # slots or in the instance dictionary.
+    state = dict()
+    for name in _slot_names(type(obj)):
+        try:
+            state[name] = object.__getattribute__(obj, name)
+        except AttributeError:
+            pass
+    try:
+        state.update(object.__getattribute__(obj, '__dict__'))
+    except AttributeError:
+        pass
+    return state
+
+
+def _freeze_value(owner, value):
+    # Freeze an attribute value of an object being frozen, returning the
+    # value to keep and whether the encoding of the object can be cached.
+    if isinstance(value, Base):
+        value.freeze()
+        if value._encoding is None:
+            return value, False
+        value._owners.append(weakref.ref(owner))
+        return value, True
+    if isinstance(value, _IMMUTABLE_TYPES):
+        return value, True
+    if isinstance(value, (bytearray, memoryview)):
+        return bytes(value), True
+    if isinstance(value, (list, tuple)):
+        items = list()
+        cacheable = True
+        for item in value:
+            item, frozen = _freeze_value(owner, item)
+            items.append(item)
+            cacheable = cacheable and frozen
+        if type(value) is tuple:
+            return tuple(items), cacheable
+        if isinstance(value, list):
+            return _FrozenList(owner, items), cacheable
+        return value, False
+    return value, False
+
+
+class _FrozenList(list):
+    # A list attribute of a frozen object, which thaws the object when it is
+    # changed in place. Copies and pickles of it are plain lists.
+    __slots__ = ('_owner', )
+
+    def __init__(self, owner, items):
+        super(_FrozenList, self).__init__(items)
+        self._owner = weakref.ref(owner)
+
+    def __reduce_ex__(self, protocol):
+        return list, (list(self), )
+
+
+def _thawing(name):
+    method = getattr(list, name)
+
+    def mutate(self, *args, **kwargs):
+        owner = self._owner()
+        if owner is not None:
+            owner.thaw()
+        return method(self, *args, **kwargs)
+
+    mutate.__name__ = name
+    return mutate
+
+
+for _name in ('__setitem__', '__delitem__', '__setslice__', '__delslice__',
+              '__iadd__', '__imul__', 'append', 'extend', 'insert', 'pop',
+              'remove', 'reverse', 'sort', 'clear'):
+    if hasattr(list, _name):
+        setattr(_FrozenList, _name, _thawing(_name))
 
 
 class Struct(Base):
+    __slots__ = ('_deferred', )
 
     def __init__(self, tag=Tags.DEFAULT):
         super(Struct, self).__init__(tag, type=Types.STRUCTURE)
 
+    def read_lazy(self, istream):
+        """
+        Read the encoding of the Struct, deferring decoding of its contents.
+
+        The header of the encoding is validated immediately and the encoding
+        is copied out of the stream, so that a deferred Struct does not keep
+        the whole buffer it was read from alive. The contents are decoded by
+        read the first time an attribute not set by the header is accessed,
+        so a Struct that is never inspected is never decoded. If decoding
+        fails, the Struct is left as read_lazy left it and that access, and
+        every later one, raises the decoding error.
+
+        Args:
+            istream (BytearrayStream): A stream containing the encoded Struct.
+
+        Raises:
+            ReadValueError: if the encoding is shorter than its header claims.
+        """
+        header = istream.peek(self.HEADER_SIZE)
+        length = 0
+        if len(header) == self.HEADER_SIZE:
+            length = _HEADER.unpack(header)[1]
+        encoding = istream.read(self.HEADER_SIZE + length)
+
+        super(Struct, self).read(utils.BytearrayStream(encoding))
+
+        num_bytes = len(encoding) - self.HEADER_SIZE
+        if num_bytes != self.length:
+            raise errors.ReadValueError(
+                type(self).__name__, 'length',
+                '{0} bytes'.format(self.length), '{0} bytes'.format(num_bytes))
+
+        state = _instance_state(self)
+        for name in ('tag', 'type', 'length'):
+            state.pop(name)
+        self._defer(encoding, state, None)
+
+    def _defer(self, encoding, state, error):
+        # Drop every attribute but the header ones, keeping the encoding, the
+        # attributes to restore before decoding it and the error raised by a
+        # failed attempt to decode it.
+        for name in _instance_state(self):
+            if name not in ('tag', 'type', 'length'):
+                object.__delattr__(self, name)
+        self._deferred = (encoding, state, error)
+
+    def is_deferred(self):
+        """
+        Check if decoding of the Struct contents was deferred by read_lazy and
+        has not happened yet.
+        """
+        try:
+            object.__getattribute__(self, '_deferred')
+        except AttributeError:
+            return False
+        return True
+
+    def __getattr__(self, name):
+        # Only called when regular attribute lookup fails, so decoded and
+        # eagerly read Structs never get here.
+        try:
+            encoding, state, error = object.__getattribute__(
+                self, '_deferred')
+        except AttributeError:
+            raise AttributeError("'{0}' object has no attribute '{1}'".format(
+                type(self).__name__, name))
+        if error is not None:
+            raise error
+
+        object.__delattr__(self, '_deferred')
+        for attribute, value in state.items():
+            object.__setattr__(self, attribute, value)
+        try:
+            self.read(utils.BytearrayStream(encoding))
+        except Exception as e:
+            # The failed read may have changed the restored attributes, so
+            # the Struct goes back to its deferred state for good rather
+            # than staying half decoded.
+            self._defer(encoding, state, e)
+            raise
+        return getattr(self, name)
+
+    def reserve_header(self, ostream):
+        """
+        Reserve space for the header of the Struct encoding.
+
+        The contents of the Struct can then be written directly to the output
+        stream, after which patch_header fills in the reserved header with the
+        encoded length of those contents.
+
+        Args:
+            ostream (BytearrayStream): The stream the Struct is encoded into.
+
+        Returns:
+            int: The position of the reserved header in the output stream.
+        """
+        return ostream.reserve(self.HEADER_SIZE)
+
+    def patch_header(self, ostream, position):
+        """
+        Fill in a header reserved by reserve_header.
+
+        Args:
+            ostream (BytearrayStream): The stream the Struct is encoded into.
+            position (int): The position of the reserved header in the output
+                stream.
+        """
+        self.length = ostream.tell() - position - self.HEADER_SIZE
+        ostream.patch(position, self.pack_header())
+
     # NOTE (peter-hamilton) If seen, should indicate repr needs to be defined
     def __repr__(self):
         return "Struct()"
 
 
 class Integer(Base):
+    __slots__ = ('value', 'padding_length', 'pack_string')
+
     LENGTH = 4
 
     # Set for signed 32-bit integers
@@ -184,7 +685,7 @@ class Integer(Base):
         else:
             self.pack_string = '!I'
 
-        self.validate()
+        validation.validate_created(self)
 
     def read_value(self, istream):
         if self.length is not self.LENGTH:
@@ -197,19 +698,31 @@ class Integer(Base):
         if pad is not 0:
             raise errors.ReadValueError(Integer.__name__, 'pad', 0,
                                         pad)
-        self.validate()
+        validation.validate_decoded(self)
 
     def read(self, istream):
-        super(Integer, self).read(istream)
-        self.read_value(istream)
+        data = istream.read(_FIXED_SIZE)
+        fields = self._unpack_fixed(data, _INTEGER_ITEMS[self.pack_string][1])
+        if fields is None or fields[1] != 0:
+            istream = utils.BytearrayStream(data)
+            super(Integer, self).read(istream)
+            self.read_value(istream)
+        else:
+            self.value = fields[0]
+            validation.validate_decoded(self)
 
     def write_value(self, ostream):
         ostream.write(pack(self.pack_string, self.value))
         ostream.write(pack(self.pack_string, 0))
 
     def write(self, ostream):
-        super(Integer, self).write(ostream)
-        self.write_value(ostream)
+        encoding = self._pack_fixed(
+            _INTEGER_ITEMS[self.pack_string][0], self.value)
+        if encoding is None:
+            super(Integer, self).write(ostream)
+            self.write_value(ostream)
+        else:
+            ostream.write(encoding)
 
     def validate(self):
         """
@@ -257,6 +770,7 @@ class LongInteger(Base):
     a signed, big-endian, 64-bit integer. For more information, see Section
     9.1 of the KMIP 1.1 specification.
     """
+    __slots__ = ('value', )
 
     LENGTH = 8
 
@@ -277,7 +791,7 @@ class LongInteger(Base):
         self.value = value
         self.length = LongInteger.LENGTH
 
-        self.validate()
+        validation.validate_created(self)
 
     def read(self, istream):
         """
@@ -291,6 +805,14 @@ class LongInteger(Base):
             InvalidPrimitiveLength: if the long integer encoding read in has
                 an invalid encoded length.
         """
+        data = istream.read(_FIXED_SIZE)
+        fields = self._unpack_fixed(data, _LONG_INTEGER_ITEM)
+        if fields is not None:
+            self.value = fields[0]
+            validation.validate_decoded(self)
+            return
+
+        istream = utils.BytearrayStream(data)
         super(LongInteger, self).read(istream)
 
         if self.length is not LongInteger.LENGTH:
@@ -300,7 +822,7 @@ class LongInteger(Base):
                     LongInteger.LENGTH, self.length))
 
         self.value = unpack('!q', istream.read(self.length))[0]
-        self.validate()
+        validation.validate_decoded(self)
 
     def write(self, ostream):
         """
@@ -310,8 +832,12 @@ class LongInteger(Base):
             ostream (stream): A buffer to contain the encoded bytes of a
                 LongInteger. Usually a BytearrayStream object. Required.
         """
-        super(LongInteger, self).write(ostream)
-        ostream.write(pack('!q', self.value))
+        encoding = self._pack_fixed(_LONG_INTEGER_ITEM, self.value)
+        if encoding is None:
+            super(LongInteger, self).write(ostream)
+            ostream.write(pack('!q', self.value))
+        else:
+            ostream.write(encoding)
 
     def validate(self):
         """
@@ -357,89 +883,74 @@ class LongInteger(Base):
 
 
 class BigInteger(Base):
+    __slots__ = ('value', 'padding_length')
+
     BLOCK_SIZE = 8
-    SHIFT_SIZE = 64
 
     def __init__(self, value=None, tag=Tags.DEFAULT):
         super(BigInteger, self).__init__(tag, type=Types.BIG_INTEGER)
         self.value = value
+        validation.validate_created(self)
 
         if self.value is not None:
-            self.real_length = utils.count_bytes(self.value)
-            self.padding_length = self.BLOCK_SIZE - (self.length %
-                                                     self.BLOCK_SIZE)
-            if self.padding_length == self.BLOCK_SIZE:
-                self.padding_length = 0
+            self.length = self.value_length(self.value)
+            self.padding_length = 0
         else:
             self.length = None
             self.padding_length = None
 
-        self.validate()
+    @classmethod
+    def value_length(cls, value):
+        """
+        Return the number of bytes of the encoding of a BigInteger value.
+
+        The encoding is the shortest two's complement representation of the
+        value, sign extended to a multiple of the block size.
+        """
+        # One extra bit is needed for the sign
+        if value < 0:
+            num_bits = (~value).bit_length() + 1
+        else:
+            num_bits = value.bit_length() + 1
+        block_bits = cls.BLOCK_SIZE * 8
+        num_blocks = (num_bits + block_bits - 1) // block_bits
+        return num_blocks * cls.BLOCK_SIZE
 
     def read_value(self, istream):
         if (self.length < self.BLOCK_SIZE) or (self.length % self.BLOCK_SIZE):
-            raise errors.InvalidLengthError(BigInteger.__name__,
-                                            ('multiple'
-                                             'of {0}'.format(self.BLOCK_SIZE)),
-                                            self.length)
-        self.value = 0
-        num_blocks = self.length / self.BLOCK_SIZE
-
-        # Read first block as signed data
-        self.value = unpack('!q', str(istream.read(self.BLOCK_SIZE)))[0]
-
-        # Shift current value and add on next unsigned block
-        for _ in range(num_blocks - 1):
-            self.value = self.value << self.SHIFT_SIZE
-            stream_data = istream.read(self.BLOCK_SIZE)
-            self.value += unpack('!Q', stream_data)[0]
-
-        self.validate()
+            raise errors.InvalidLengthError(
+                BigInteger.__name__,
+                'multiple of {0}'.format(self.BLOCK_SIZE),
+                self.length)
+
+        data = istream.read(self.length)
+        if len(data) != self.length:
+            raise errors.ReadValueError(
+                BigInteger.__name__, 'value',
+                '{0} bytes'.format(self.length),
+                '{0} bytes'.format(len(data)))
+
+        self.value = _signed_from_bytes(data)
+        self.padding_length = 0
+        validation.validate_decoded(self)
 
     def read(self, istream):
         super(BigInteger, self).read(istream)
         self.read_value(istream)
 
+    def encode_value(self):
+        # Encode the value once, keeping its length in sync with its value
+        self.length = self.value_length(self.value)
+        self.padding_length = 0
+        return _signed_to_bytes(self.value, self.length)
+
     def write_value(self, ostream):
-        # 1. Determine the sign of the value (+/-); save it.
-        # 2. Extend hex of value with 0s until encoding is right size (8x).
-        # 3. Write out each block of the encoding as signed, 2s complement:
-        #    pack('!q', sign * block)
-
-        # Determine sign for padding
-        pad_byte = 0x00
-        pad_nybl = 0x0
-
-        if self.value < 0:
-            pad_byte = 0xff
-            pad_nybl = 0xf
-
-        # Compose padding bytes
-        pad = ''
-        for _ in range(self.padding_length):
-            pad += hex(pad_byte)[2:]
-
-        str_rep = hex(self.value).rstrip("Ll")[2:]
-        if len(str_rep) % 2:
-            pad += hex(pad_nybl)[2]
-
-        # Compose value for block-based write
-        str_rep = pad + str_rep
-        num_blocks = len(str_rep) / self.BLOCK_SIZE
-
-        # Write first block as signed data
-        block = int(str_rep[0:self.BLOCK_SIZE], 16)
-        ostream.write(pack('!q', block))
-
-        # Write remaining blocks as unsigned data
-        for i in range(1, num_blocks):
-            block = str_rep[(self.BLOCK_SIZE * i):(self.BLOCK_SIZE * (i + 1))]
-            block = int(block, 16)
-            ostream.write(pack('!Q', block))
+        ostream.write(self.encode_value())
 
     def write(self, ostream):
+        value = self.encode_value()
         super(BigInteger, self).write(ostream)
-        self.write_value(ostream)
+        ostream.write(value)
 
     def validate(self):
         self.__validate()
@@ -451,6 +962,7 @@ class BigInteger(Base):
                 raise errors.StateTypeError(
                     BigInteger.__name__, "{0}".format(six.integer_types),
                     data_type)
+        if self.length is not None:
             num_bytes = utils.count_bytes(self.length)
             if num_bytes > self.LENGTH_SIZE:
                 raise errors.StateOverflowError(
@@ -459,22 +971,24 @@ class BigInteger(Base):
 
 
 class Enumeration(Integer):
+    __slots__ = ('enum', )
+
     ENUM_TYPE = None
 
     def __init__(self, value=None, tag=Tags.DEFAULT):
         self.enum = value
-        self.validate()
 
-        if self.enum is None:
-            super(Enumeration, self).__init__(None, tag, False)
+        # Integer.__init__ validates the enumeration set above
+        if isinstance(value, Enum):
+            super(Enumeration, self).__init__(value.value, tag, False)
         else:
-            super(Enumeration, self).__init__(self.enum.value, tag, False)
+            super(Enumeration, self).__init__(None, tag, False)
         self.type = Types.ENUMERATION
 
     def read(self, istream):
         super(Enumeration, self).read(istream)
-        self.enum = self.ENUM_TYPE(self.value)
-        self.validate()
+        self.enum = enums.lookup_member(self.ENUM_TYPE, self.value)
+        validation.validate_decoded(self)
 
     def write(self, ostream):
         super(Enumeration, self).write(ostream)
@@ -504,8 +1018,12 @@ class Boolean(Base):
     or False (0). For more information, see Section 9.1 of the KMIP 1.1
     specification.
     """
+    __slots__ = ('value', )
+
     LENGTH = 8
 
+    logger = logging.getLogger(__name__)
+
     def __init__(self, value=True, tag=Tags.DEFAULT):
         """
         Create a Boolean object.
@@ -516,11 +1034,10 @@ class Boolean(Base):
                 Optional, defaults to Tags.DEFAULT.
         """
         super(Boolean, self).__init__(tag, type=Types.BOOLEAN)
-        self.logger = logging.getLogger(__name__)
         self.value = value
         self.length = self.LENGTH
 
-        self.validate()
+        validation.validate_created(self)
 
     def read_value(self, istream):
         """
@@ -547,7 +1064,7 @@ class Boolean(Base):
         else:
             raise ValueError("expected: 0 or 1, observed: {0}".format(value))
 
-        self.validate()
+        validation.validate_decoded(self)
 
     def read(self, istream):
         """
@@ -557,8 +1074,15 @@ class Boolean(Base):
             istream (Stream): A buffer containing the encoded bytes of a
                 Boolean object. Usually a BytearrayStream object. Required.
         """
-        super(Boolean, self).read(istream)
-        self.read_value(istream)
+        data = istream.read(_FIXED_SIZE)
+        fields = self._unpack_fixed(data, _BOOLEAN_ITEM)
+        if fields is None or fields[0] > 1:
+            istream = utils.BytearrayStream(data)
+            super(Boolean, self).read(istream)
+            self.read_value(istream)
+        else:
+            self.value = fields[0] == 1
+            validation.validate_decoded(self)
 
     def write_value(self, ostream):
         """
@@ -583,8 +1107,12 @@ class Boolean(Base):
             ostream (Stream): A buffer to contain the encoded bytes of a
                 Boolean object. Usually a BytearrayStream object. Required.
         """
-        super(Boolean, self).write(ostream)
-        self.write_value(ostream)
+        encoding = self._pack_fixed(_BOOLEAN_ITEM, self.value)
+        if encoding is None:
+            super(Boolean, self).write(ostream)
+            self.write_value(ostream)
+        else:
+            ostream.write(encoding)
 
     def validate(self):
         """
@@ -618,8 +1146,9 @@ class Boolean(Base):
 
 
 class TextString(Base):
+    __slots__ = ('value', 'padding_length')
+
     PADDING_SIZE = 8
-    BYTE_FORMAT = '!c'
 
     def __init__(self, value=None, tag=Tags.DEFAULT):
         super(TextString, self).__init__(tag, type=Types.TEXT_STRING)
@@ -629,7 +1158,7 @@ class TextString(Base):
         else:
             self.value = value
 
-        self.validate()
+        validation.validate_created(self)
 
         if self.value is not None:
             self.length = len(self.value)
@@ -643,44 +1172,35 @@ class TextString(Base):
 
     def read_value(self, istream):
         # Read string text
-        self.value = ''
-        for _ in range(self.length):
-            c = unpack(self.BYTE_FORMAT, istream.read(1))[0]
-            if sys.version >= '3':
-                c = c.decode()
-            self.value += c
-
-        # Read padding and check content
-        self.padding_length = self.PADDING_SIZE - (self.length %
-                                                   self.PADDING_SIZE)
-        if self.padding_length < self.PADDING_SIZE:
-            for _ in range(self.padding_length):
-                pad = unpack('!B', istream.read(1))[0]
-                if pad is not 0:
-                    raise errors.ReadValueError(TextString.__name__, 'pad', 0,
-                                                pad)
+        value = _read_padded_value(
+            TextString, istream, self.length, self.PADDING_SIZE)
+        if sys.version >= '3':
+            value = value.decode()
+        self.value = value
+        self.padding_length = _padding_length(self.length, self.PADDING_SIZE)
 
     def read(self, istream):
         super(TextString, self).read(istream)
         self.read_value(istream)
-        self.validate()
+        validation.validate_decoded(self)
 
-    def write_value(self, ostream):
-        # Write string to stream
-        for char in self.value:
-            if sys.version < '3':
-                c = char
-            else:
-                c = char.encode()
-            ostream.write(pack(self.BYTE_FORMAT, c))
+    def encode_value(self):
+        # Encode the string once, keeping its length in sync with its value
+        if sys.version < '3':
+            value = self.value
+        else:
+            value = self.value.encode()
+        self.length = len(value)
+        self.padding_length = _padding_length(self.length, self.PADDING_SIZE)
+        return value
 
-        # Write padding to stream
-        for _ in range(self.padding_length):
-            ostream.write(pack('!B', 0))
+    def write_value(self, ostream):
+        _write_padded_value(ostream, self.encode_value(), self.padding_length)
 
     def write(self, ostream):
+        value = self.encode_value()
         super(TextString, self).write(ostream)
-        self.write_value(ostream)
+        _write_padded_value(ostream, value, self.padding_length)
 
     def validate(self):
         self.__validate()
@@ -713,18 +1233,21 @@ class TextString(Base):
 
 
 class ByteString(Base):
+    __slots__ = ('value', 'padding_length')
+
     PADDING_SIZE = 8
-    BYTE_FORMAT = '!B'
 
     def __init__(self, value=None, tag=Tags.DEFAULT):
         super(ByteString, self).__init__(tag, type=Types.BYTE_STRING)
 
+        # Buffers such as memoryviews of received messages or mapped files
+        # are kept as they are, so that large values are not copied
         if value is None:
             self.value = bytes()
         else:
-            self.value = bytes(value)
+            self.value = _byte_view(value)
 
-        self.validate()
+        validation.validate_created(self)
 
         if self.value is not None:
             self.length = len(self.value)
@@ -737,60 +1260,51 @@ class ByteString(Base):
             self.padding_length = None
 
     def read_value(self, istream):
-        # Read bytes into bytearray
-        data = bytearray()
-        for _ in range(self.length):
-            data.append(istream.read(1)[0])
-        self.value = bytes(data)
-
-        # Read padding and check content
-        self.padding_length = self.PADDING_SIZE - (self.length %
-                                                   self.PADDING_SIZE)
-        if self.padding_length == self.PADDING_SIZE:
-            self.padding_length = 0
-
-        if self.padding_length < self.PADDING_SIZE:
-            for _ in range(self.padding_length):
-                pad = unpack('!B', istream.read(1))[0]
-                if pad is not 0:
-                    raise errors.ReadValueError(TextString.__name__, 'pad', 0,
-                                                pad)
+        # Read bytes
+        self.value = _read_padded_value(
+            ByteString, istream, self.length, self.PADDING_SIZE)
+        self.padding_length = _padding_length(self.length, self.PADDING_SIZE)
 
     def read(self, istream):
         super(ByteString, self).read(istream)
         self.read_value(istream)
 
-    def write_value(self, ostream):
-        # Write bytes to stream
-        data = bytearray(self.value)
-        for byte in data:
-            ostream.write(pack(self.BYTE_FORMAT, byte))
+    def encode_value(self):
+        # Keep the length in sync with the value
+        self.length = len(self.value)
+        self.padding_length = _padding_length(self.length, self.PADDING_SIZE)
+        return self.value
 
-        # Write padding to stream
-        for _ in range(self.padding_length):
-            ostream.write(pack('!B', 0))
+    def write_value(self, ostream):
+        _write_padded_value(ostream, self.encode_value(), self.padding_length)
 
     def write(self, ostream):
+        value = self.encode_value()
         super(ByteString, self).write(ostream)
-        self.write_value(ostream)
+        _write_padded_value(ostream, value, self.padding_length)
 
     def validate(self):
         self.__validate()
 
     def __validate(self):
-        # TODO (peter-hamilton) Test is pointless, value is always bytes. Fix.
         if self.value is not None:
             data_type = type(self.value)
-            if data_type is not bytes:
+            if data_type is not bytes and data_type is not memoryview:
                 msg = ErrorStrings.BAD_EXP_RECV
                 raise TypeError(msg.format('ByteString', 'value', bytes,
                                            data_type))
 
     def __repr__(self):
-        return "{0}(value={1})".format(type(self).__name__, repr(self.value))
+        return "{0}(value={1})".format(
+            type(self).__name__, repr(self._bytes()))
 
     def __str__(self):
-        return "{0}".format(str(self.value))
+        return "{0}".format(str(self._bytes()))
+
+    def _bytes(self):
+        if isinstance(self.value, memoryview):
+            return self.value.tobytes()
+        return self.value
 
     def __eq__(self, other):
         if isinstance(other, ByteString):
@@ -806,6 +1320,7 @@ class ByteString(Base):
 
 
 class DateTime(LongInteger):
+    __slots__ = ()
 
     def __init__(self, value=None, tag=Tags.DEFAULT):
         super(DateTime, self).__init__(value, tag)
@@ -813,6 +1328,7 @@ class DateTime(LongInteger):
 
 
 class Interval(Integer):
+    __slots__ = ()
 
     def __init__(self, value=None, tag=Tags.DEFAULT):
         super(Interval, self).__init__(value, tag)
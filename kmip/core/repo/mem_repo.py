@@ -13,37 +13,51 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import threading
+
 from kmip.core.repo.repo import ManagedObjectRepo
 
 
 class MemRepo(ManagedObjectRepo):
+    """
+    Stores managed objects in memory.
+
+    The repository may be shared by the threads of a concurrent server; every
+    operation holds a lock, so UUIDs are never reused and readers never see a
+    partially updated repository.
+    """
 
     def __init__(self):
         self.repo = {}
         self.uuid = 1
+        self._lock = threading.Lock()
 
     def save(self, managed_object, attributes):
         # TODO (nate) verify the parameters
-        uuid = "{0}".format(self.uuid)
-        self.repo[uuid] = (managed_object, attributes)
-        self.uuid += 1
+        with self._lock:
+            uuid = "{0}".format(self.uuid)
+            self.repo[uuid] = (managed_object, attributes)
+            self.uuid += 1
         return uuid
 
     def get(self, uuid):
-        if uuid is None or uuid not in self.repo:
-            return (None, None)
-        return self.repo[uuid]
+        with self._lock:
+            if uuid is None or uuid not in self.repo:
+                return (None, None)
+            return self.repo[uuid]
 
     def update(self, uuid, managed_object, attributes):
         if uuid is None:
             return False
-        self.repo[uuid] = (managed_object, attributes)
+        with self._lock:
+            self.repo[uuid] = (managed_object, attributes)
         return True
 
     def delete(self, uuid):
-        if uuid is None or uuid not in self.repo:
-            return False
-        del self.repo[uuid]
+        with self._lock:
+            if uuid is None or uuid not in self.repo:
+                return False
+            del self.repo[uuid]
         return True
 
     def locate(self, maximum_items, storage_status_mask,
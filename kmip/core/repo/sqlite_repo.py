@@ -0,0 +1,188 @@
+# Copyright (c) 2015 The Johns Hopkins University/Applied Physics Laboratory
+# All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import sqlite3
+import threading
+
+from kmip.core.attributes import UniqueIdentifier
+
+from kmip.core.enums import ObjectType
+from kmip.core.enums import Tags
+
+from kmip.core.factories.secrets import SecretFactory
+
+from kmip.core.objects import TemplateAttribute
+
+from kmip.core.repo.repo import ManagedObjectRepo
+
+from kmip.core.utils import BytearrayStream
+
+# The object type of each managed object, by the tag it is encoded with
+_OBJECT_TYPES = {
+    Tags.CERTIFICATE: ObjectType.CERTIFICATE,
+    Tags.SYMMETRIC_KEY: ObjectType.SYMMETRIC_KEY,
+    Tags.PUBLIC_KEY: ObjectType.PUBLIC_KEY,
+    Tags.PRIVATE_KEY: ObjectType.PRIVATE_KEY,
+    Tags.SPLIT_KEY: ObjectType.SPLIT_KEY,
+    Tags.TEMPLATE: ObjectType.TEMPLATE,
+    Tags.SECRET_DATA: ObjectType.SECRET_DATA,
+    Tags.OPAQUE_OBJECT: ObjectType.OPAQUE_DATA,
+}
+
+
+class SQLiteRepo(ManagedObjectRepo):
+    """
+    Stores managed objects in a SQLite database file.
+
+    Managed objects and their attributes are stored in their TTLV encodings.
+    The database may be shared by the threads and processes of several
+    servers, as SQLite locks the file for every write and UUIDs are assigned
+    by the database. Each thread uses its own connection, which is opened
+    when first needed, so the repository must be created after any fork of
+    the process that uses it.
+    """
+
+    TIMEOUT = 30
+
+    def __init__(self, path):
+        self.path = path
+        self._local = threading.local()
+        self._secret_factory = SecretFactory()
+
+        connection = self._connection()
+        with connection:
+            connection.execute(
+                'CREATE TABLE IF NOT EXISTS managed_objects ('
+                'uuid INTEGER PRIMARY KEY AUTOINCREMENT, '
+                'object_type INTEGER, '
+                'managed_object BLOB, '
+                'attributes BLOB)')
+
+    def save(self, managed_object, attributes):
+        object_type, encoding = self._encode_object(managed_object)
+        with self._connection() as connection:
+            cursor = connection.execute(
+                'INSERT INTO managed_objects '
+                '(object_type, managed_object, attributes) VALUES (?, ?, ?)',
+                (object_type, encoding, self._encode_attributes(attributes)))
+        return "{0}".format(cursor.lastrowid)
+
+    def get(self, uuid):
+        row_id = self._row_id(uuid)
+        if row_id is None:
+            return (None, None)
+
+        row = self._connection().execute(
+            'SELECT object_type, managed_object, attributes '
+            'FROM managed_objects WHERE uuid = ?', (row_id, )).fetchone()
+        if row is None:
+            return (None, None)
+
+        object_type, encoding, attributes = row
+        return (self._decode_object(object_type, encoding),
+                self._decode_attributes(attributes))
+
+    def update(self, uuid, managed_object, attributes):
+        row_id = self._row_id(uuid)
+        if row_id is None:
+            return False
+
+        object_type, encoding = self._encode_object(managed_object)
+        with self._connection() as connection:
+            cursor = connection.execute(
+                'UPDATE managed_objects '
+                'SET object_type = ?, managed_object = ?, attributes = ? '
+                'WHERE uuid = ?',
+                (object_type, encoding, self._encode_attributes(attributes),
+                 row_id))
+        return cursor.rowcount > 0
+
+    def delete(self, uuid):
+        row_id = self._row_id(uuid)
+        if row_id is None:
+            return False
+
+        with self._connection() as connection:
+            cursor = connection.execute(
+                'DELETE FROM managed_objects WHERE uuid = ?', (row_id, ))
+        return cursor.rowcount > 0
+
+    def locate(self, maximum_items, storage_status_mask,
+               object_group_member, attributes):
+        # Attributes are stored in their encodings, which SQLite cannot
+        # search, so the attributes of each object are decoded and compared
+        # with the requested ones in turn. Objects have no storage status or
+        # group here, so those criteria are not used.
+        requested = set(self._attribute_key(attribute)
+                        for attribute in attributes or ())
+        limit = None if maximum_items is None else maximum_items.value
+
+        uuids = list()
+        rows = self._connection().execute(
+            'SELECT uuid, attributes FROM managed_objects ORDER BY uuid')
+        for row_id, encoding in rows:
+            if limit is not None and len(uuids) >= limit:
+                break
+            stored = set(self._attribute_key(attribute)
+                         for attribute in self._decode_attributes(encoding))
+            if requested <= stored:
+                uuids.append(UniqueIdentifier("{0}".format(row_id)))
+        return uuids
+
+    def _connection(self):
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=self.TIMEOUT)
+            connection.execute('PRAGMA journal_mode=WAL')
+            self._local.connection = connection
+        return connection
+
+    def _row_id(self, uuid):
+        try:
+            return int(uuid)
+        except (TypeError, ValueError):
+            return None
+
+    def _encode_object(self, managed_object):
+        if managed_object is None:
+            return (None, None)
+
+        stream = BytearrayStream()
+        managed_object.write(stream)
+        return (_OBJECT_TYPES[managed_object.tag].value,
+                stream.getbuffer())
+
+    def _decode_object(self, object_type, encoding):
+        if encoding is None:
+            return None
+
+        managed_object = self._secret_factory.create(ObjectType(object_type))
+        managed_object.read(BytearrayStream(encoding))
+        return managed_object
+
+    def _encode_attributes(self, attributes):
+        stream = BytearrayStream()
+        TemplateAttribute(attributes=list(attributes)).write(stream)
+        return stream.getbuffer()
+
+    def _attribute_key(self, attribute):
+        stream = BytearrayStream()
+        attribute.attribute_value.write(stream)
+        return (attribute.attribute_name.value, stream.buffer)
+
+    def _decode_attributes(self, encoding):
+        template_attribute = TemplateAttribute()
+        template_attribute.read(BytearrayStream(encoding))
+        return template_attribute.attributes
@@ -0,0 +1,159 @@
+# Copyright (c) 2015 The Johns Hopkins University/Applied Physics Laboratory
+# All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+from kmip.core.utils import BytearrayStream
+
+from kmip.core import validation
+
+
+class Field(object):
+    """
+    A declarative description of one field of a KMIP Struct.
+
+    Attributes:
+        name: The name of the Struct attribute holding the field value.
+        tag: The Tags enumeration of the field, used to detect optional and
+            repeated fields in an encoding. May be None for a required field.
+        cls: The class of the field value; instantiated without arguments
+            when the field is decoded.
+        optional: True if the field may be absent from the encoding.
+        repeated: True if the field holds a list of zero or more values.
+        factory: A callable taking the Struct being decoded and returning a
+            new field value, used instead of cls when the class of the value
+            depends on fields decoded earlier.
+    """
+
+    def __init__(self, name, tag, cls=None, optional=False, repeated=False,
+                 factory=None):
+        if cls is None and factory is None:
+            raise ValueError(
+                "field {0} requires a class or a factory".format(name))
+        if optional and repeated:
+            raise ValueError(
+                "field {0} cannot be both optional and repeated".format(name))
+        if tag is None and (optional or repeated):
+            raise ValueError(
+                "field {0} requires a tag to detect its presence".format(name))
+
+        self.name = name
+        self.tag = tag
+        self.cls = cls
+        self.optional = optional
+        self.repeated = repeated
+        self.factory = factory
+
+
+def _compile_field_reader(field):
+    name = field.name
+    tag = field.tag
+
+    if field.factory is not None:
+        create = field.factory
+    else:
+        cls = field.cls
+
+        def create(struct):
+            return cls()
+
+    if field.repeated:
+        def read_field(struct, tstream):
+            values = []
+            while struct.is_tag_next(tag, tstream):
+                value = create(struct)
+                value.read(tstream)
+                values.append(value)
+            setattr(struct, name, values)
+    elif field.optional:
+        def read_field(struct, tstream):
+            if struct.is_tag_next(tag, tstream):
+                value = create(struct)
+                value.read(tstream)
+                setattr(struct, name, value)
+    else:
+        def read_field(struct, tstream):
+            value = create(struct)
+            value.read(tstream)
+            setattr(struct, name, value)
+
+    return read_field
+
+
+def _compile_field_writer(field):
+    name = field.name
+
+    if field.repeated:
+        def write_field(struct, ostream):
+            for value in getattr(struct, name) or ():
+                value.write(ostream)
+    elif field.optional:
+        def write_field(struct, ostream):
+            value = getattr(struct, name)
+            if value is not None:
+                value.write(ostream)
+    else:
+        def write_field(struct, ostream):
+            getattr(struct, name).write(ostream)
+
+    return write_field
+
+
+def codec(struct_class):
+    """
+    Compile the FIELDS of a Struct subclass into its read and write methods.
+
+    Used as a class decorator, so the codec is built once at import time. The
+    fields are decoded and encoded in the order they are declared; a read
+    leaves absent optional fields untouched and a write skips optional fields
+    set to None. A read finishes by checking the encoding for leftover bytes
+    and validating the Struct, like the hand-written codecs do.
+
+    Args:
+        struct_class (class): A Struct subclass with a FIELDS sequence of
+            Field objects.
+
+    Returns:
+        class: The same class, with read and write replaced.
+    """
+    fields = tuple(struct_class.FIELDS)
+    readers = tuple(_compile_field_reader(field) for field in fields)
+    writers = tuple(_compile_field_writer(field) for field in fields)
+
+    def read(self, istream):
+        super(struct_class, self).read(istream)
+        tstream = BytearrayStream(istream.read_view(self.length))
+
+        for read_field in readers:
+            read_field(self, tstream)
+
+        self.is_oversized(tstream)
+        validation.validate_decoded(self)
+
+    def write(self, ostream):
+        start = self.reserve_header(ostream)
+
+        for write_field in writers:
+            write_field(self, ostream)
+
+        self.patch_header(ostream, start)
+
+    read.__doc__ = "Decode the {0} fields from istream.".format(
+        struct_class.__name__)
+    write.__doc__ = "Encode the {0} fields to ostream.".format(
+        struct_class.__name__)
+
+    struct_class.FIELDS = fields
+    struct_class.read = read
+    struct_class.write = write
+    return struct_class
@@ -16,6 +16,7 @@
 from kmip.core.attributes import CertificateType
 
 from kmip.core import enums
+from kmip.core import validation
 from kmip.core.enums import Tags
 
 from kmip.core.misc import CertificateValue
@@ -79,7 +80,7 @@ class Certificate(Struct):
                 supporting a read method; usually a BytearrayStream object.
         """
         super(Certificate, self).read(istream)
-        tstream = BytearrayStream(istream.read(self.length))
+        tstream = BytearrayStream(istream.read_view(self.length))
 
         self.certificate_type = CertificateType()
         self.certificate_value = CertificateValue()
@@ -97,14 +98,12 @@ class Certificate(Struct):
             ostream (Stream): A data stream in which to encode object data,
                 supporting a write method; usually a BytearrayStream object.
         """
-        tstream = BytearrayStream()
+        start = self.reserve_header(ostream)
 
-        self.certificate_type.write(tstream)
-        self.certificate_value.write(tstream)
+        self.certificate_type.write(ostream)
+        self.certificate_value.write(ostream)
 
-        self.length = tstream.length()
-        super(Certificate, self).write(ostream)
-        ostream.write(tstream.buffer)
+        self.patch_header(ostream, start)
 
     def __eq__(self, other):
         if isinstance(other, Certificate):
@@ -139,27 +138,25 @@ class KeyBlockKey(Struct):
     def __init__(self, key_block=None, tag=Tags.DEFAULT):
         super(KeyBlockKey, self).__init__(tag)
         self.key_block = key_block
-        self.validate()
+        validation.validate_created(self)
 
     def read(self, istream):
         super(KeyBlockKey, self).read(istream)
-        tstream = BytearrayStream(istream.read(self.length))
+        tstream = BytearrayStream(istream.read_view(self.length))
 
         self.key_block = KeyBlock()
         self.key_block.read(tstream)
 
         self.is_oversized(tstream)
-        self.validate()
+        validation.validate_decoded(self)
 
     def write(self, ostream):
-        tstream = BytearrayStream()
+        start = self.reserve_header(ostream)
 
-        self.key_block.write(tstream)
+        self.key_block.write(ostream)
 
         # Write the length and value of the template attribute
-        self.length = tstream.length()
-        super(KeyBlockKey, self).write(ostream)
-        ostream.write(tstream.buffer)
+        self.patch_header(ostream, start)
 
     def validate(self):
         self.__validate()
@@ -173,7 +170,7 @@ class SymmetricKey(KeyBlockKey):
 
     def __init__(self, key_block=None):
         super(SymmetricKey, self).__init__(key_block, Tags.SYMMETRIC_KEY)
-        self.validate()
+        validation.validate_created(self)
 
     def validate(self):
         self.__validate()
@@ -188,7 +185,7 @@ class PublicKey(KeyBlockKey):
 
     def __init__(self, key_block=None):
         super(PublicKey, self).__init__(key_block, Tags.PUBLIC_KEY)
-        self.validate()
+        validation.validate_created(self)
 
     def validate(self):
         self.__validate()
@@ -203,7 +200,7 @@ class PrivateKey(KeyBlockKey):
 
     def __init__(self, key_block=None):
         super(PrivateKey, self).__init__(key_block, Tags.PRIVATE_KEY)
-        self.validate()
+        validation.validate_created(self)
 
     def validate(self):
         self.__validate()
@@ -261,11 +258,11 @@ class SplitKey(Struct):
         self.split_key_method = split_key_method
         self.prime_field_size = prime_field_size
         self.key_block = key_block
-        self.validate()
+        validation.validate_created(self)
 
     def read(self, istream):
         super(SplitKey, self).read(istream)
-        tstream = BytearrayStream(istream.read(self.length))
+        tstream = BytearrayStream(istream.read_view(self.length))
 
         self.split_key_parts = SplitKey.SplitKeyParts()
         self.split_key_parts.read(tstream)
@@ -284,25 +281,23 @@ class SplitKey(Struct):
         self.key_block.read(tstream)
 
         self.is_oversized(tstream)
-        self.validate()
+        validation.validate_decoded(self)
 
     def write(self, ostream):
-        tstream = BytearrayStream()
+        start = self.reserve_header(ostream)
 
-        self.split_key_parts.write(tstream)
-        self.key_part_identifier.write(tstream)
-        self.split_key_threshold.write(tstream)
-        self.split_key_method.write(tstream)
+        self.split_key_parts.write(ostream)
+        self.key_part_identifier.write(ostream)
+        self.split_key_threshold.write(ostream)
+        self.split_key_method.write(ostream)
 
         if self.prime_field_size is not None:
-            self.prime_field_size.write(tstream)
+            self.prime_field_size.write(ostream)
 
-        self.key_block.write(tstream)
+        self.key_block.write(ostream)
 
         # Write the length and value of the template attribute
-        self.length = tstream.length()
-        super(SplitKey, self).write(ostream)
-        ostream.write(tstream.buffer)
+        self.patch_header(ostream, start)
 
     def validate(self):
         self.__validate()
@@ -318,11 +313,11 @@ class Template(Struct):
     def __init__(self, attributes=None):
         super(Template, self).__init__(Tags.TEMPLATE)
         self.attributes = attributes
-        self.validate()
+        validation.validate_created(self)
 
     def read(self, istream):
         super(Template, self).read(istream)
-        tstream = BytearrayStream(istream.read(self.length))
+        tstream = BytearrayStream(istream.read_view(self.length))
 
         self.attributes = list()
 
@@ -336,18 +331,16 @@ class Template(Struct):
             self.attributes.append(attribute)
 
         self.is_oversized(tstream)
-        self.validate()
+        validation.validate_decoded(self)
 
     def write(self, ostream):
-        tstream = BytearrayStream()
+        start = self.reserve_header(ostream)
 
         for attribute in self.attributes:
-            attribute.write(tstream)
+            attribute.write(ostream)
 
         # Write the length and value of the template attribute
-        self.length = tstream.length()
-        super(Template, self).write(ostream)
-        ostream.write(tstream.buffer)
+        self.patch_header(ostream, start)
 
     def validate(self):
         self.__validate()
@@ -373,11 +366,11 @@ class SecretData(Struct):
         super(SecretData, self).__init__(Tags.SECRET_DATA)
         self.secret_data_type = secret_data_type
         self.key_block = key_block
-        self.validate()
+        validation.validate_created(self)
 
     def read(self, istream):
         super(SecretData, self).read(istream)
-        tstream = BytearrayStream(istream.read(self.length))
+        tstream = BytearrayStream(istream.read_view(self.length))
 
         self.secret_data_type = SecretData.SecretDataType()
         self.key_block = KeyBlock()
@@ -386,18 +379,16 @@ class SecretData(Struct):
         self.key_block.read(tstream)
 
         self.is_oversized(tstream)
-        self.validate()
+        validation.validate_decoded(self)
 
     def write(self, ostream):
-        tstream = BytearrayStream()
+        start = self.reserve_header(ostream)
 
-        self.secret_data_type.write(tstream)
-        self.key_block.write(tstream)
+        self.secret_data_type.write(ostream)
+        self.key_block.write(ostream)
 
         # Write the length and value of the template attribute
-        self.length = tstream.length()
-        super(SecretData, self).write(ostream)
-        ostream.write(tstream.buffer)
+        self.patch_header(ostream, start)
 
     def validate(self):
         self.__validate()
@@ -429,11 +420,11 @@ class OpaqueObject(Struct):
         super(OpaqueObject, self).__init__(Tags.OPAQUE_OBJECT)
         self.opaque_data_type = opaque_data_type
         self.opaque_data_value = opaque_data_value
-        self.validate()
+        validation.validate_created(self)
 
     def read(self, istream):
         super(OpaqueObject, self).read(istream)
-        tstream = BytearrayStream(istream.read(self.length))
+        tstream = BytearrayStream(istream.read_view(self.length))
 
         self.opaque_data_type = OpaqueObject.OpaqueDataType()
         self.opaque_data_value = OpaqueObject.OpaqueDataValue()
@@ -442,18 +433,16 @@ class OpaqueObject(Struct):
         self.opaque_data_value.read(tstream)
 
         self.is_oversized(tstream)
-        self.validate()
+        validation.validate_decoded(self)
 
     def write(self, ostream):
-        tstream = BytearrayStream()
+        start = self.reserve_header(ostream)
 
-        self.opaque_data_type.write(tstream)
-        self.opaque_data_value.write(tstream)
+        self.opaque_data_type.write(ostream)
+        self.opaque_data_value.write(ostream)
 
         # Write the length and value of the template attribute
-        self.length = tstream.length()
-        super(OpaqueObject, self).write(ostream)
-        ostream.write(tstream.buffer)
+        self.patch_header(ostream, start)
 
     def validate(self):
         self.__validate()
@@ -88,13 +88,17 @@ class KMIP(object):
 
 class KMIPImpl(KMIP):
 
-    def __init__(self):
+    def __init__(self, repo=None):
         super(KMIPImpl, self).__init__()
         self.logger = logging.getLogger(__name__)
         self.key_factory = KeyFactory()
         self.secret_factory = SecretFactory()
         self.attribute_factory = AttributeFactory()
-        self.repo = MemRepo()
+
+        # Requests may be handled by several threads at once. The factories
+        # are stateless, and the repository serializes access to the stored
+        # objects, so no further locking is needed here.
+        self.repo = MemRepo() if repo is None else repo
 
     def create(self, object_type, template_attribute, credential=None):
         self.logger.debug('create() called')
@@ -0,0 +1,215 @@
+# Copyright (c) 2015 The Johns Hopkins University/Applied Physics Laboratory
+# All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""
+A generic decoder and encoder for TTLV encodings.
+
+The encoding is represented as a list of (tag, type, value) tuples, with the
+tag and type as the integer values of the Tags and Types enumerations. The
+value of a Structure is the list of its children, the value of a Text String
+is a text string, the values of Byte Strings and Big Integers are their raw
+bytes and the values of all other types are Python integers or booleans. No
+knowledge of operations or payloads is needed, so any traffic can be
+inspected, rewritten or routed, including operations without payload classes.
+"""
+
+import struct
+
+from kmip.core import errors
+from kmip.core.enums import Types
+
+_HEADER = struct.Struct('!II')
+_HEADER_SIZE = _HEADER.size
+_WORD = struct.Struct('!Q')
+
+_STRUCTURE = Types.STRUCTURE.value
+_BOOLEAN = Types.BOOLEAN.value
+_TEXT_STRING = Types.TEXT_STRING.value
+_BYTE_STRINGS = (Types.BYTE_STRING.value, Types.BIG_INTEGER.value)
+
+_FIXED = {
+    Types.INTEGER.value: struct.Struct('!i'),
+    Types.LONG_INTEGER.value: struct.Struct('!q'),
+    Types.ENUMERATION.value: struct.Struct('!I'),
+    Types.BOOLEAN.value: struct.Struct('!Q'),
+    Types.DATE_TIME.value: struct.Struct('!q'),
+    Types.INTERVAL.value: struct.Struct('!I'),
+}
+
+_PADDING = b'\x00' * 8
+
+
+def _decode(data, offset, end):
+    # Structures are decoded with an explicit stack rather than by recursion,
+    # so deeply nested input cannot exhaust the interpreter stack.
+    items = []
+    stack = []
+    unpack_header = _HEADER.unpack_from
+    unpack_word = _WORD.unpack_from
+
+    while True:
+        if offset >= end:
+            if not stack:
+                return items
+            items, end = stack.pop()
+            continue
+
+        if end - offset < _HEADER_SIZE:
+            raise errors.ReadValueError(
+                'TTLV', 'header', '{0} bytes'.format(_HEADER_SIZE),
+                '{0} bytes'.format(end - offset))
+
+        tag_type, length = unpack_header(data, offset)
+        tag = tag_type >> 8
+        typ = tag_type & 0xff
+        offset += _HEADER_SIZE
+
+        if typ == _STRUCTURE:
+            padded = length
+        else:
+            padded = (length + 7) & ~7
+        if end - offset < padded:
+            raise errors.ReadValueError(
+                'TTLV', 'value', '{0} bytes'.format(padded),
+                '{0} bytes'.format(end - offset))
+
+        if typ == _STRUCTURE:
+            children = []
+            items.append((tag, typ, children))
+            stack.append((items, end))
+            items, end = children, offset + length
+            continue
+        elif typ in _FIXED:
+            fixed = _FIXED[typ]
+            if length != fixed.size:
+                raise errors.ReadValueError(
+                    'TTLV', 'length', fixed.size, length)
+            value = fixed.unpack_from(data, offset)[0]
+            if typ == _BOOLEAN:
+                if value > 1:
+                    raise errors.ReadValueError(
+                        'TTLV', 'value', '0 or 1', value)
+                value = value == 1
+        elif typ == _TEXT_STRING:
+            try:
+                value = data[offset:offset + length].tobytes().decode('utf-8')
+            except UnicodeDecodeError as e:
+                raise errors.ReadValueError(
+                    'TTLV', 'value', 'UTF-8 text', str(e))
+        elif typ in _BYTE_STRINGS:
+            value = data[offset:offset + length].tobytes()
+        else:
+            raise errors.ReadValueError('TTLV', 'type', 'a valid type', typ)
+
+        # The padding is the low end of the last word of the value
+        if padded != length and unpack_word(data, offset + padded - 8)[0] & (
+                (1 << ((padded - length) << 3)) - 1):
+            raise errors.ReadValueError(
+                'TTLV', 'padding', 'zero bytes',
+                data[offset + length:offset + padded].tobytes())
+
+        items.append((tag, typ, value))
+        offset += padded
+
+
+def decode(data):
+    """
+    Decode a TTLV encoding into a list of (tag, type, value) tuples.
+
+    Args:
+        data (bytes): The encoding; any object supporting the buffer
+            protocol, such as a bytearray or memoryview, is accepted.
+
+    Returns:
+        list: The top-level items of the encoding, usually a single message.
+
+    Raises:
+        ReadValueError: if the encoding is truncated, uses an unknown type,
+            has an invalid length for a fixed-size type, holds a Boolean
+            other than 0 or 1 or a Text String that is not valid UTF-8, or
+            pads a value with non-zero bytes.
+    """
+    # The encoding is read in place; only the values are copied out of it
+    data = memoryview(data)
+    if data.format != 'B':
+        data = data.cast('B')
+    return _decode(data, 0, len(data))
+
+
+def _encode(items, out):
+    # As in _decode, nested Structures are kept on an explicit stack; the
+    # header of a Structure is packed once all of its children are written.
+    pack_header = _HEADER.pack_into
+    stack = []
+    items = iter(items)
+
+    while True:
+        item = next(items, None)
+        if item is None:
+            if not stack:
+                return
+            items, start, tag_type = stack.pop()
+            pack_header(out, start, tag_type, len(out) - start - _HEADER_SIZE)
+            continue
+
+        tag, typ, value = item
+        tag = getattr(tag, 'value', tag)
+        typ = getattr(typ, 'value', typ)
+        start = len(out)
+        out += _PADDING
+
+        if typ == _STRUCTURE:
+            stack.append((items, start, (tag << 8) | typ))
+            items = iter(value)
+            continue
+
+        if typ in _FIXED:
+            try:
+                data = _FIXED[typ].pack(int(value))
+            except struct.error:
+                raise errors.WriteValueError('TTLV', 'value', value)
+        elif typ == _TEXT_STRING:
+            data = value.encode('utf-8')
+        elif typ in _BYTE_STRINGS:
+            data = bytes(value)
+        else:
+            raise errors.WriteValueError('TTLV', 'type', typ)
+        length = len(data)
+        out += data
+        out += _PADDING[:-length % 8]
+
+        pack_header(out, start, (tag << 8) | typ, length)
+
+
+def encode(items):
+    """
+    Encode a list of (tag, type, value) tuples into a TTLV encoding.
+
+    The tags and types may be given as integers or as Tags and Types
+    enumerations. Decoding the result with decode returns the same items.
+
+    Args:
+        items (list): The top-level items to encode.
+
+    Returns:
+        bytes: The encoding of the items.
+
+    Raises:
+        WriteValueError: if an item uses an unknown type or a value out of
+            range for its type.
+    """
+    out = bytearray()
+    _encode(items, out)
+    return bytes(out)
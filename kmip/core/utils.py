@@ -64,61 +64,191 @@ def build_er_error(class_object, descriptor, expected, received,
 
 
 class BytearrayStream(io.RawIOBase):
-    def __init__(self, data=None):
+    """
+    A byte stream used to hold, produce, and consume TTLV encodings.
+
+    Reads are served from a single buffer by advancing a cursor, so consuming
+    an encoding never copies the unread remainder of the stream. Nested
+    structures can be decoded from zero-copy views of the parent buffer, see
+    read_view.
+
+    Writes append to a bytearray that grows geometrically, so encoding a
+    message costs amortized constant time per written item. The encoding can
+    be handed off without a final copy, see getbuffer. Space can be reserved
+    and filled in once its contents are known, see reserve and patch; this
+    lets structures be encoded in a single pass.
+    """
+
+    MINIMUM_CAPACITY = 64
+
+    def __init__(self, data=None, size_hint=None):
+        """
+        Create a BytearrayStream.
+
+        Args:
+            data (bytes-like): The initial contents of the stream. A
+                memoryview is used as is, without copying. Optional, defaults
+                to None.
+            size_hint (int): The number of bytes expected to be written to
+                the stream, used to pre-size the write buffer. Optional,
+                defaults to None.
+        """
         if data is None:
-            self.buffer = bytes()
+            data = bytearray(size_hint or 0)
+            end = 0
         else:
-            self.buffer = bytes(data)
+            if not isinstance(data, memoryview):
+                data = bytes(data)
+            end = len(data)
+
+        self._data = data
+        self._view = memoryview(data)
+        self._offset = 0
+        self._end = end
+        self._discarded = 0
+
+    @property
+    def buffer(self):
+        return bytes(self._view[self._offset:self._end])
+
+    def getbuffer(self):
+        """
+        Get the unread contents of the stream without copying them.
+
+        The returned view remains valid after subsequent writes, but does not
+        reflect them.
+
+        Returns:
+            memoryview: A view of the unread bytes of the stream.
+        """
+        return self._view[self._offset:self._end]
+
+    def _advance(self, n):
+        start = self._offset
+        end = self._end
+        if n is not None and n >= 0 and start + n < end:
+            end = start + n
+        self._offset = end
+        return self._view[start:end]
 
     def read(self, n=None):
         if n is None or n == -1:
             return self.readall()
-        length = len(self.buffer)
-        if n > length:
-            n = length
-        data = self.buffer[0:n]
-        self.buffer = self.buffer[n:]
-        return data
+        return bytes(self._advance(n))
+
+    def read_view(self, n=None):
+        """
+        Read up to n bytes from the stream without copying them.
+
+        Args:
+            n (int): The number of bytes to read. Optional, defaults to None,
+                reading the remainder of the stream.
+
+        Returns:
+            memoryview: A read-only view of the bytes read, backed by the
+                buffer of this stream.
+        """
+        return self._advance(n)
 
     def readall(self):
-        data = self.buffer
-        self.buffer = bytes()
-        return data
+        return bytes(self._advance(None))
 
     # TODO (peter-hamilton) Unused, add documentation or cut.
     def readinto(self, b):
-        if len(b) <= len(self.buffer):
-            num_bytes_to_read = len(b)
-        else:
-            num_bytes_to_read = len(self.buffer)
-        b[:num_bytes_to_read] = self.buffer[:num_bytes_to_read]
-        self.buffer = self.buffer[num_bytes_to_read:]
+        data = self._advance(len(b))
+        num_bytes_to_read = len(data)
+        b[:num_bytes_to_read] = data
         return num_bytes_to_read
 
     def peek(self, n=None):
-        length = len(self.buffer)
-        if n is None or n > length:
-            n = length
-        return self.buffer[0:n]
+        start = self._offset
+        end = self._end
+        if n is not None and start + n < end:
+            end = start + n
+        return bytes(self._view[start:end])
+
+    def _ensure_capacity(self, n):
+        # Replace, rather than resize, the buffer when growing it so that
+        # views handed out by read_view and getbuffer are never invalidated.
+        required = self._end + n
+        if isinstance(self._data, bytearray) and required <= len(self._data):
+            return
+
+        unread = self._end - self._offset
+        capacity = max(
+            self.MINIMUM_CAPACITY,
+            2 * len(self._data),
+            unread + n
+        )
+        data = bytearray(capacity)
+        data[:unread] = self._view[self._offset:self._end]
+
+        self._data = data
+        self._view = memoryview(data)
+        self._discarded += self._offset
+        self._offset = 0
+        self._end = unread
 
     def write(self, b):
-        prev_bytes = len(self.buffer)
-        self.buffer += b
-        return len(self.buffer) - prev_bytes
+        n = len(b)
+        self._ensure_capacity(n)
+        self._data[self._end:self._end + n] = b
+        self._end += n
+        return n
+
+    def tell(self):
+        """
+        Get the position of the next write, counted from the start of the
+        stream.
+        """
+        return self._discarded + self._end
+
+    def reserve(self, n):
+        """
+        Write n zero bytes to the stream, to be filled in later by patch.
+
+        Args:
+            n (int): The number of bytes to reserve.
+
+        Returns:
+            int: The position of the reserved bytes in the stream.
+        """
+        position = self.tell()
+        self.write(b'\x00' * n)
+        return position
+
+    def patch(self, position, b):
+        """
+        Overwrite bytes previously written to the stream.
+
+        Args:
+            position (int): The position of the bytes to overwrite, usually
+                obtained from reserve or tell.
+            b (bytes-like): The replacement bytes.
+
+        Raises:
+            ValueError: if the bytes to overwrite have already been read or
+                have not been written yet.
+        """
+        start = position - self._discarded
+        end = start + len(b)
+        if start < self._offset or end > self._end:
+            raise ValueError(
+                "cannot patch bytes outside of the unread stream contents")
+        self._data[start:end] = b
 
     def length(self):
-        return len(self.buffer)
+        return self._end - self._offset
 
     def __str__(self):
-        sbuffer = bytes(self.buffer[0:])
-        return str(hexlify(sbuffer))
+        return str(hexlify(self.buffer))
 
     def __len__(self):
-        return len(self.buffer)
+        return self.length()
 
     def __eq__(self, other):
         if isinstance(other, BytearrayStream):
-            if len(self.buffer) != len(other.buffer):
+            if self.length() != other.length():
                 return False
             elif self.buffer != other.buffer:
                 return False
@@ -0,0 +1,107 @@
+# Copyright (c) 2015 The Johns Hopkins University/Applied Physics Laboratory
+# All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""
+The validation policy applied by encodeable objects.
+
+Objects validate their state when they are created and again after they are
+read from an encoding. Objects built by trusted code, such as server
+responses, can skip the first kind of validation, while encodings received
+from peers stay validated. The policy is set for the whole process with
+set_level, and can be overridden for the current thread with level.
+"""
+
+import contextlib
+import threading
+
+from enum import Enum
+
+
+class ValidationLevel(Enum):
+    # Validate objects when created and after they are read
+    STRICT = 'strict'
+    # Validate objects only after they are read
+    DECODE_ONLY = 'decode-only'
+    # Never validate objects implicitly
+    OFF = 'off'
+
+
+_default_level = ValidationLevel.STRICT
+_local = threading.local()
+
+
+def get_level():
+    """
+    Return the validation level applied in the current thread.
+    """
+    return getattr(_local, 'level', _default_level)
+
+
+def set_level(validation_level):
+    """
+    Set the validation level applied by default in every thread.
+
+    Args:
+        validation_level (ValidationLevel): The new default level.
+
+    Raises:
+        TypeError: if the level is not a ValidationLevel.
+    """
+    global _default_level
+
+    if not isinstance(validation_level, ValidationLevel):
+        raise TypeError('validation level must be a ValidationLevel')
+    _default_level = validation_level
+
+
+@contextlib.contextmanager
+def level(validation_level):
+    """
+    Apply a validation level in the current thread within a with block.
+
+    Args:
+        validation_level (ValidationLevel): The level to apply.
+
+    Raises:
+        TypeError: if the level is not a ValidationLevel.
+    """
+    if not isinstance(validation_level, ValidationLevel):
+        raise TypeError('validation level must be a ValidationLevel')
+
+    previous = getattr(_local, 'level', None)
+    _local.level = validation_level
+    try:
+        yield
+    finally:
+        if previous is None:
+            del _local.level
+        else:
+            _local.level = previous
+
+
+def validate_created(obj):
+    """
+    Validate a newly created object, unless the policy skips it.
+    """
+    if getattr(_local, 'level', _default_level) is ValidationLevel.STRICT:
+        obj.validate()
+
+
+def validate_decoded(obj):
+    """
+    Validate an object read from an encoding, unless the policy skips it.
+    """
+    if getattr(_local, 'level', _default_level) is not ValidationLevel.OFF:
+        obj.validate()
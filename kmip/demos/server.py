@@ -0,0 +1,89 @@
+# Copyright (c) 2015 The Johns Hopkins University/Applied Physics Laboratory
+# All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+from kmip.services.kmip_supervisor import KMIPServerSupervisor
+
+import logging
+import optparse
+import os
+import sys
+
+
+def build_cli_parser():
+    # Build the argument parser and setup expected options
+    parser = optparse.OptionParser(
+        usage="%prog [options]",
+        description="Run a KMIP server")
+
+    parser.add_option(
+        "-n",
+        "--host",
+        action="store",
+        type="str",
+        default=None,
+        dest="host",
+        help="Hostname or IP address the server listens on")
+    parser.add_option(
+        "-p",
+        "--port",
+        action="store",
+        type="int",
+        default=None,
+        dest="port",
+        help="Port number the server listens on")
+    parser.add_option(
+        "-d",
+        "--database",
+        action="store",
+        type="str",
+        default=None,
+        dest="database",
+        help="SQLite database file storing the managed objects, shared by "
+             "the server processes")
+    parser.add_option(
+        "-P",
+        "--processes",
+        action="store",
+        type="int",
+        default=None,
+        dest="processes",
+        help="Number of server processes")
+
+    return parser
+
+
+if __name__ == '__main__':
+    # Build and parse arguments
+    parser = build_cli_parser()
+    opts, args = parser.parse_args(sys.argv[1:])
+
+    # Build and setup logging
+    f_log = os.path.join(os.path.dirname(__file__), os.pardir,
+                         'logconfig.ini')
+    logging.config.fileConfig(f_log)
+    logger = logging.getLogger(__name__)
+
+    # The server processes are started, restarted and, on SIGTERM or
+    # interrupt, stopped by the supervisor
+    supervisor = KMIPServerSupervisor(
+        processes=opts.processes, host=opts.host, port=opts.port,
+        database=opts.database)
+    logger.info('Starting {0} KMIP server process(es)'.format(
+        supervisor.processes))
+    try:
+        supervisor.serve()
+    except KeyboardInterrupt:
+        pass
+    logger.info('KMIP server stopped')
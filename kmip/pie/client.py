@@ -82,6 +82,7 @@ class ProxyKmipClient(api.KmipClient):
 
         self.attribute_factory = attributes.AttributeFactory()
         self.object_factory = factory.ObjectFactory()
+        self._key_attributes = dict()
 
         # TODO (peter-hamilton) Consider adding validation checks for inputs.
         self.proxy = KMIPProxy(
@@ -344,19 +345,33 @@ class ProxyKmipClient(api.KmipClient):
             raise exceptions.KmipOperationFailure(status, reason, message)
 
     def _build_key_attributes(self, algorithm, length):
-        # Build a list of core key attributes.
-        algorithm_attribute = self.attribute_factory.create_attribute(
-            enums.AttributeType.CRYPTOGRAPHIC_ALGORITHM,
-            algorithm)
-        length_attribute = self.attribute_factory.create_attribute(
-            enums.AttributeType.CRYPTOGRAPHIC_LENGTH,
-            length)
-        mask_attribute = self.attribute_factory.create_attribute(
-            enums.AttributeType.CRYPTOGRAPHIC_USAGE_MASK,
-            [enums.CryptographicUsageMask.ENCRYPT,
-             enums.CryptographicUsageMask.DECRYPT])
-
-        return [algorithm_attribute, length_attribute, mask_attribute]
+        # Build a list of core key attributes. The same few algorithm and
+        # length pairs are used repeatedly, so the attributes are frozen and
+        # reused to avoid encoding them again for every request. The shared
+        # attributes must not be changed; any change thaws the attribute, and
+        # a set holding a thawed attribute is rebuilt rather than reused, so
+        # the change never reaches a later request.
+        key_attributes = self._key_attributes.get((algorithm, length))
+        if key_attributes is None or not all(
+                attribute.is_frozen() for attribute in key_attributes):
+            algorithm_attribute = self.attribute_factory.create_attribute(
+                enums.AttributeType.CRYPTOGRAPHIC_ALGORITHM,
+                algorithm)
+            length_attribute = self.attribute_factory.create_attribute(
+                enums.AttributeType.CRYPTOGRAPHIC_LENGTH,
+                length)
+            mask_attribute = self.attribute_factory.create_attribute(
+                enums.AttributeType.CRYPTOGRAPHIC_USAGE_MASK,
+                [enums.CryptographicUsageMask.ENCRYPT,
+                 enums.CryptographicUsageMask.DECRYPT])
+
+            key_attributes = [
+                algorithm_attribute, length_attribute, mask_attribute]
+            for attribute in key_attributes:
+                attribute.freeze()
+            self._key_attributes[(algorithm, length)] = key_attributes
+
+        return list(key_attributes)
 
     def __enter__(self):
         self.open()
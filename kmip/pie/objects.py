@@ -218,7 +218,7 @@ class SymmetricKey(Key):
             algorithm(CryptographicAlgorithm): An enumeration identifying the
                 type of algorithm for the key.
             length(int): The length in bits of the key.
-            value(bytes): The bytes representing the key.
+            value(bytes|memoryview): The bytes representing the key.
             masks(list): A list of CryptographicUsageMask enumerations defining
                 how the key will be used. Optional, defaults to None.
             name(string): The string name of the key. Optional, defaults to
@@ -257,7 +257,7 @@ class SymmetricKey(Key):
             TypeError: if the types of any SymmetricKey attributes are invalid
             ValueError: if the key length and key value length do not match
         """
-        if not isinstance(self.value, bytes):
+        if not isinstance(self.value, (bytes, memoryview)):
             raise TypeError("key value must be bytes")
         elif not isinstance(self.cryptographic_algorithm,
                             enums.CryptographicAlgorithm):
@@ -348,7 +348,7 @@ class PublicKey(Key):
             algorithm(CryptographicAlgorithm): An enumeration identifying the
                 type of algorithm for the key.
             length(int): The length in bits of the key.
-            value(bytes): The bytes representing the key.
+            value(bytes|memoryview): The bytes representing the key.
             format_type(KeyFormatType): An enumeration defining the format of
                 the key value. Optional, defaults to enums.KeyFormatType.X_509.
             masks(list): A list of CryptographicUsageMask enumerations
@@ -391,7 +391,7 @@ class PublicKey(Key):
         Raises:
             TypeError: if the types of any PublicKey attributes are invalid.
         """
-        if not isinstance(self.value, bytes):
+        if not isinstance(self.value, (bytes, memoryview)):
             raise TypeError("key value must be bytes")
         elif not isinstance(self.cryptographic_algorithm,
                             enums.CryptographicAlgorithm):
@@ -489,7 +489,7 @@ class PrivateKey(Key):
             algorithm(CryptographicAlgorithm): An enumeration identifying the
                 type of algorithm for the key.
             length(int): The length in bits of the key.
-            value(bytes): The bytes representing the key.
+            value(bytes|memoryview): The bytes representing the key.
             format_type(KeyFormatType): An enumeration defining the format of
                 the key value.
             masks(list): A list of CryptographicUsageMask enumerations
@@ -531,7 +531,7 @@ class PrivateKey(Key):
         Raises:
             TypeError: if the types of any PrivateKey attributes are invalid.
         """
-        if not isinstance(self.value, bytes):
+        if not isinstance(self.value, (bytes, memoryview)):
             raise TypeError("key value must be bytes")
         elif not isinstance(self.cryptographic_algorithm,
                             enums.CryptographicAlgorithm):
@@ -626,7 +626,7 @@ class Certificate(CryptographicObject):
         Args:
             certificate_type(CertificateType): An enumeration defining the
                 type of the certificate.
-            value(bytes): The bytes representing the certificate.
+            value(bytes|memoryview): The bytes representing the certificate.
             masks(list): A list of CryptographicUsageMask enumerations
                 defining how the certificate will be used.
             name(string): The string name of the certificate.
@@ -664,7 +664,7 @@ class Certificate(CryptographicObject):
         Raises:
             TypeError: if the types of any Certificate attributes are invalid.
         """
-        if not isinstance(self.value, bytes):
+        if not isinstance(self.value, (bytes, memoryview)):
             raise TypeError("certificate value must be bytes")
         elif not isinstance(self.certificate_type,
                             enums.CertificateTypeEnum):
@@ -714,7 +714,7 @@ class X509Certificate(Certificate):
         Create an X509Certificate.
 
         Args:
-            value(bytes): The bytes representing the certificate.
+            value(bytes|memoryview): The bytes representing the certificate.
             masks(list): A list of CryptographicUsageMask enumerations
                 defining how the certificate will be used.
             name(string): The string name of the certificate.
@@ -774,7 +774,7 @@ class SecretData(CryptographicObject):
         Create a SecretData object.
 
         Args:
-            value(bytes): The bytes representing secret data.
+            value(bytes|memoryview): The bytes representing secret data.
             data_type(SecretDataType): An enumeration defining the type of the
                 secret value.
             masks(list): A list of CryptographicUsageMask enumerations
@@ -809,7 +809,7 @@ class SecretData(CryptographicObject):
         Raises:
             TypeError: if the types of any SecretData attributes are invalid.
         """
-        if not isinstance(self.value, bytes):
+        if not isinstance(self.value, (bytes, memoryview)):
             raise TypeError("secret value must be bytes")
         elif not isinstance(self.data_type, enums.SecretDataType):
             raise TypeError("secret data type must be a SecretDataType "
@@ -878,7 +878,7 @@ class OpaqueObject(ManagedObject):
         Create a OpaqueObject.
 
         Args:
-            value(bytes): The bytes representing opaque data.
+            value(bytes|memoryview): The bytes representing opaque data.
             opaque_type(OpaqueDataType): An enumeration defining the type of
                 the opaque value.
             name(string): The string name of the opaque object.
@@ -911,7 +911,7 @@ class OpaqueObject(ManagedObject):
         Raises:
             TypeError: if the types of any OpaqueObject attributes are invalid.
         """
-        if not isinstance(self.value, bytes):
+        if not isinstance(self.value, (bytes, memoryview)):
             raise TypeError("opaque value must be bytes")
         elif not isinstance(self.opaque_type, enums.OpaqueDataType):
             raise TypeError("opaque data type must be an OpaqueDataType "
@@ -0,0 +1,256 @@
+# Copyright (c) 2015 The Johns Hopkins University/Applied Physics Laboratory
+# All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+# The AsyncKMIPServer needs Python 3.7 or later, for async functions and
+# loop.start_tls; the rest of the package does not import this module.
+
+import asyncio
+import collections
+import logging
+import socket
+import time
+
+from concurrent import futures
+
+from kmip.services.kmip_protocol import KMIPFramer
+from kmip.services.kmip_server import KMIPServer
+
+
+class KMIPServerProtocol(asyncio.Protocol):
+    """
+    Serves the requests received on one connection to an AsyncKMIPServer.
+
+    Received data is split into messages by a KMIPFramer, and the messages
+    are processed one at a time, in the order received, by the executor of
+    the server. Reading is paused while a message is processed or while the
+    client is not reading its responses, so a client sending many requests
+    cannot make the server buffer them without bound.
+    """
+
+    def __init__(self, server):
+        self.logger = logging.getLogger(__name__)
+
+        self._server = server
+        self._handshake = None
+        self._raw_transport = None
+        self._framer = KMIPFramer(max_frame_size=server.max_frame_size)
+        self._frames = collections.deque()
+        self._transport = None
+        self._processing = False
+        self._writing_paused = False
+
+    def connection_made(self, transport):
+        if not self._server._add_connection(self):
+            transport.close()
+            return
+
+        # TLS is started by the protocol, rather than by the server, so the
+        # outcome of every handshake is known. Until the handshake is done,
+        # received messages are only queued, as the TLS transport used to
+        # answer them is not known yet.
+        self._raw_transport = transport
+        transport.pause_reading()
+        self._handshake = self._server.loop.create_task(
+            self._start_tls(transport))
+
+    async def _start_tls(self, transport):
+        server = self._server
+        start = time.monotonic()
+        try:
+            self._transport = await asyncio.wait_for(
+                server.loop.start_tls(
+                    transport, self, server.ssl_context, server_side=True),
+                server.handshake_timeout)
+        except asyncio.TimeoutError:
+            server.handshake_stats.record(
+                time.monotonic() - start,
+                socket.timeout('The handshake operation timed out'))
+            self._abort(transport)
+            return
+        except Exception as e:
+            server.handshake_stats.record(time.monotonic() - start, e)
+            self._abort(transport)
+            return
+
+        server.handshake_stats.record(time.monotonic() - start)
+        if self._raw_transport is None:
+            # The connection was lost as the handshake completed
+            self._transport.close()
+            self._transport = None
+            return
+        self._process_next()
+
+    def _abort(self, transport):
+        # The TLS transport is not always torn down with the connection, so
+        # the connection is released here
+        transport.close()
+        self.connection_lost(None)
+
+    def connection_lost(self, exc):
+        self._server._remove_connection(self)
+        self._transport = None
+        self._raw_transport = None
+        self._frames.clear()
+
+    def data_received(self, data):
+        try:
+            self._frames.extend(self._framer.feed(data))
+        except ValueError as e:
+            self.logger.error('KMIPServerProtocol {0} {1}'.format(type(e), e))
+            self.close()
+            return
+
+        self._process_next()
+
+    def pause_writing(self):
+        self._writing_paused = True
+        if self._transport is not None:
+            self._transport.pause_reading()
+
+    def resume_writing(self):
+        self._writing_paused = False
+        self._process_next()
+
+    def close(self):
+        if self._transport is not None:
+            self._transport.close()
+        elif self._raw_transport is not None:
+            self._raw_transport.close()
+
+    def _process_next(self):
+        if (self._processing or self._writing_paused or
+                self._transport is None):
+            return
+
+        if self._frames:
+            self._processing = True
+            self._transport.pause_reading()
+            future = self._server._process(self._frames.popleft())
+            future.add_done_callback(self._processed)
+        else:
+            self._transport.resume_reading()
+
+    def _processed(self, future):
+        self._processing = False
+        if self._transport is None or future.cancelled():
+            return
+
+        try:
+            response = future.result()
+        except Exception as e:
+            self.logger.error('KMIPServerProtocol {0} {1}'.format(type(e), e))
+            self._transport.close()
+            return
+
+        if response is not None:
+            self._transport.write(response)
+        self._process_next()
+
+
+class AsyncKMIPServer(KMIPServer):
+    """
+    A KMIP server serving all of its clients from one asyncio event loop.
+
+    Each connection costs a protocol object rather than a thread, so many
+    mostly idle clients can stay connected at little cost. The event loop
+    only handles TLS and the framing of messages; messages are decoded,
+    processed and encoded by a pool of worker_threads threads, so slow
+    operations never hold up the loop. At most max_connections connections
+    are served at once; further connections are closed as soon as they are
+    accepted.
+
+    The TLS handshake is always done when a client connects, so the
+    do_handshake_on_connect and suppress_ragged_eofs settings are not used.
+    The loop does the handshake without blocking, and fails it after
+    handshake_timeout seconds. Handshakes are counted in handshake_stats, as
+    by KMIPServer.
+    """
+
+    def __init__(self, host=None, port=None, keyfile=None, certfile=None,
+                 cert_reqs=None, ssl_version=None, ca_certs=None,
+                 do_handshake_on_connect=None, suppress_ragged_eofs=None,
+                 max_connections=None, worker_threads=None, database=None,
+                 reuse_port=False, ciphers=None, session_tickets=None,
+                 handshake_timeout=None, loop=None,
+                 max_frame_size=KMIPFramer.MAX_FRAME_SIZE):
+        super(AsyncKMIPServer, self).__init__(
+            host, port, keyfile, certfile, cert_reqs, ssl_version, ca_certs,
+            do_handshake_on_connect, suppress_ragged_eofs, max_connections,
+            worker_threads, database, reuse_port, ciphers, session_tickets,
+            handshake_timeout)
+        self.max_frame_size = max_frame_size
+
+        self._executor = futures.ThreadPoolExecutor(self.worker_threads)
+
+        self._own_loop = loop is None
+        self.loop = asyncio.new_event_loop() if loop is None else loop
+        self._server = None
+        self._connections = set()
+
+    @property
+    def sockets(self):
+        """
+        The listening sockets, once the server is started.
+        """
+        if self._server is None:
+            return []
+        return list(self._server.sockets)
+
+    def start(self):
+        """
+        Start listening for connections, without running the event loop.
+        """
+        if self._server is None:
+            if self.ssl_context is None:
+                self.ssl_context = self._create_ssl_context()
+            self._server = self.loop.run_until_complete(
+                self.loop.create_server(
+                    lambda: KMIPServerProtocol(self), sock=self.socket,
+                    backlog=self.max_connections))
+
+    def serve(self):
+        self.start()
+        self.loop.run_forever()
+
+    def close(self):
+        if self._server is not None:
+            self._server.close()
+            for connection in list(self._connections):
+                connection.close()
+            self.loop.run_until_complete(self._server.wait_closed())
+            self._server = None
+        else:
+            self.socket.close()
+
+        self._executor.shutdown(wait=True)
+        if self._own_loop:
+            self.loop.close()
+
+    def _add_connection(self, connection):
+        if len(self._connections) >= self.max_connections:
+            self.logger.warning(
+                'AsyncKMIPServer refusing connection; {0} connections '
+                'already open'.format(self.max_connections))
+            return False
+
+        self._connections.add(connection)
+        return True
+
+    def _remove_connection(self, connection):
+        self._connections.discard(connection)
+
+    def _process(self, stream):
+        return self.loop.run_in_executor(
+            self._executor, self._processor.process_message, stream)
@@ -90,6 +90,11 @@ class KMIPProxy(KMIP):
                             username, password, timeout)
         self.batch_items = []
 
+        # Every request carries the same protocol version, so its encoding is
+        # cached.
+        self.protocol_version = ProtocolVersion.create(1, 1)
+        self.protocol_version.freeze()
+
         self.conformance_clauses = [
             ConformanceClause.DISCOVER_VERSIONS]
 
@@ -796,7 +801,7 @@ class KMIPProxy(KMIP):
         return credential
 
     def _build_request_message(self, credential, batch_items):
-        protocol_version = ProtocolVersion.create(1, 1)
+        protocol_version = self.protocol_version
 
         if credential is None:
             credential = self._build_credential()
@@ -816,7 +821,7 @@ class KMIPProxy(KMIP):
     def _send_message(self, message):
         stream = BytearrayStream()
         message.write(stream)
-        self.protocol.write(stream.buffer)
+        self.protocol.write(stream.getbuffer())
 
     def _receive_message(self):
         return self.protocol.read()
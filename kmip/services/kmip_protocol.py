@@ -13,53 +13,192 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
-from struct import unpack
+from struct import Struct
 
 import binascii
 import logging
+import warnings
 
 from kmip.core.utils import BytearrayStream
 
 
 class KMIPProtocol(object):
+    """
+    Reads and writes whole TTLV messages over a blocking socket.
+
+    Each message is received into a single buffer allocated from the length
+    in its header, and is handed to the caller as a stream over that buffer
+    without further copies. The buffer_size argument is therefore not used;
+    it is accepted for compatibility and deprecated.
+
+    Attributes:
+        max_frame_size: The largest accepted message, header included.
+    """
+
     HEADER_SIZE = 8
+    MAX_FRAME_SIZE = 16 * 1024 * 1024
+
+    _LENGTH = Struct('!I')
 
-    def __init__(self, socket, buffer_size=1024):
+    def __init__(self, socket, buffer_size=None,
+                 max_frame_size=MAX_FRAME_SIZE):
+        if buffer_size is not None:
+            warnings.warn(
+                'KMIPProtocol sizes its buffer from each message header; '
+                'buffer_size is ignored and will be removed',
+                DeprecationWarning, stacklevel=2)
         self.socket = socket
+        self.max_frame_size = max_frame_size
         self.logger = logging.getLogger(__name__)
 
     def write(self, data):
         if len(data) > 0:
-            sbuffer = bytes(data)
-            self.logger.debug('KMIPProtocol.write: {0}'.format(
-                binascii.hexlify(sbuffer)))
-            self.socket.sendall(sbuffer)
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug('KMIPProtocol.write: {0}'.format(
+                    binascii.hexlify(data)))
+            self.socket.sendall(data)
 
     def read(self):
-        header = self._recv_all(self.HEADER_SIZE)
-        msg_size = unpack('!I', header[4:])[0]
-        payload = self._recv_all(msg_size)
-        data = BytearrayStream(header + payload)
-        self.logger.debug('KMIPProtocol.read: {0}'.format(
-            binascii.hexlify(bytes(data.buffer))))
-        return data
-
-    def _recv_all(self, total_bytes_to_be_read):
+        """
+        Receive the next message.
+
+        Returns:
+            BytearrayStream: A stream over the received message.
+
+        Raises:
+            ValueError: if the message header announces a message larger
+                than max_frame_size.
+            Exception: if the connection is closed before the message is
+                complete.
+        """
+        header = bytearray(self.HEADER_SIZE)
+        self._recv_into(memoryview(header))
+
+        size = self.HEADER_SIZE + self._LENGTH.unpack_from(header, 4)[0]
+        if size > self.max_frame_size:
+            raise ValueError(
+                "Message of {0} bytes exceeds the maximum of {1} "
+                "bytes".format(size, self.max_frame_size))
+
+        frame = bytearray(size)
+        frame[:self.HEADER_SIZE] = header
+        view = memoryview(frame)
+        self._recv_into(view[self.HEADER_SIZE:])
+
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug('KMIPProtocol.read: {0}'.format(
+                binascii.hexlify(frame)))
+        return BytearrayStream(view)
+
+    def _recv_into(self, view):
+        total_bytes_to_be_read = len(view)
         bytes_read = 0
-        total_msg = b''
         while bytes_read < total_bytes_to_be_read:
-            msg = self.socket.recv(total_bytes_to_be_read - bytes_read)
-            if not msg:
+            num_bytes = self.socket.recv_into(view[bytes_read:])
+            if not num_bytes:
                 break
-            bytes_read += len(msg)
-            total_msg += msg
+            bytes_read += num_bytes
         if bytes_read != total_bytes_to_be_read:
             raise Exception("Expected {0} bytes, Received {1} bytes"
                             .format(total_bytes_to_be_read, bytes_read))
-        return total_msg
+
+
+class KMIPFramer(object):
+    """
+    An incremental parser that splits a stream of TTLV messages into frames.
+
+    Data is fed in chunks of any size, such as those returned by a
+    non-blocking socket, and every message completed by a chunk is returned,
+    so a single thread can serve many connections. Only the bytes of the
+    unfinished message are kept between calls, and a message larger than
+    max_frame_size is rejected as soon as its header arrives.
+
+    Attributes:
+        message_class: The class used to decode complete frames, such as
+            RequestMessage or ResponseMessage. If None, frames are returned
+            undecoded as BytearrayStreams, like KMIPProtocol.read returns them.
+        max_frame_size: The largest accepted message, header included.
+    """
+
+    HEADER_SIZE = 8
+    MAX_FRAME_SIZE = KMIPProtocol.MAX_FRAME_SIZE
+
+    _LENGTH = Struct('!I')
+
+    def __init__(self, message_class=None, max_frame_size=MAX_FRAME_SIZE):
+        self.message_class = message_class
+        self.max_frame_size = max_frame_size
+        self._buffer = bytearray()
+        self._ready = []
+
+    def feed(self, data):
+        """
+        Add a chunk of data and return the messages it completes.
+
+        Args:
+            data (bytes): The next chunk of the stream; may be empty.
+
+        Returns:
+            list: The complete messages, in stream order; empty if no message
+                was completed.
+
+        Raises:
+            ValueError: if a message header announces a message larger than
+                max_frame_size.
+            Exception: any error raised by message_class while decoding a
+                message. That message is dropped, and the messages completed
+                before it are returned by the next call.
+        """
+        buf = self._buffer
+        buf += data
+
+        frames, self._ready = self._ready, []
+        offset = 0
+        try:
+            while len(buf) - offset >= self.HEADER_SIZE:
+                length = self._LENGTH.unpack_from(buf, offset + 4)[0]
+                size = self.HEADER_SIZE + length
+                if size > self.max_frame_size:
+                    raise ValueError(
+                        "Message of {0} bytes exceeds the maximum of {1} "
+                        "bytes".format(size, self.max_frame_size))
+                if len(buf) - offset < size:
+                    break
+
+                # The frame is consumed before it is decoded, so a frame that
+                # fails to decode is never decoded again
+                frame = bytes(buf[offset:offset + size])
+                offset += size
+                frames.append(self._decode(frame))
+        except Exception:
+            self._ready = frames
+            raise
+        finally:
+            if offset:
+                del buf[:offset]
+        return frames
+
+    def pending(self):
+        """
+        Return the number of bytes buffered for an unfinished message.
+        Messages already decoded but not yet returned are not counted.
+        """
+        return len(self._buffer)
+
+    def _decode(self, frame):
+        stream = BytearrayStream(frame)
+        if self.message_class is None:
+            return stream
+
+        message = self.message_class()
+        message.read(stream)
+        return message
 
 
 class KMIPProtocolFactory(object):
 
+    def __init__(self, max_frame_size=KMIPProtocol.MAX_FRAME_SIZE):
+        self.max_frame_size = max_frame_size
+
     def getProtocol(self, socket):
-        return KMIPProtocol(socket)
+        return KMIPProtocol(socket, max_frame_size=self.max_frame_size)
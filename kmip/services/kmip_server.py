@@ -15,10 +15,15 @@
 
 import logging
 import os
+import select
 import socket
 import ssl
+import threading
+import time
 
 from kmip.core.config_helper import ConfigHelper
+from kmip.core.repo.mem_repo import MemRepo
+from kmip.core.repo.sqlite_repo import SQLiteRepo
 from kmip.core.server import KMIPImpl
 
 from kmip.services.kmip_protocol import KMIPProtocolFactory
@@ -26,23 +31,120 @@ from kmip.services.processor import Processor
 
 FILE_PATH = os.path.dirname(os.path.abspath(__file__))
 
+# Handshake deadlines must not move with the wall clock; Python 2 has no
+# monotonic clock, and falls back to the wall clock
+_clock = getattr(time, 'monotonic', time.time)
+
+
+class HandshakeStats(object):
+    """
+    Counts the TLS handshakes done by a server and the time they took.
+
+    Handshakes are recorded by the threads serving the connections, so every
+    update holds a lock. Failed handshakes, including those that timed out,
+    are counted but their time is not.
+    """
+
+    def __init__(self):
+        self.handshakes = 0
+        self.failures = 0
+        self.timeouts = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+        self._lock = threading.Lock()
+
+    def record(self, duration, error=None):
+        with self._lock:
+            if error is None:
+                self.handshakes += 1
+                self.total_time += duration
+                self.max_time = max(self.max_time, duration)
+            else:
+                self.failures += 1
+                if isinstance(error, socket.timeout):
+                    self.timeouts += 1
+
+    def snapshot(self):
+        """
+        Return the current counts and times, in seconds, as a dictionary.
+        """
+        with self._lock:
+            if self.handshakes:
+                mean_time = self.total_time / self.handshakes
+            else:
+                mean_time = 0.0
+            return {
+                'handshakes': self.handshakes,
+                'failures': self.failures,
+                'timeouts': self.timeouts,
+                'mean_time': mean_time,
+                'max_time': self.max_time}
+
 
 class KMIPServer(object):
+    """
+    A KMIP server handling many clients at once.
+
+    Every connection is served by its own thread, so idle or slow clients
+    never hold up others. At most max_connections connections are served at
+    once; further connections are closed as soon as they are accepted.
+    Requests are processed by the thread of their connection, but at most
+    worker_threads of them at once, whatever the number of connections;
+    worker_threads caps concurrent processing and no separate pool of
+    threads is kept.
+
+    Objects are kept in memory, unless a database file is given, in which
+    case they are kept in that SQLite database and may be shared with other
+    server processes. With reuse_port, several server processes can listen
+    on the same port; see KMIPServerSupervisor.
+
+    A single SSL context is created when the server starts serving and is
+    used for every connection. Session tickets are issued unless disabled,
+    so returning clients can resume their session instead of doing a full
+    handshake. The highest TLS version supported by both ends, TLS 1.3 if
+    available, is negotiated unless a fixed ssl_version is given, and the
+    server picks the cipher from its own list, which may be set with
+    ciphers.
+
+    The TLS handshake is done by the thread of the connection, never by the
+    thread accepting connections, and fails if it takes longer than
+    handshake_timeout seconds in all, however the client paces it, so slow
+    clients cannot hold up others; the do_handshake_on_connect setting is
+    not used. Handshakes are counted in handshake_stats.
+    """
+
+    DEFAULT_MAX_CONNECTIONS = 64
+    DEFAULT_WORKER_THREADS = 8
+    DEFAULT_HANDSHAKE_TIMEOUT = 10.0
 
     def __init__(self, host=None, port=None, keyfile=None, certfile=None,
                  cert_reqs=None, ssl_version=None, ca_certs=None,
-                 do_handshake_on_connect=None, suppress_ragged_eofs=None):
+                 do_handshake_on_connect=None, suppress_ragged_eofs=None,
+                 max_connections=None, worker_threads=None, database=None,
+                 reuse_port=False, ciphers=None, session_tickets=None,
+                 handshake_timeout=None):
         self.logger = logging.getLogger(__name__)
 
         self._set_variables(host, port, keyfile, certfile, cert_reqs,
                             ssl_version, ca_certs, do_handshake_on_connect,
-                            suppress_ragged_eofs)
+                            suppress_ragged_eofs, max_connections,
+                            worker_threads, database, ciphers,
+                            session_tickets, handshake_timeout)
+        self.reuse_port = reuse_port
+        self.ssl_context = None
+        self.handshake_stats = HandshakeStats()
 
-        handler = KMIPImpl()
+        handler = KMIPImpl(repo=self._create_repo())
         self._processor = Processor(handler)
+        self._protocol_factory = KMIPProtocolFactory()
+
+        self._connections = threading.BoundedSemaphore(self.max_connections)
+        self._processing = threading.BoundedSemaphore(self.worker_threads)
 
         self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        if self.reuse_port:
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
         self.socket.bind((self.host, self.port))
 
     def close(self):
@@ -50,33 +152,120 @@ class KMIPServer(object):
         self.socket.close()
 
     def serve(self):
-        self.socket.listen(0)
+        if self.ssl_context is None:
+            self.ssl_context = self._create_ssl_context()
+
+        self.socket.listen(self.max_connections)
         while True:
             connection, address = self.socket.accept()
-            connection = ssl.wrap_socket(
-                connection,
-                keyfile=self.keyfile,
-                certfile=self.certfile,
-                server_side=True,
-                cert_reqs=self.cert_reqs,
-                ssl_version=self.ssl_version,
-                ca_certs=self.ca_certs,
-                do_handshake_on_connect=self.do_handshake_on_connect,
-                suppress_ragged_eofs=self.suppress_ragged_eofs)
-
-            factory = KMIPProtocolFactory()
-            protocol = factory.getProtocol(connection)
-
-            try:
-                while True:
-                    self._processor.process(protocol, protocol)
-            except Exception as e:
-                self.logger.error('KMIPServer {0} {1}'.format(type(e), e))
+
+            if not self._connections.acquire(False):
+                self.logger.warning(
+                    'KMIPServer refusing connection from {0}; {1} '
+                    'connections already open'.format(
+                        address, self.max_connections))
                 connection.close()
+                continue
+
+            thread = threading.Thread(
+                target=self._serve_connection, args=(connection, address))
+            thread.daemon = True
+            thread.start()
+
+    def _serve_connection(self, connection, address):
+        try:
+            connection = self._wrap_socket(connection)
+            protocol = self._protocol_factory.getProtocol(connection)
+
+            while True:
+                stream = protocol.read()
+                with self._processing:
+                    response = self._processor.process_message(stream)
+                if response is not None:
+                    protocol.write(response)
+        except Exception as e:
+            self.logger.error('KMIPServer {0} {1}'.format(type(e), e))
+        finally:
+            connection.close()
+            self._connections.release()
+
+    def _wrap_socket(self, connection):
+        connection = self.ssl_context.wrap_socket(
+            connection,
+            server_side=True,
+            do_handshake_on_connect=False,
+            suppress_ragged_eofs=self.suppress_ragged_eofs)
+        self._handshake(connection)
+        return connection
+
+    def _handshake(self, connection):
+        # A socket timeout only bounds each read or write, and a client
+        # sending a byte at a time could keep the handshake going forever,
+        # so the socket is made non-blocking and the handshake is given a
+        # deadline for all of its reads and writes together. The socket is
+        # waited on with poll, which unlike select accepts any descriptor
+        # however many connections are open.
+        start = _clock()
+        if self.handshake_timeout is None:
+            deadline = None
+        else:
+            deadline = start + self.handshake_timeout
+
+        poller = select.poll()
+        connection.setblocking(False)
+        try:
+            while True:
+                try:
+                    connection.do_handshake()
+                    break
+                except ssl.SSLWantReadError:
+                    poller.register(connection, select.POLLIN)
+                except ssl.SSLWantWriteError:
+                    poller.register(connection, select.POLLOUT)
+
+                if deadline is None:
+                    poller.poll()
+                    continue
+                remaining = deadline - _clock()
+                if remaining <= 0:
+                    raise socket.timeout('The handshake operation timed out')
+                poller.poll(remaining * 1000)
+        except Exception as e:
+            self.handshake_stats.record(_clock() - start, e)
+            raise
+        self.handshake_stats.record(_clock() - start)
+        connection.setblocking(True)
+
+    def _create_ssl_context(self):
+        context = ssl.SSLContext(self.ssl_version)
+        context.load_cert_chain(self.certfile, self.keyfile)
+        context.verify_mode = self.cert_reqs
+        if self.ca_certs is not None:
+            context.load_verify_locations(self.ca_certs)
+
+        context.options |= ssl.OP_CIPHER_SERVER_PREFERENCE
+        if self.ciphers is not None:
+            context.set_ciphers(self.ciphers)
+
+        if self.session_tickets:
+            context.options &= ~ssl.OP_NO_TICKET
+        else:
+            context.options |= ssl.OP_NO_TICKET
+            # TLS 1.3 tickets are sent whatever OP_NO_TICKET says
+            if hasattr(context, 'num_tickets'):
+                context.num_tickets = 0
+        return context
+
+    def _create_repo(self):
+        if self.database is None:
+            return MemRepo()
+        return SQLiteRepo(self.database)
 
     def _set_variables(self, host, port, keyfile, certfile, cert_reqs,
                        ssl_version, ca_certs, do_handshake_on_connect,
-                       suppress_ragged_eofs):
+                       suppress_ragged_eofs, max_connections,
+                       worker_threads, database, ciphers,
+                       session_tickets, handshake_timeout):
         conf = ConfigHelper()
         self.host = conf.get_valid_value(host, 'server',
                                          'host', conf.DEFAULT_HOST)
@@ -97,16 +286,39 @@ class KMIPServer(object):
         self.ca_certs = conf.get_valid_value(
             ca_certs, 'server', 'ca_certs', None)
 
-        if conf.get_valid_value(
-                do_handshake_on_connect, 'server',
-                'do_handshake_on_connect', 'True') == 'True':
-            self.do_handshake_on_connect = True
-        else:
-            self.do_handshake_on_connect = False
+        self.do_handshake_on_connect = self._get_boolean(
+            conf, do_handshake_on_connect, 'do_handshake_on_connect', True)
+        self.suppress_ragged_eofs = self._get_boolean(
+            conf, suppress_ragged_eofs, 'suppress_ragged_eofs', True)
+
+        self.max_connections = int(conf.get_valid_value(
+            max_connections, 'server', 'max_connections',
+            self.DEFAULT_MAX_CONNECTIONS))
+        self.worker_threads = int(conf.get_valid_value(
+            worker_threads, 'server', 'worker_threads',
+            self.DEFAULT_WORKER_THREADS))
+        self.database = conf.get_valid_value(
+            database, 'server', 'database', None)
+        self.ciphers = conf.get_valid_value(
+            ciphers, 'server', 'ciphers', None)
 
-        if conf.get_valid_value(
-                suppress_ragged_eofs, 'server',
-                'suppress_ragged_eofs', 'True') == 'True':
-            self.suppress_ragged_eofs = True
+        self.session_tickets = self._get_boolean(
+            conf, session_tickets, 'session_tickets', True)
+
+        # A timeout of 0 is a valid argument, so only None falls back to the
+        # configuration file
+        if handshake_timeout is None:
+            handshake_timeout = conf.get_valid_value(
+                None, 'server', 'handshake_timeout',
+                self.DEFAULT_HANDSHAKE_TIMEOUT)
+        if handshake_timeout is None:
+            self.handshake_timeout = None
         else:
-            self.suppress_ragged_eofs = False
+            self.handshake_timeout = float(handshake_timeout)
+
+    def _get_boolean(self, conf, value, option, default):
+        # Booleans may be given as bools, or as strings in the configuration
+        # file; False is a value, so only None falls back to the file.
+        if value is None:
+            value = conf.get_valid_value(None, 'server', option, default)
+        return str(value).lower() == 'true'
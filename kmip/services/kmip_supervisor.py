@@ -0,0 +1,151 @@
+# Copyright (c) 2015 The Johns Hopkins University/Applied Physics Laboratory
+# All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import logging
+import multiprocessing
+import os
+import signal
+import time
+
+from kmip.core.config_helper import ConfigHelper
+
+from kmip.services.kmip_server import KMIPServer
+
+
+class KMIPServerSupervisor(object):
+    """
+    Runs a KMIP server in several processes sharing one port.
+
+    Encoding and decoding messages holds the interpreter lock, so a single
+    server process is limited to one core however many threads it runs. The
+    supervisor forks the given number of worker processes, each running its
+    own server listening on the same port with SO_REUSEPORT, and the kernel
+    spreads new connections between them. Workers that exit are restarted.
+    The number of workers is read from the processes server setting when
+    not given, and is one per CPU if that is not set either.
+
+    Each worker has its own repository, so a database shared by all workers
+    should be given, in the same way as to the server; otherwise objects are
+    only found by the worker that stored them.
+    """
+
+    # Minimum time between two starts of the same worker, in seconds, so a
+    # worker failing as it starts is not restarted in a tight loop
+    RESTART_DELAY = 1.0
+
+    def __init__(self, processes=None, server_class=KMIPServer,
+                 **server_args):
+        self.logger = logging.getLogger(__name__)
+
+        conf = ConfigHelper()
+        processes = conf.get_valid_value(
+            processes, 'server', 'processes', None)
+        if processes is None:
+            processes = multiprocessing.cpu_count()
+        self.processes = int(processes)
+        self.server_class = server_class
+        self.server_args = server_args
+
+        self._workers = {}
+        self._running = False
+
+    def serve(self):
+        """
+        Start the workers and restart them as they exit, until closed or
+        sent SIGTERM. The workers are stopped when serve returns or raises.
+        """
+        self._running = True
+        handler = signal.signal(signal.SIGTERM, self._terminate)
+        try:
+            for index in range(self.processes):
+                self._start_worker(index)
+
+            while self._running and self._workers:
+                pid, status = os.wait()
+                if pid not in self._workers:
+                    continue
+
+                index, started = self._workers.pop(pid)
+                if not self._running:
+                    break
+
+                self.logger.warning(
+                    'KMIPServerSupervisor worker {0} (pid {1}) exited with '
+                    'status {2}; restarting'.format(index, pid, status))
+                delay = started + self.RESTART_DELAY - time.time()
+                if delay > 0:
+                    time.sleep(delay)
+                self._start_worker(index)
+        finally:
+            # However serve ends, the workers are stopped and reaped before
+            # it returns or raises
+            signal.signal(signal.SIGTERM, handler)
+            self.close()
+
+    def close(self):
+        """
+        Stop the workers and wait for them to exit.
+        """
+        self._running = False
+        for pid in list(self._workers):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except OSError:
+                pass
+
+        for pid in list(self._workers):
+            try:
+                os.waitpid(pid, 0)
+            except OSError:
+                pass
+            del self._workers[pid]
+
+    def _start_worker(self, index):
+        pid = os.fork()
+        if pid == 0:
+            status = 1
+            try:
+                status = self._run_worker(index)
+            finally:
+                os._exit(status)
+
+        self._workers[pid] = (index, time.time())
+
+    def _terminate(self, signum, frame):
+        # Unwind serve, which stops the workers on its way out
+        raise SystemExit(0)
+
+    def _run_worker(self, index):
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        signal.signal(signal.SIGINT, signal.SIG_DFL)
+
+        try:
+            server = self.server_class(reuse_port=True, **self.server_args)
+        except Exception as e:
+            self.logger.error(
+                'KMIPServerSupervisor worker {0} {1} {2}'.format(
+                    index, type(e), e))
+            return 1
+
+        try:
+            server.serve()
+        except Exception as e:
+            self.logger.error(
+                'KMIPServerSupervisor worker {0} {1} {2}'.format(
+                    index, type(e), e))
+            return 1
+        finally:
+            server.close()
+        return 0
@@ -41,6 +41,9 @@ from kmip.core.enums import BatchErrorContinuationOption as BECO
 
 from kmip.core.utils import BytearrayStream
 
+from kmip.core import validation
+from kmip.core.validation import ValidationLevel
+
 
 class Processor(object):
     def __init__(self, handler):
@@ -48,26 +51,48 @@ class Processor(object):
         self._handler = handler
 
     def process(self, istream, ostream):
-        stream = istream.read()
+        response = self.process_message(istream.read())
+        if response is not None:
+            ostream.write(response)
+
+    def process_message(self, stream):
+        """
+        Process a received message.
+
+        Args:
+            stream (BytearrayStream): A stream holding the encoded message.
+
+        Returns:
+            memoryview: The encoded response to a request message, or None if
+                the message was a response.
 
+        Raises:
+            ValueError: if the stream holds neither a request nor a response.
+        """
         if Base.is_tag_next(Tags.REQUEST_MESSAGE, stream):
             message = RequestMessage()
             message.read(stream)
-            try:
-                result = self._process_request(message)
-            except Exception as e:
-                raise e
+
+            result = self._process_request(message)
+
             tstream = BytearrayStream()
-            result.write(tstream)
-            ostream.write(tstream.buffer)
+            with self._building_response():
+                result.write(tstream)
+            return tstream.getbuffer()
         elif Base.is_tag_next(Tags.RESPONSE_MESSAGE, stream):
             message = ResponseMessage()
             message.read(stream)
             self._process_response(message)
+            return None
         else:
             raise ValueError('Processing error: stream contains unknown '
                              'message type')
 
+    def _building_response(self):
+        # The handler runs at the configured validation level; the response
+        # built from its results is trusted and skips validation on creation
+        return validation.level(ValidationLevel.DECODE_ONLY)
+
     def _process_request(self, message):
         header = message.request_header
 
@@ -124,14 +149,16 @@ class Processor(object):
                 msg = 'Unrecognized operation result status: {0}'
                 raise RuntimeError(msg.format(result_status))
 
-            resp_bi = ResponseBatchItem(operation=operation,
-                                        unique_batch_item_id=ubi_id,
-                                        result_status=result_status,
-                                        result_reason=result_reason,
-                                        result_message=result_message,
-                                        async_correlation_value=asyn_cv,
-                                        response_payload=response_payload,
-                                        message_extension=message_extension)
+            with self._building_response():
+                resp_bi = ResponseBatchItem(
+                    operation=operation,
+                    unique_batch_item_id=ubi_id,
+                    result_status=result_status,
+                    result_reason=result_reason,
+                    result_message=result_message,
+                    async_correlation_value=asyn_cv,
+                    response_payload=response_payload,
+                    message_extension=message_extension)
             response_batch_items.append(resp_bi)
 
             if failure_occurred:
@@ -147,14 +174,17 @@ class Processor(object):
                     msg = 'Unrecognized batch error continuation option: {0}'
                     raise RuntimeError(msg.format(batch_error_cont_option))
 
-        response_batch_count = BatchCount(len(response_batch_items))
-        response_time_stamp = TimeStamp(int(time.time()))
-        response_header = ResponseHeader(protocol_version=protocol_version,
-                                         time_stamp=response_time_stamp,
-                                         batch_count=response_batch_count)
-
-        response_message = ResponseMessage(response_header=response_header,
-                                           batch_items=response_batch_items)
+        with self._building_response():
+            response_batch_count = BatchCount(len(response_batch_items))
+            response_time_stamp = TimeStamp(int(time.time()))
+            response_header = ResponseHeader(
+                protocol_version=protocol_version,
+                time_stamp=response_time_stamp,
+                batch_count=response_batch_count)
+
+            response_message = ResponseMessage(
+                response_header=response_header,
+                batch_items=response_batch_items)
         return response_message
 
     def _process_response(self, message):
@@ -188,9 +218,11 @@ class Processor(object):
         uuid = result.uuid
         template_attribute = result.template_attribute
 
-        resp_pl = CreateResponsePayload(object_type=created_type,
-                                        unique_identifier=uuid,
-                                        template_attribute=template_attribute)
+        with self._building_response():
+            resp_pl = CreateResponsePayload(
+                object_type=created_type,
+                unique_identifier=uuid,
+                template_attribute=template_attribute)
 
         return (result_status, result_reason, result_message, resp_pl)
 
@@ -221,9 +253,10 @@ class Processor(object):
         uuid = result.uuid
         secret = result.secret
 
-        resp_pl = GetResponsePayload(object_type=retrieved_type,
-                                     unique_identifier=uuid,
-                                     secret=secret)
+        with self._building_response():
+            resp_pl = GetResponsePayload(object_type=retrieved_type,
+                                         unique_identifier=uuid,
+                                         secret=secret)
 
         return (result_status, result_reason, result_message, resp_pl)
 
@@ -236,7 +269,8 @@ class Processor(object):
         result_message = result.result_message
         uuid = result.uuid
 
-        payload = DestroyResponsePayload(unique_identifier=uuid)
+        with self._building_response():
+            payload = DestroyResponsePayload(unique_identifier=uuid)
 
         return (result_status, result_reason, result_message, payload)
 
@@ -253,14 +287,16 @@ class Processor(object):
         uuid = result.uuid
         template_attr = result.template_attribute
 
-        resp_pl = RegisterResponsePayload(unique_identifier=uuid,
-                                          template_attribute=template_attr)
+        with self._building_response():
+            resp_pl = RegisterResponsePayload(
+                unique_identifier=uuid,
+                template_attribute=template_attr)
 
         return (result_status, result_reason, result_message, resp_pl)
 
     def _process_locate_request(self, payload):
         max_items = payload.maximum_items
-        storage_mask = payload.status_storage_mask
+        storage_mask = payload.storage_status_mask
         objgrp_member = payload.object_group_member
         attributes = payload.attributes
 
@@ -273,6 +309,7 @@ class Processor(object):
 
         uuids = result.uuids
 
-        resp_pl = LocateResponsePayload(unique_identifiers=uuids)
+        with self._building_response():
+            resp_pl = LocateResponsePayload(unique_identifiers=uuids)
 
         return (result_status, result_reason, result_message, resp_pl)
@@ -0,0 +1,67 @@
+# Copyright (c) 2015 The Johns Hopkins University/Applied Physics Laboratory
+# All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""
+Benchmark the encoding and decoding throughput of key-sized BigIntegers.
+
+Usage:
+    python -m kmip.tests.benchmarks.big_integer
+"""
+
+import random
+import timeit
+
+from kmip.core import enums
+from kmip.core import primitives
+from kmip.core import utils
+
+SIZES = (2048, 4096, 8192)
+
+
+def encode(value):
+    stream = utils.BytearrayStream()
+    primitives.BigInteger(value, enums.Tags.PRIME_FIELD_SIZE).write(stream)
+    return stream.buffer
+
+
+def decode(encoding):
+    big_integer = primitives.BigInteger(tag=enums.Tags.PRIME_FIELD_SIZE)
+    big_integer.read(utils.BytearrayStream(encoding))
+    return big_integer.value
+
+
+def _best(func, arg, repeat=5, number=1000):
+    timer = timeit.Timer(lambda: func(arg))
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def main():
+    rng = random.Random(0)
+    for num_bits in SIZES:
+        value = -rng.getrandbits(num_bits)
+        encoding = encode(value)
+
+        encoding_time = _best(encode, value)
+        decoding_time = _best(decode, encoding)
+
+        print('{0:5d} bits: encode {1:7.2f} us ({2:7.1f} MB/s), '
+              'decode {3:7.2f} us ({4:7.1f} MB/s)'.format(
+                  num_bits,
+                  encoding_time * 1e6, len(encoding) / encoding_time / 1e6,
+                  decoding_time * 1e6, len(encoding) / decoding_time / 1e6))
+
+
+if __name__ == '__main__':
+    main()
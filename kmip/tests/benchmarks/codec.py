@@ -0,0 +1,356 @@
+# Copyright (c) 2015 The Johns Hopkins University/Applied Physics Laboratory
+# All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""
+Benchmark encoding and decoding across kmip.core.
+
+Encodes and decodes every primitive, the structures of kmip.core.objects and
+kmip.core.secrets, the request and response payloads, and whole messages,
+with key material from 32 bytes to 1 MB and messages of 1 to 10,000 batch
+items. For each case the report gives the encoded size, the encode and decode
+rates, and for a single operation the peak bytes allocated and the number of
+memory blocks held by the result, as a JSON list on stdout. The size of a
+case is the number of bytes of its key material or value, or the number of
+identifiers or batch items it holds.
+
+Usage:
+    python -m kmip.tests.benchmarks.codec [case name filter]
+"""
+
+import json
+import sys
+import timeit
+import tracemalloc
+
+from kmip.core import attributes
+from kmip.core import enums
+from kmip.core import misc
+from kmip.core import objects
+from kmip.core import primitives
+from kmip.core import utils
+
+from kmip.core.factories.attributes import AttributeFactory
+
+from kmip.core.messages import contents
+from kmip.core.messages import messages
+from kmip.core.messages.payloads import activate
+from kmip.core.messages.payloads import create
+from kmip.core.messages.payloads import create_key_pair
+from kmip.core.messages.payloads import destroy
+from kmip.core.messages.payloads import discover_versions
+from kmip.core.messages.payloads import get
+from kmip.core.messages.payloads import get_attribute_list
+from kmip.core.messages.payloads import locate
+from kmip.core.messages.payloads import query
+from kmip.core.messages.payloads import rekey_key_pair
+from kmip.core.messages.payloads import register
+from kmip.core.messages.payloads import revoke
+
+from kmip.pie import factory
+from kmip.pie import objects as pobjects
+
+KEY_SIZES = (32, 1024, 64 * 1024, 1024 * 1024)
+BATCH_SIZES = (1, 100, 10000)
+
+UID = '21d28b8e-5bde-4a33-b5ef-5ed4c8c3d6b8'
+
+
+class Case(object):
+    """
+    An object to encode and decode, with a way to create the empty object it
+    is decoded into.
+    """
+
+    def __init__(self, group, name, obj, empty=None, size=None):
+        self.group = group
+        self.name = name
+        self.obj = obj
+        self.empty = empty if empty is not None else type(obj)
+        self.size = size
+
+
+def _uid():
+    return attributes.UniqueIdentifier(UID)
+
+
+def _template_attribute(cls=objects.TemplateAttribute):
+    attribute_factory = AttributeFactory()
+    return cls(
+        attributes=[
+            attribute_factory.create_attribute(
+                enums.AttributeType.CRYPTOGRAPHIC_ALGORITHM,
+                enums.CryptographicAlgorithm.AES),
+            attribute_factory.create_attribute(
+                enums.AttributeType.CRYPTOGRAPHIC_LENGTH, 256),
+            attribute_factory.create_attribute(
+                enums.AttributeType.CRYPTOGRAPHIC_USAGE_MASK,
+                [enums.CryptographicUsageMask.ENCRYPT,
+                 enums.CryptographicUsageMask.DECRYPT])])
+
+
+def _symmetric_key(size):
+    return factory.ObjectFactory().convert(pobjects.SymmetricKey(
+        enums.CryptographicAlgorithm.AES, size * 8, b'\x01' * size))
+
+
+def primitive_cases():
+    tag = enums.Tags.DEFAULT
+
+    def empty(cls):
+        return lambda: cls(tag=tag)
+
+    yield Case('primitive', 'Integer', primitives.Integer(1, tag),
+               empty(primitives.Integer))
+    yield Case('primitive', 'LongInteger',
+               primitives.LongInteger(1 << 40, tag),
+               empty(primitives.LongInteger))
+    yield Case('primitive', 'Enumeration',
+               contents.Operation(enums.Operation.GET))
+    yield Case('primitive', 'Boolean', primitives.Boolean(True, tag),
+               empty(primitives.Boolean))
+    yield Case('primitive', 'DateTime', primitives.DateTime(0x4f9a54e7, tag),
+               empty(primitives.DateTime))
+    yield Case('primitive', 'Interval', primitives.Interval(86400, tag),
+               empty(primitives.Interval))
+    yield Case('primitive', 'TextString', primitives.TextString(UID, tag),
+               empty(primitives.TextString))
+    for size in (256, 2048, 8192):
+        yield Case('primitive', 'BigInteger',
+                   primitives.BigInteger((1 << size) - 1, tag),
+                   empty(primitives.BigInteger), size // 8)
+    for size in KEY_SIZES:
+        yield Case('primitive', 'ByteString',
+                   primitives.ByteString(b'\x01' * size, tag),
+                   empty(primitives.ByteString), size)
+
+
+def struct_cases():
+    attribute_factory = AttributeFactory()
+
+    yield Case('struct', 'Attribute', attribute_factory.create_attribute(
+        enums.AttributeType.CRYPTOGRAPHIC_LENGTH, 256))
+    yield Case('struct', 'Name', attributes.Name.create(
+        'key', enums.NameType.UNINTERPRETED_TEXT_STRING))
+    yield Case('struct', 'TemplateAttribute', _template_attribute())
+    yield Case('struct', 'RevocationReason', objects.RevocationReason(
+        code=enums.RevocationReasonCode.KEY_COMPROMISE,
+        message='compromised'))
+    for size in KEY_SIZES:
+        key = _symmetric_key(size)
+        yield Case('struct', 'KeyBlock', key.key_block, size=size)
+        yield Case('struct', 'SymmetricKey', key, size=size)
+        yield Case('struct', 'SecretData', factory.ObjectFactory().convert(
+            pobjects.SecretData(
+                b'\x01' * size, enums.SecretDataType.PASSWORD)), size=size)
+        yield Case('struct', 'OpaqueObject', factory.ObjectFactory().convert(
+            pobjects.OpaqueObject(
+                b'\x01' * size, enums.OpaqueDataType.NONE)), size=size)
+        yield Case('struct', 'Certificate', factory.ObjectFactory().convert(
+            pobjects.X509Certificate(b'\x01' * size)), size=size)
+
+
+def payload_cases():
+    object_type = attributes.ObjectType(enums.ObjectType.SYMMETRIC_KEY)
+
+    yield Case('payload', 'ActivateRequestPayload',
+               activate.ActivateRequestPayload(_uid()))
+    yield Case('payload', 'ActivateResponsePayload',
+               activate.ActivateResponsePayload(_uid()))
+    yield Case('payload', 'CreateRequestPayload', create.CreateRequestPayload(
+        object_type, _template_attribute()))
+    yield Case('payload', 'CreateResponsePayload',
+               create.CreateResponsePayload(object_type, _uid()))
+    yield Case('payload', 'CreateKeyPairRequestPayload',
+               create_key_pair.CreateKeyPairRequestPayload(
+                   _template_attribute(objects.CommonTemplateAttribute)))
+    yield Case('payload', 'CreateKeyPairResponsePayload',
+               create_key_pair.CreateKeyPairResponsePayload(
+                   attributes.PrivateKeyUniqueIdentifier(UID),
+                   attributes.PublicKeyUniqueIdentifier(UID)))
+    yield Case('payload', 'DestroyRequestPayload',
+               destroy.DestroyRequestPayload(_uid()))
+    yield Case('payload', 'DestroyResponsePayload',
+               destroy.DestroyResponsePayload(_uid()))
+    yield Case('payload', 'DiscoverVersionsRequestPayload',
+               discover_versions.DiscoverVersionsRequestPayload(
+                   [contents.ProtocolVersion.create(1, 2),
+                    contents.ProtocolVersion.create(1, 1)]))
+    yield Case('payload', 'DiscoverVersionsResponsePayload',
+               discover_versions.DiscoverVersionsResponsePayload(
+                   [contents.ProtocolVersion.create(1, 1)]))
+    yield Case('payload', 'GetRequestPayload', get.GetRequestPayload(_uid()))
+    for size in KEY_SIZES:
+        yield Case('payload', 'GetResponsePayload', get.GetResponsePayload(
+            object_type, _uid(), _symmetric_key(size)), size=size)
+    yield Case('payload', 'GetAttributeListRequestPayload',
+               get_attribute_list.GetAttributeListRequestPayload(UID))
+    yield Case('payload', 'GetAttributeListResponsePayload',
+               get_attribute_list.GetAttributeListResponsePayload(
+                   UID, [attribute_type.value
+                         for attribute_type in enums.AttributeType]))
+    yield Case('payload', 'LocateRequestPayload',
+               locate.LocateRequestPayload(
+                   attributes=_template_attribute().attributes))
+    for num_items in BATCH_SIZES:
+        yield Case('payload', 'LocateResponsePayload',
+                   locate.LocateResponsePayload(
+                       [_uid() for _ in range(num_items)]), size=num_items)
+    yield Case('payload', 'QueryRequestPayload', query.QueryRequestPayload(
+        [misc.QueryFunction(enums.QueryFunction.QUERY_OPERATIONS),
+         misc.QueryFunction(enums.QueryFunction.QUERY_OBJECTS)]))
+    yield Case('payload', 'QueryResponsePayload', query.QueryResponsePayload(
+        operations=[contents.Operation(operation)
+                    for operation in enums.Operation],
+        object_types=[attributes.ObjectType(object_type_enum)
+                      for object_type_enum in enums.ObjectType],
+        vendor_identification=misc.VendorIdentification('vendor')))
+    yield Case('payload', 'RekeyKeyPairRequestPayload',
+               rekey_key_pair.RekeyKeyPairRequestPayload(
+                   attributes.PrivateKeyUniqueIdentifier(UID)))
+    yield Case('payload', 'RekeyKeyPairResponsePayload',
+               rekey_key_pair.RekeyKeyPairResponsePayload(
+                   attributes.PrivateKeyUniqueIdentifier(UID),
+                   attributes.PublicKeyUniqueIdentifier(UID)))
+    for size in KEY_SIZES:
+        yield Case('payload', 'RegisterRequestPayload',
+                   register.RegisterRequestPayload(
+                       object_type, _template_attribute(),
+                       _symmetric_key(size)), size=size)
+    yield Case('payload', 'RegisterResponsePayload',
+               register.RegisterResponsePayload(_uid()))
+    yield Case('payload', 'RevokeRequestPayload', revoke.RevokeRequestPayload(
+        _uid(), objects.RevocationReason(
+            code=enums.RevocationReasonCode.CESSATION_OF_OPERATION)))
+    yield Case('payload', 'RevokeResponsePayload',
+               revoke.RevokeResponsePayload(_uid()))
+
+
+def message_cases():
+    for num_items in BATCH_SIZES:
+        header = messages.RequestHeader(
+            protocol_version=contents.ProtocolVersion.create(1, 1),
+            batch_count=contents.BatchCount(num_items))
+        batch_items = [
+            messages.RequestBatchItem(
+                operation=contents.Operation(enums.Operation.GET),
+                request_payload=get.GetRequestPayload(_uid()))
+            for _ in range(num_items)]
+        yield Case('message', 'RequestMessage', messages.RequestMessage(
+            request_header=header, batch_items=batch_items), size=num_items)
+
+        header = messages.ResponseHeader(
+            protocol_version=contents.ProtocolVersion.create(1, 1),
+            time_stamp=contents.TimeStamp(0x4f9a54e7),
+            batch_count=contents.BatchCount(num_items))
+        batch_items = [
+            messages.ResponseBatchItem(
+                operation=contents.Operation(enums.Operation.GET),
+                result_status=contents.ResultStatus(
+                    enums.ResultStatus.SUCCESS),
+                response_payload=get.GetResponsePayload(
+                    attributes.ObjectType(enums.ObjectType.SYMMETRIC_KEY),
+                    _uid(), _symmetric_key(32)))
+            for _ in range(num_items)]
+        yield Case('message', 'ResponseMessage', messages.ResponseMessage(
+            response_header=header, batch_items=batch_items), size=num_items)
+
+
+def cases():
+    for generate in (primitive_cases, struct_cases, payload_cases,
+                     message_cases):
+        for case in generate():
+            yield case
+
+
+def encode(obj):
+    stream = utils.BytearrayStream()
+    obj.write(stream)
+    return stream
+
+
+def decode(empty, encoding):
+    obj = empty()
+    obj.read(utils.BytearrayStream(encoding))
+    return obj
+
+
+def _rate(func, repeat=3):
+    timer = timeit.Timer(func)
+    number = timer.autorange()[0]
+    return number / min(timer.repeat(repeat=repeat, number=number))
+
+
+def _allocations(func):
+    """
+    Return the peak bytes allocated by a call and the memory blocks held by
+    its result.
+    """
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        result = func()
+        peak = tracemalloc.get_traced_memory()[1]
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+
+    blocks = sum(stat.count_diff for stat in after.compare_to(
+        before, 'lineno'))
+    del result
+    return peak, blocks
+
+
+def measure(case):
+    encoding = encode(case.obj).buffer
+
+    def encode_case():
+        return encode(case.obj)
+
+    def decode_case():
+        return decode(case.empty, encoding)
+
+    # Check that the encoding survives a round trip before timing it
+    if encode(decode_case()).buffer != encoding:
+        raise ValueError('{0} does not round trip'.format(case.name))
+
+    encode_peak, encode_blocks = _allocations(encode_case)
+    decode_peak, decode_blocks = _allocations(decode_case)
+
+    return {
+        'group': case.group,
+        'name': case.name,
+        'size': case.size,
+        'encoded_bytes': len(encoding),
+        'encode_ops_per_sec': _rate(encode_case),
+        'decode_ops_per_sec': _rate(decode_case),
+        'encode_peak_bytes': encode_peak,
+        'decode_peak_bytes': decode_peak,
+        'encode_blocks': encode_blocks,
+        'decode_blocks': decode_blocks,
+    }
+
+
+def main(name_filter=None):
+    results = [measure(case) for case in cases()
+               if name_filter is None or name_filter in case.name]
+    json.dump(results, sys.stdout, indent=2, sort_keys=True)
+    sys.stdout.write('\n')
+
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1:
+        main(sys.argv[1])
+    else:
+        main()
@@ -0,0 +1,171 @@
+# Copyright (c) 2015 The Johns Hopkins University/Applied Physics Laboratory
+# All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""
+Benchmark the per-item cost of decoding a large Locate response.
+
+Compares checking the tag and type of every item in the response by calling
+the Tags and Types enumerations, as decoding once did, against comparing
+their integer values, as Base.read does. Also compares resolving the values
+of the enumerations in the response by calling the enumeration against
+looking them up in the value tables of kmip.core.enums, as Enumeration.read
+does, and reports the cost of decoding the whole response.
+
+Usage:
+    python -m kmip.tests.benchmarks.locate [number of items]
+"""
+
+import struct
+import sys
+import timeit
+import uuid
+
+from kmip.core import attributes
+from kmip.core import enums
+from kmip.core import utils
+
+from kmip.core.messages import contents
+from kmip.core.messages import messages
+from kmip.core.messages.payloads import locate
+
+_HEADER = struct.Struct('!II')
+
+# The enumerations of the Enumeration items in a Locate response
+_ENUMERATIONS = {
+    enums.Tags.OPERATION: enums.Operation,
+    enums.Tags.RESULT_STATUS: enums.ResultStatus,
+}
+
+
+def build_locate_response(num_items):
+    """
+    Encode a Locate response message containing num_items identifiers.
+    """
+    payload = locate.LocateResponsePayload(
+        unique_identifiers=[
+            attributes.UniqueIdentifier(str(uuid.uuid4()))
+            for _ in range(num_items)])
+    batch_item = messages.ResponseBatchItem(
+        operation=contents.Operation(enums.Operation.LOCATE),
+        result_status=contents.ResultStatus(enums.ResultStatus.SUCCESS),
+        response_payload=payload)
+    header = messages.ResponseHeader(
+        protocol_version=contents.ProtocolVersion.create(1, 1),
+        time_stamp=contents.TimeStamp(0),
+        batch_count=contents.BatchCount(1))
+    message = messages.ResponseMessage(
+        response_header=header, batch_items=[batch_item])
+
+    stream = utils.BytearrayStream()
+    message.write(stream)
+    return stream.buffer
+
+
+def item_headers(encoding):
+    """
+    List the (tag, type, value) triples of every item in a TTLV encoding,
+    with the tag and type as both integers and enumeration members, and the
+    value of Enumeration items as an integer.
+    """
+    headers = list()
+    offset = 0
+    while offset < len(encoding):
+        tag_type, length = _HEADER.unpack_from(encoding, offset)
+        tag, typ = tag_type >> 8, tag_type & 0xff
+        value = None
+        if typ == enums.Types.ENUMERATION.value:
+            value = struct.unpack_from('!I', encoding, offset + 8)[0]
+        headers.append(
+            (tag, typ, enums.Tags(tag), enums.Types(typ), value))
+        offset += 8
+        if typ != enums.Types.STRUCTURE.value:
+            offset += length + (8 - length % 8) % 8
+    return headers
+
+
+def check_with_enumerations(headers):
+    for tag, typ, expected_tag, expected_type, _ in headers:
+        enums.Tags(tag) is not expected_tag
+        enums.Types(typ) is not expected_type
+
+
+def check_with_integers(headers):
+    for tag, typ, expected_tag, expected_type, _ in headers:
+        tag != expected_tag._value_
+        typ != expected_type._value_
+
+
+def enumeration_values(headers):
+    """
+    List the (enumeration, value) pairs of the Enumeration items.
+    """
+    return [(_ENUMERATIONS[expected_tag], value)
+            for _, _, expected_tag, _, value in headers
+            if value is not None]
+
+
+def resolve_with_enumerations(values):
+    for enum_type, value in values:
+        enum_type(value)
+
+
+def resolve_with_tables(values):
+    for enum_type, value in values:
+        enums.lookup_member(enum_type, value)
+
+
+def decode(encoding):
+    message = messages.ResponseMessage()
+    message.read(utils.BytearrayStream(encoding))
+    return message
+
+
+def _best(func, arg, repeat=5, number=20):
+    timer = timeit.Timer(lambda: func(arg))
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def main(num_items=1000):
+    encoding = build_locate_response(num_items)
+    headers = item_headers(encoding)
+    values = enumeration_values(headers)
+
+    check_enumerations = _best(check_with_enumerations, headers)
+    check_integers = _best(check_with_integers, headers)
+    resolve_enumerations = _best(resolve_with_enumerations, values)
+    resolve_tables = _best(resolve_with_tables, values)
+    decoding = _best(decode, encoding)
+
+    num_headers = len(headers)
+    num_values = len(values)
+    print('Locate response: {0} identifiers, {1} items, {2} bytes'.format(
+        num_items, num_headers, len(encoding)))
+    print('tag/type check via enumerations:      {0:8.1f} ns/item'.format(
+        check_enumerations / num_headers * 1e9))
+    print('tag/type check via integer values:    {0:8.1f} ns/item'.format(
+        check_integers / num_headers * 1e9))
+    print('enumeration value via enumeration:    {0:8.1f} ns/value'.format(
+        resolve_enumerations / num_values * 1e9))
+    print('enumeration value via value tables:   {0:8.1f} ns/value'.format(
+        resolve_tables / num_values * 1e9))
+    print('full response decode:                 {0:8.1f} us/item'.format(
+        decoding / num_headers * 1e6))
+
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1:
+        main(int(sys.argv[1]))
+    else:
+        main()
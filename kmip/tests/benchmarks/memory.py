@@ -0,0 +1,68 @@
+# Copyright (c) 2015 The Johns Hopkins University/Applied Physics Laboratory
+# All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""
+Report the memory used per resident attribute.
+
+Allocates many Cryptographic Length, Cryptographic Algorithm and Unique
+Identifier attributes, as a repository holding many objects would, and
+reports the average number of bytes allocated for each, including its
+children.
+
+Usage:
+    python -m kmip.tests.benchmarks.memory [number of attributes]
+"""
+
+import sys
+import tracemalloc
+
+from kmip.core import enums
+
+from kmip.core.factories.attributes import AttributeFactory
+
+ATTRIBUTES = (
+    (enums.AttributeType.CRYPTOGRAPHIC_LENGTH, 256),
+    (enums.AttributeType.CRYPTOGRAPHIC_ALGORITHM,
+     enums.CryptographicAlgorithm.AES),
+    (enums.AttributeType.UNIQUE_IDENTIFIER, '1'),
+)
+
+
+def measure(attribute_type, value, num_attributes):
+    factory = AttributeFactory()
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    resident = [factory.create_attribute(attribute_type, value)
+                for _ in range(num_attributes)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    del resident
+    return (after - before) / float(num_attributes)
+
+
+def main(num_attributes=10000):
+    for attribute_type, value in ATTRIBUTES:
+        size = measure(attribute_type, value, num_attributes)
+        print('{0:40s} {1:8.1f} bytes/attribute'.format(
+            attribute_type.value, size))
+
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1:
+        main(int(sys.argv[1]))
+    else:
+        main()
@@ -171,3 +171,20 @@ class TestRequestPayloadFactory(testtools.TestCase):
         payload = self.factory.create(Operation.DISCOVER_VERSIONS)
         self._test_payload_type(
             payload, discover_versions.DiscoverVersionsRequestPayload)
+
+    def test_register_replaces_constructor(self):
+        self.factory.register(
+            Operation.PUT, get.GetRequestPayload)
+
+        payload = self.factory.create(Operation.PUT)
+        self._test_payload_type(payload, get.GetRequestPayload)
+
+    def test_register_does_not_leak(self):
+        self.factory.register(
+            Operation.PUT, get.GetRequestPayload)
+
+        self._test_not_implemented(
+            RequestPayloadFactory().create, Operation.PUT)
+
+    def test_create_unsupported_operation(self):
+        self.assertRaises(ValueError, self.factory.create, 'invalid')
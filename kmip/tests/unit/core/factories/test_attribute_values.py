@@ -188,3 +188,28 @@ class TestAttributeValueFactory(TestCase):
         date = self.factory.create_attribute_value(
             AttributeType.ARCHIVE_DATE, 0)
         self._test_date_value(date, 0, Tags.ARCHIVE_DATE)
+
+    def test_register_custom_attribute(self):
+        self.factory.register(
+            'x-length', lambda value: attributes.CryptographicLength(value))
+
+        value = self.factory.create_attribute_value('x-length', 128)
+
+        self.assertIsInstance(value, attributes.CryptographicLength)
+        self.assertEqual(128, value.value)
+
+    def test_register_replaces_constructor(self):
+        self.factory.register(
+            AttributeType.CRYPTOGRAPHIC_LENGTH,
+            lambda value: attributes.CryptographicLength(value * 8))
+
+        value = self.factory.create_attribute_value(
+            AttributeType.CRYPTOGRAPHIC_LENGTH, 16)
+
+        self.assertEqual(128, value.value)
+        self.assertEqual(16, AttributeValueFactory().create_attribute_value(
+            AttributeType.CRYPTOGRAPHIC_LENGTH, 16).value)
+
+    def test_create_unrecognized_attribute(self):
+        self.assertRaises(
+            ValueError, self.factory.create_attribute_value, 0, None)
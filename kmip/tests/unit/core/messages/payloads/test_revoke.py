@@ -138,6 +138,27 @@ class TestRevokeRequestPayload(TestCase):
 
         self.assertEqual(self.encoding_a, stream, msg)
 
+    def test_read_with_revocation_message(self):
+        """
+        Test that a RevokeRequestPayload object with a revocation message can
+        be written to and read back from a data stream.
+        """
+        reason = objects.RevocationReason(
+            code=enums.RevocationReasonCode.KEY_COMPROMISE,
+            message='compromised')
+
+        stream = utils.BytearrayStream()
+        revoke.RevokeRequestPayload(
+            unique_identifier=self.uuid,
+            revocation_reason=reason).write(stream)
+
+        payload = revoke.RevokeRequestPayload()
+        payload.read(stream)
+
+        self.assertEqual(
+            'compromised',
+            payload.revocation_reason.revocation_message.value)
+
 
 class TestRevokeResponsePayload(TestCase):
     """
@@ -1377,6 +1377,37 @@ class TestResponseMessage(TestCase):
             self.assertEqual(exp, obs, self.msg.format('cryptographic_length',
                                                        'value', exp, obs))
 
+    def test_get_response_read_lazy(self):
+        self.stream = BytearrayStream(self.get)
+
+        response_message = messages.ResponseMessage()
+        response_message.read(self.stream, lazy=True)
+
+        batch_item = response_message.batch_items[0]
+        self.assertEqual(enums.ResultStatus.SUCCESS,
+                         batch_item.result_status.enum)
+
+        response_payload = batch_item.response_payload
+        self.assertIsInstance(response_payload, get.GetResponsePayload)
+        self.assertTrue(response_payload.is_deferred())
+
+        secret = response_payload.secret
+        self.assertFalse(response_payload.is_deferred())
+        self.assertIsInstance(secret, SymmetricKey)
+        self.assertEqual(enums.ObjectType.SYMMETRIC_KEY,
+                         response_payload.object_type.enum)
+
+    def test_get_response_read_lazy_write(self):
+        self.stream = BytearrayStream(self.get)
+
+        response_message = messages.ResponseMessage()
+        response_message.read(self.stream, lazy=True)
+
+        self.stream = BytearrayStream()
+        response_message.write(self.stream)
+
+        self.assertEqual(self.get, self.stream.buffer)
+
     def test_get_response_write(self):
         prot_ver = contents.ProtocolVersion.create(1, 1)
 
@@ -16,13 +16,21 @@
 from six import string_types
 from testtools import TestCase
 
+from kmip.core import objects
+
+from kmip.core.enums import AttributeType
 from kmip.core.enums import Tags
 
+from kmip.core.factories.attributes import AttributeFactory
+
+from kmip.core.objects import Attribute
 from kmip.core.objects import ExtensionName
 from kmip.core.objects import ExtensionTag
 from kmip.core.objects import ExtensionType
 from kmip.core.objects import KeyMaterialStruct
 
+from kmip.core.utils import BytearrayStream
+
 
 class TestKeyMaterialStruct(TestCase):
     """
@@ -47,6 +55,56 @@ class TestKeyMaterialStruct(TestCase):
         self.assertEqual(Tags.KEY_MATERIAL, struct.tag)
 
 
+class TestAttribute(TestCase):
+    """
+    A test suite for the attribute name lookup used when reading Attributes.
+    """
+
+    def setUp(self):
+        super(TestAttribute, self).setUp()
+        objects._OTHER_ATTRIBUTE_TYPES.clear()
+
+    def tearDown(self):
+        super(TestAttribute, self).tearDown()
+        objects._OTHER_ATTRIBUTE_TYPES.clear()
+
+    def test_attribute_type(self):
+        for attribute_type in AttributeType:
+            self.assertIs(
+                attribute_type, objects._attribute_type(attribute_type.value))
+
+    def test_attribute_type_with_enum_name(self):
+        self.assertIs(
+            AttributeType.X_509_CERTIFICATE_ISSUER,
+            objects._attribute_type('X_509_CERTIFICATE_ISSUER'))
+
+    def test_attribute_type_with_custom_name(self):
+        self.assertEqual('x-custom', objects._attribute_type('x-custom'))
+        self.assertEqual(
+            'x-custom', objects._OTHER_ATTRIBUTE_TYPES.get('x-custom'))
+
+    def test_attribute_type_cache_bounded(self):
+        for i in range(objects._MAX_OTHER_ATTRIBUTE_TYPES + 1):
+            objects._attribute_type('x-{0}'.format(i))
+
+        self.assertEqual(
+            objects._MAX_OTHER_ATTRIBUTE_TYPES,
+            len(objects._OTHER_ATTRIBUTE_TYPES))
+        self.assertEqual(
+            'x-overflow', objects._attribute_type('x-overflow'))
+
+    def test_read(self):
+        attribute = AttributeFactory().create_attribute(
+            AttributeType.CRYPTOGRAPHIC_LENGTH, 256)
+        stream = BytearrayStream()
+        attribute.write(stream)
+
+        decoded = Attribute()
+        decoded.read(stream)
+
+        self.assertEqual(attribute, decoded)
+
+
 class TestExtensionName(TestCase):
     """
     A test suite for the ExtensionName class.
@@ -13,6 +13,7 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import pickle
 import testtools
 
 from kmip.core import errors
@@ -106,6 +107,23 @@ class TestBase(testtools.TestCase):
         base.length = 4
         base.read(self.stream)
 
+        self.assertEqual(4, base.length)
+
+    def test_read_invalid_tag(self):
+        self.stream.write(b'\x42\x00\x01\x00\x00\x00\x00\x04')
+        base = primitives.Base()
+        self.assertRaises(errors.ReadValueError, base.read, self.stream)
+
+    def test_read_invalid_type(self):
+        self.stream.write(b'\x42\x00\x00\x01\x00\x00\x00\x04')
+        base = primitives.Base()
+        self.assertRaises(errors.ReadValueError, base.read, self.stream)
+
+    def test_read_underflow(self):
+        self.stream.write(b'\x42\x00\x00\x00\x00\x00')
+        base = primitives.Base()
+        self.assertRaises(errors.ReadValueError, base.read, self.stream)
+
     def test_write_tag(self):
         encoding = (b'\x42\x00\x00')
         base = primitives.Base()
@@ -210,3 +228,115 @@ class TestBase(testtools.TestCase):
         self.assertFalse(
             base.is_tag_next(base.tag, self.stream),
             self.bad_match.format('tag', 'mismatch', 'match'))
+
+    def test_is_tag_next_with_type(self):
+        encoding = (b'\x42\x00\x00\x01')
+        base = primitives.Base()
+        self.stream = utils.BytearrayStream(encoding)
+
+        self.assertTrue(
+            base.is_tag_next(base.tag, self.stream),
+            self.bad_match.format('tag', 'match', 'mismatch'))
+
+    def test_is_tag_next_underflow(self):
+        encoding = (b'\x42\x00')
+        base = primitives.Base()
+        self.stream = utils.BytearrayStream(encoding)
+
+        self.assertFalse(
+            base.is_tag_next(base.tag, self.stream),
+            self.bad_match.format('tag', 'mismatch', 'match'))
+
+    def test_is_type_next(self):
+        encoding = (b'\x42\x00\x00\x00')
+        base = primitives.Base()
+        self.stream = utils.BytearrayStream(encoding)
+
+        self.assertTrue(
+            base.is_type_next(base.type, self.stream),
+            self.bad_match.format('type', 'match', 'mismatch'))
+
+    def test_is_type_next_invalid(self):
+        encoding = (b'\x42\x00\x00\x01')
+        base = primitives.Base()
+        self.stream = utils.BytearrayStream(encoding)
+
+        self.assertFalse(
+            base.is_type_next(base.type, self.stream),
+            self.bad_match.format('type', 'mismatch', 'match'))
+
+    def test_pack_header(self):
+        base = primitives.Base()
+        base.length = 4
+
+        self.assertEqual(
+            b'\x42\x00\x00\x00\x00\x00\x00\x04', base.pack_header())
+
+    def test_pack_header_invalid_type(self):
+        base = primitives.Base()
+        base.type = ''
+        base.length = 4
+        self.assertRaises(TypeError, base.pack_header)
+
+    def test_pack_header_invalid_length(self):
+        base = primitives.Base()
+        base.length = ''
+        self.assertRaises(TypeError, base.pack_header)
+
+    def test_freeze(self):
+        value = primitives.Integer(1)
+        value.freeze()
+        object.__setattr__(value, '_encoding', b'\x01')
+
+        value.write(self.stream)
+
+        self.assertTrue(value.is_frozen())
+        self.assertIs(primitives.Integer, type(value))
+        self.assertEqual(b'\x01', self.stream.buffer)
+
+    def test_freeze_thaws_on_mutation(self):
+        value = primitives.Integer(1)
+        value.freeze()
+
+        value.value = 2
+        value.write(self.stream)
+
+        self.assertFalse(value.is_frozen())
+        self.assertIs(primitives.Integer, type(value))
+        self.assertEqual(primitives.Integer(2), value)
+        self.assertEqual(
+            b'\x42\x00\x00\x02\x00\x00\x00\x04\x00\x00\x00\x02\x00\x00\x00'
+            b'\x00', self.stream.buffer)
+
+    def test_thaw(self):
+        value = primitives.Integer(1)
+        value.freeze()
+        value.thaw()
+
+        self.assertFalse(value.is_frozen())
+        self.assertIs(primitives.Integer, type(value))
+        self.assertIsNone(value._encoding)
+
+    def test_freeze_copies_byte_views(self):
+        data = bytearray(b'\x01\x02')
+        value = primitives.ByteString(memoryview(data))
+        value.freeze()
+
+        data[0] = 0xff
+        value.write(self.stream)
+
+        self.assertTrue(value.is_frozen())
+        self.assertEqual(b'\x01\x02', value.value)
+        self.assertEqual(
+            b'\x42\x00\x00\x08\x00\x00\x00\x02\x01\x02\x00\x00\x00'
+            b'\x00\x00\x00', self.stream.buffer)
+
+    def test_freeze_pickle(self):
+        value = primitives.Integer(1)
+        value.freeze()
+
+        copied = pickle.loads(pickle.dumps(value))
+
+        self.assertIs(primitives.Integer, type(copied))
+        self.assertFalse(copied.is_frozen())
+        self.assertEqual(value, copied)
@@ -13,6 +13,8 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import random
+
 import testtools
 
 from kmip.core import enums
@@ -43,21 +45,30 @@ class TestBigInteger(testtools.TestCase):
     def tearDown(self):
         super(TestBigInteger, self).tearDown()
 
+    def _write(self, value):
+        i = primitives.BigInteger(value, enums.Tags.ACTIVATION_DATE)
+        i.write(self.stream)
+        return self.stream.read()
+
+    def _read(self, encoding):
+        self.stream = utils.BytearrayStream(encoding)
+        i = primitives.BigInteger(tag=enums.Tags.ACTIVATION_DATE)
+        i.read(self.stream)
+        return i.value
+
     def test_big_integer(self):
-        self.skip('primitives.BigInteger implementation incomplete')
         i = primitives.BigInteger(0)
 
         self.assertEqual(0, i.value,
                          self.bad_value.format('value', 0, i.value))
-        self.assertEqual(1, i.length,
-                         self.bad_value.format('length', 1, i.length))
-        self.assertEqual(i.BLOCK_SIZE - 1, i.padding_length,
-                         self.bad_value.format('padding_length',
-                                               i.BLOCK_SIZE - 1,
+        self.assertEqual(i.BLOCK_SIZE, i.length,
+                         self.bad_value.format('length', i.BLOCK_SIZE,
+                                               i.length))
+        self.assertEqual(0, i.padding_length,
+                         self.bad_value.format('padding_length', 0,
                                                i.padding_length))
 
     def test_big_integer_unset(self):
-        self.skip('primitives.BigInteger implementation incomplete')
         i = primitives.BigInteger()
 
         self.assertEqual(None, i.value,
@@ -68,8 +79,19 @@ class TestBigInteger(testtools.TestCase):
                          self.bad_value.format('padding_length', None,
                                                i.padding_length))
 
+    def test_value_length(self):
+        value_length = primitives.BigInteger.value_length
+
+        self.assertEqual(8, value_length(0))
+        self.assertEqual(8, value_length(self.max_long))
+        self.assertEqual(16, value_length(self.max_long + 1))
+        self.assertEqual(16, value_length(self.max_byte_long))
+        self.assertEqual(8, value_length(-1))
+        self.assertEqual(8, value_length(-self.max_long - 1))
+        self.assertEqual(16, value_length(-self.max_long - 2))
+        self.assertEqual(264, value_length(2 ** 2048))
+
     def test_validate_on_valid(self):
-        self.skip('primitives.BigInteger implementation incomplete')
         i = primitives.BigInteger()
         i.value = 0
         i.length = i.BLOCK_SIZE
@@ -79,7 +101,6 @@ class TestBigInteger(testtools.TestCase):
         i.validate()
 
     def test_validate_on_valid_long(self):
-        self.skip('primitives.BigInteger implementation incomplete')
         i = primitives.BigInteger()
         i.value = self.max_long + 1
         i.length = i.BLOCK_SIZE
@@ -89,29 +110,23 @@ class TestBigInteger(testtools.TestCase):
         i.validate()
 
     def test_validate_on_valid_unset(self):
-        self.skip('primitives.BigInteger implementation incomplete')
         i = primitives.BigInteger()
 
         # Check no exception thrown
         i.validate()
 
     def test_validate_on_invalid_type(self):
-        self.skip('primitives.BigInteger implementation incomplete')
         i = primitives.BigInteger()
         i.value = 'test'
 
         self.assertRaises(errors.StateTypeError, i.validate)
 
     def test_write(self):
-        self.skip('primitives.BigInteger implementation incomplete')
         encoding = (
             b'\x42\x00\x01\x04\x00\x00\x00\x08\x00\x00\x00\x00\x00\x00\x00'
             b'\x01')
-        i = primitives.BigInteger(1)
-        i.TAG = enums.Tags.ACTIVATION_DATE
-        i.write(self.stream)
+        result = self._write(1)
 
-        result = self.stream.read()
         len_exp = len(encoding)
         len_rcv = len(result)
 
@@ -120,113 +135,127 @@ class TestBigInteger(testtools.TestCase):
         self.assertEqual(encoding, result, self.bad_encoding)
 
     def test_write_zero(self):
-        self.skip('primitives.BigInteger implementation incomplete')
         encoding = (
             b'\x42\x00\x01\x04\x00\x00\x00\x08\x00\x00\x00\x00\x00\x00\x00'
             b'\x00')
-        i = primitives.BigInteger(0)
-        i.TAG = enums.Tags.ACTIVATION_DATE
-        i.write(self.stream)
+        result = self._write(0)
 
-        result = self.stream.read()
-        len_exp = len(encoding)
-        len_rcv = len(result)
-
-        self.assertEqual(len_exp, len_rcv, self.bad_write.format(len_exp,
-                                                                 len_rcv))
         self.assertEqual(encoding, result, self.bad_encoding)
 
     def test_write_max_positive_value(self):
-        self.skip('primitives.BigInteger implementation incomplete')
         encoding = (
             b'\x42\x00\x01\x04\x00\x00\x00\x08\x7f\xff\xff\xff\xff\xff\xff'
             b'\xff')
-        i = primitives.BigInteger(self.max_long)
-        i.TAG = enums.Tags.ACTIVATION_DATE
-        i.write(self.stream)
+        result = self._write(self.max_long)
 
-        result = self.stream.read()
-        len_exp = len(encoding)
-        len_rcv = len(result)
-
-        self.assertEqual(len_exp, len_rcv, self.bad_write.format(len_exp,
-                                                                 len_rcv))
         self.assertEqual(encoding, result, self.bad_encoding)
 
     def test_write_min_negative_value(self):
-        self.skip('primitives.BigInteger implementation incomplete')
         encoding = (
             b'\x42\x00\x01\x04\x00\x00\x00\x08\xff\xff\xff\xff\xff\xff\xff'
             b'\xff')
-        i = primitives.BigInteger(-1)
-        i.TAG = enums.Tags.ACTIVATION_DATE
-        i.write(self.stream)
+        result = self._write(-1)
 
-        result = self.stream.read()
-        len_exp = len(encoding)
-        len_rcv = len(result)
+        self.assertEqual(encoding, result, self.bad_encoding)
+
+    def test_write_sign_extended(self):
+        encoding = (
+            b'\x42\x00\x01\x04\x00\x00\x00\x10'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\xff\xff\xff\xff\xff\xff\xff\xff')
+        result = self._write(self.max_byte_long)
 
-        self.assertEqual(len_exp, len_rcv, self.bad_write.format(len_exp,
-                                                                 len_rcv))
         self.assertEqual(encoding, result, self.bad_encoding)
 
+    def test_write_negative_sign_extended(self):
+        encoding = (
+            b'\x42\x00\x01\x04\x00\x00\x00\x10'
+            b'\xff\xff\xff\xff\xff\xff\xff\xff'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00')
+        result = self._write(-self.max_byte_long - 1)
+
+        self.assertEqual(encoding, result, self.bad_encoding)
+
+    def test_write_updated_value(self):
+        i = primitives.BigInteger(0, enums.Tags.ACTIVATION_DATE)
+        i.value = self.max_byte_long
+        i.write(self.stream)
+
+        self.assertEqual(16, i.length)
+        self.assertEqual(24, len(self.stream.read()))
+
     def test_read(self):
-        self.skip('primitives.BigInteger implementation incomplete')
         encoding = (
             b'\x42\x00\x01\x04\x00\x00\x00\x08\x00\x00\x00\x00\x00\x00\x00'
             b'\x01')
-        self.stream = utils.BytearrayStream(encoding)
-        i = primitives.BigInteger()
-        i.TAG = enums.Tags.ACTIVATION_DATE
-        i.read(self.stream)
+        value = self._read(encoding)
 
-        self.assertEqual(1, i.value, self.bad_read.format(1, i.value))
+        self.assertEqual(1, value, self.bad_read.format(1, value))
 
     def test_read_zero(self):
-        self.skip('primitives.BigInteger implementation incomplete')
         encoding = (
             b'\x42\x00\x01\x04\x00\x00\x00\x08\x00\x00\x00\x00\x00\x00\x00'
             b'\x00')
-        self.stream = utils.BytearrayStream(encoding)
-        i = primitives.BigInteger()
-        i.TAG = enums.Tags.ACTIVATION_DATE
-        i.read(self.stream)
+        value = self._read(encoding)
 
-        self.assertEqual(0, i.value, self.bad_read.format(0, i.value))
+        self.assertEqual(0, value, self.bad_read.format(0, value))
 
     def test_read_max_positive_value(self):
-        self.skip('primitives.BigInteger implementation incomplete')
         encoding = (
             b'\x42\x00\x01\x04\x00\x00\x00\x08\x7f\xff\xff\xff\xff\xff\xff'
             b'\xff')
-        self.stream = utils.BytearrayStream(encoding)
-        i = primitives.BigInteger()
-        i.TAG = enums.Tags.ACTIVATION_DATE
-        i.read(self.stream)
+        value = self._read(encoding)
 
-        self.assertEqual(self.max_long, i.value,
-                         self.bad_read.format(1, i.value))
+        self.assertEqual(self.max_long, value,
+                         self.bad_read.format(self.max_long, value))
 
     def test_read_min_negative_value(self):
-        self.skip('primitives.BigInteger implementation incomplete')
         encoding = (
             b'\x42\x00\x01\x04\x00\x00\x00\x08\xff\xff\xff\xff\xff\xff\xff'
             b'\xff')
-        self.stream = utils.BytearrayStream(encoding)
-        i = primitives.BigInteger()
-        i.TAG = enums.Tags.ACTIVATION_DATE
-        i.read(self.stream)
+        value = self._read(encoding)
+
+        self.assertEqual(-1, value, self.bad_read.format(-1, value))
 
-        self.assertEqual(-1, i.value,
-                         self.bad_read.format(1, i.value))
+    def test_read_sign_extended(self):
+        encoding = (
+            b'\x42\x00\x01\x04\x00\x00\x00\x10'
+            b'\x00\x00\x00\x00\x00\x00\x00\x00'
+            b'\xff\xff\xff\xff\xff\xff\xff\xff')
+        value = self._read(encoding)
+
+        self.assertEqual(self.max_byte_long, value,
+                         self.bad_read.format(self.max_byte_long, value))
 
     def test_read_on_invalid_length(self):
-        self.skip('primitives.BigInteger implementation incomplete')
         encoding = (
             b'\x42\x00\x01\x04\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
             b'\x00')
         self.stream = utils.BytearrayStream(encoding)
-        i = primitives.BigInteger()
-        i.TAG = enums.Tags.ACTIVATION_DATE
+        i = primitives.BigInteger(tag=enums.Tags.ACTIVATION_DATE)
 
         self.assertRaises(errors.InvalidLengthError, i.read, self.stream)
+
+    def test_read_on_short_value(self):
+        encoding = (
+            b'\x42\x00\x01\x04\x00\x00\x00\x10\x00\x00\x00\x00\x00\x00\x00'
+            b'\x00')
+        self.stream = utils.BytearrayStream(encoding)
+        i = primitives.BigInteger(tag=enums.Tags.ACTIVATION_DATE)
+
+        self.assertRaises(errors.ReadValueError, i.read, self.stream)
+
+    def test_read_write_large_values(self):
+        # Round trip key-sized values, as used by transparent key material
+        rng = random.Random(0)
+        for num_bits in (2048, 3072, 4096, 8192):
+            for _ in range(50):
+                value = rng.getrandbits(num_bits)
+                for signed in (value, -value):
+                    self.stream = utils.BytearrayStream()
+                    encoding = self._write(signed)
+
+                    self.assertEqual(
+                        8 + primitives.BigInteger.value_length(signed),
+                        len(encoding))
+                    self.assertEqual(signed, self._read(encoding))
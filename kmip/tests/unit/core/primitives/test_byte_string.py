@@ -60,6 +60,24 @@ class TestByteString(testtools.TestCase):
         self.assertEqual(bytes(), bs.value,
                          self.bad_value.format('value', None, bs.value))
 
+    def test_init_with_memoryview(self):
+        data = bytearray(b'\x01\x02\x03\x04')
+        view = memoryview(data)[1:]
+        bs = primitives.ByteString(view)
+
+        self.assertIs(view, bs.value)
+        self.assertEqual(3, bs.length)
+        self.assertEqual(5, bs.padding_length)
+
+    def test_init_with_buffer(self):
+        data = bytearray(b'\x01\x02\x03')
+        bs = primitives.ByteString(data)
+
+        # The value is a view of the buffer, not a copy
+        self.assertIsInstance(bs.value, memoryview)
+        data[0] = 0xff
+        self.assertEqual(b'\xff\x02\x03', bs.value)
+
     def test_validate_on_valid(self):
         bs = primitives.ByteString()
         bs.value = b'\x00'
@@ -144,6 +162,13 @@ class TestByteString(testtools.TestCase):
 
         self.assertRaises(errors.ReadValueError, bs.read, self.stream)
 
+    def test_read_on_short_value(self):
+        encoding = (b'\x42\x00\x00\x08\x00\x00\x00\x03\x01\x02')
+        self.stream = utils.BytearrayStream(encoding)
+        bs = primitives.ByteString()
+
+        self.assertRaises(errors.ReadValueError, bs.read, self.stream)
+
     def test_write_value(self):
         encoding = b'\x01\x02\x03\x00\x00\x00\x00\x00'
         self.stream = utils.BytearrayStream()
@@ -220,3 +245,33 @@ class TestByteString(testtools.TestCase):
         self.assertEqual(len_exp, len_rcv,
                          self.bad_length.format(len_exp, len_rcv))
         self.assertEqual(encoding, result, self.bad_encoding)
+
+    def test_write_updated_value(self):
+        encoding = (
+            b'\x42\x00\x00\x08\x00\x00\x00\x08\x01\x02\x03\x04\x05\x06\x07'
+            b'\x08')
+        self.stream = utils.BytearrayStream()
+        bs = primitives.ByteString(b'\x01\x02\x03')
+        bs.value = b'\x01\x02\x03\x04\x05\x06\x07\x08'
+        bs.write(self.stream)
+
+        result = self.stream.read()
+
+        self.assertEqual(encoding, result, self.bad_encoding)
+
+    def test_write_memoryview(self):
+        encoding = (
+            b'\x42\x00\x00\x08\x00\x00\x00\x03\x01\x02\x03\x00\x00\x00\x00'
+            b'\x00')
+        self.stream = utils.BytearrayStream()
+        bs = primitives.ByteString(memoryview(b'\x00\x01\x02\x03')[1:])
+        bs.write(self.stream)
+
+        result = self.stream.read()
+
+        self.assertEqual(encoding, result, self.bad_encoding)
+
+    def test_repr_memoryview(self):
+        bs = primitives.ByteString(memoryview(b'\x01\x02'))
+
+        self.assertEqual("ByteString(value=b'\\x01\\x02')", repr(bs))
@@ -13,6 +13,7 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import struct
 import testtools
 
 from kmip.core import errors
@@ -157,6 +158,38 @@ class TestInteger(testtools.TestCase):
 
         self.assertRaises(errors.ReadValueError, i.read, self.stream)
 
+    def test_read_on_invalid_tag(self):
+        encoding = (
+            b'\x42\x00\x01\x02\x00\x00\x00\x04\x00\x00\x00\x01\x00\x00\x00'
+            b'\x00')
+        self.stream = utils.BytearrayStream(encoding)
+        i = primitives.Integer()
+
+        self.assertRaises(errors.ReadValueError, i.read, self.stream)
+
+    def test_read_on_truncated_encoding(self):
+        encoding = b'\x42\x00\x00\x02\x00\x00\x00\x04\x00\x00\x00\x01'
+        self.stream = utils.BytearrayStream(encoding)
+        i = primitives.Integer()
+
+        self.assertRaises(struct.error, i.read, self.stream)
+
+    def test_read_sequence(self):
+        encoding = (
+            b'\x42\x00\x00\x02\x00\x00\x00\x04\x00\x00\x00\x01\x00\x00\x00'
+            b'\x00'
+            b'\x42\x00\x00\x02\x00\x00\x00\x04\xff\xff\xff\xff\x00\x00\x00'
+            b'\x00')
+        self.stream = utils.BytearrayStream(encoding)
+        i = primitives.Integer()
+        j = primitives.Integer()
+        i.read(self.stream)
+        j.read(self.stream)
+
+        self.assertEqual(1, i.value)
+        self.assertEqual(-1, j.value)
+        self.assertEqual(0, len(self.stream))
+
     def test_write_value(self):
         encoding = (b'\x00\x00\x00\x01\x00\x00\x00\x00')
         i = primitives.Integer(1)
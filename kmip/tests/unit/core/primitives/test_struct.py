@@ -0,0 +1,284 @@
+# Copyright (c) 2015 The Johns Hopkins University/Applied Physics Laboratory
+# All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import mock
+import testtools
+
+from kmip.core import attributes
+from kmip.core import enums
+from kmip.core import errors
+from kmip.core import objects
+from kmip.core import primitives
+from kmip.core import utils
+
+from kmip.core.messages import contents
+from kmip.core.messages.payloads import locate
+
+
+class TestStruct(testtools.TestCase):
+    """
+    A test suite for the single-pass encoding, lazy decoding and encoding
+    cache support of the Struct.
+    """
+
+    def setUp(self):
+        super(TestStruct, self).setUp()
+
+        # A Structure (Tags.CERTIFICATE) containing an Integer
+        # (Tags.CERTIFICATE_LENGTH) with value 1, nested in a Structure
+        # (Tags.ATTRIBUTE).
+        self.encoding = (
+            b'\x42\x00\x08\x01\x00\x00\x00\x18'
+            b'\x42\x00\x13\x01\x00\x00\x00\x10'
+            b'\x42\x00\xAD\x02\x00\x00\x00\x04\x00\x00\x00\x01\x00\x00\x00'
+            b'\x00')
+
+    def tearDown(self):
+        super(TestStruct, self).tearDown()
+
+    def test_reserve_header(self):
+        stream = utils.BytearrayStream()
+        stream.write(b'\x00')
+        struct = primitives.Struct(enums.Tags.CERTIFICATE)
+
+        position = struct.reserve_header(stream)
+
+        self.assertEqual(1, position)
+        self.assertEqual(1 + primitives.Base.HEADER_SIZE, stream.length())
+
+    def test_patch_header(self):
+        stream = utils.BytearrayStream()
+        outer = primitives.Struct(enums.Tags.ATTRIBUTE)
+        inner = primitives.Struct(enums.Tags.CERTIFICATE)
+        value = primitives.Integer(1, enums.Tags.CERTIFICATE_LENGTH)
+
+        outer_start = outer.reserve_header(stream)
+        inner_start = inner.reserve_header(stream)
+        value.write(stream)
+        inner.patch_header(stream, inner_start)
+        outer.patch_header(stream, outer_start)
+
+        self.assertEqual(16, inner.length)
+        self.assertEqual(24, outer.length)
+        self.assertEqual(self.encoding, stream.buffer)
+
+    def test_read_lazy(self):
+        encoding = self._encode_name('Key')
+        stream = utils.BytearrayStream(encoding + b'\x00')
+        name = attributes.Name()
+
+        name.read_lazy(stream)
+
+        self.assertTrue(name.is_deferred())
+        self.assertEqual(len(encoding) - 8, name.length)
+        self.assertEqual(1, stream.length())
+        self.assertEqual('Key', name.name_value.value)
+        self.assertFalse(name.is_deferred())
+
+    def test_read_lazy_copies_encoding(self):
+        data = bytearray(self._encode_name('Key'))
+        name = attributes.Name()
+
+        name.read_lazy(utils.BytearrayStream(memoryview(data)))
+        data[:] = b'\x00' * len(data)
+
+        self.assertEqual('Key', name.name_value.value)
+
+    def test_read_lazy_with_invalid_contents(self):
+        encoding = bytearray(self._encode_name('Key'))
+        # The tag of the Name Value
+        encoding[10] = 0x00
+        name = attributes.Name()
+        name.read_lazy(utils.BytearrayStream(bytes(encoding)))
+
+        error = self.assertRaises(
+            errors.ReadValueError, getattr, name, 'name_value')
+        again = self.assertRaises(
+            errors.ReadValueError, getattr, name, 'name_type')
+
+        self.assertIs(error, again)
+        self.assertTrue(name.is_deferred())
+        self.assertEqual(
+            ['_deferred', 'length', 'tag', 'type'],
+            sorted(primitives._instance_state(name)))
+
+    def test_read_lazy_decodes_on_access(self):
+        stream = utils.BytearrayStream(self.encoding)
+        struct = primitives.Struct(enums.Tags.ATTRIBUTE)
+
+        struct.read_lazy(stream)
+
+        self.assertRaises(AttributeError, getattr, struct, 'value')
+        self.assertFalse(struct.is_deferred())
+
+    def test_read_lazy_with_invalid_tag(self):
+        stream = utils.BytearrayStream(self.encoding)
+        struct = primitives.Struct(enums.Tags.CERTIFICATE)
+
+        self.assertRaises(errors.ReadValueError, struct.read_lazy, stream)
+
+    def test_read_lazy_with_underflow(self):
+        stream = utils.BytearrayStream(self.encoding[:-8])
+        struct = primitives.Struct(enums.Tags.ATTRIBUTE)
+
+        self.assertRaises(errors.ReadValueError, struct.read_lazy, stream)
+
+    def test_freeze(self):
+        version = contents.ProtocolVersion.create(1, 1)
+        stream = utils.BytearrayStream()
+        version.write(stream)
+
+        version.freeze()
+
+        self.assertTrue(version.is_frozen())
+        self.assertTrue(version.protocol_version_major.is_frozen())
+        self.assertTrue(version.protocol_version_minor.is_frozen())
+        self.assertIs(contents.ProtocolVersion, type(version))
+        self.assertEqual(stream.buffer, version._encoding)
+
+    def test_freeze_writes_cached_encoding(self):
+        version = contents.ProtocolVersion.create(1, 1)
+        version.freeze()
+        encoding = version._encoding
+
+        stream = utils.BytearrayStream()
+        with mock.patch.object(
+                contents.ProtocolVersion.ProtocolVersionMajor,
+                'write') as write:
+            version.write(stream)
+
+        self.assertFalse(write.called)
+        self.assertEqual(encoding, stream.buffer)
+
+    def test_freeze_thaws_on_child_mutation(self):
+        version = contents.ProtocolVersion.create(1, 1)
+        version.freeze()
+
+        version.protocol_version_minor.value = 2
+        stream = utils.BytearrayStream()
+        version.write(stream)
+
+        self.assertFalse(version.is_frozen())
+        self.assertFalse(version.protocol_version_minor.is_frozen())
+        self.assertTrue(version.protocol_version_major.is_frozen())
+        self.assertEqual(contents.ProtocolVersion.create(1, 2),
+                         self._read_version(stream))
+
+    def test_freeze_thaws_on_child_replacement(self):
+        version = contents.ProtocolVersion.create(1, 1)
+        version.freeze()
+
+        version.protocol_version_minor = \
+            contents.ProtocolVersion.ProtocolVersionMinor(2)
+        stream = utils.BytearrayStream()
+        version.write(stream)
+
+        self.assertFalse(version.is_frozen())
+        self.assertEqual(contents.ProtocolVersion.create(1, 2),
+                         self._read_version(stream))
+
+    def test_freeze_thaws_on_descendant_mutation(self):
+        name = attributes.Name.create(
+            'Key', enums.NameType.UNINTERPRETED_TEXT_STRING)
+        template_attribute = objects.TemplateAttribute(attributes=[
+            objects.Attribute(
+                attribute_name=objects.Attribute.AttributeName('Name'),
+                attribute_value=name)])
+        template_attribute.freeze()
+        stream = utils.BytearrayStream()
+        template_attribute.write(stream)
+
+        # Three levels below the TemplateAttribute
+        name.name_value.value = 'Other Key'
+        other_stream = utils.BytearrayStream()
+        template_attribute.write(other_stream)
+
+        self.assertFalse(template_attribute.is_frozen())
+        self.assertNotEqual(stream.buffer, other_stream.buffer)
+        decoded = objects.TemplateAttribute()
+        decoded.read(other_stream)
+        self.assertEqual(
+            'Other Key',
+            decoded.attributes[0].attribute_value.name_value.value)
+
+    def test_freeze_thaws_on_list_mutation(self):
+        payload = locate.LocateResponsePayload(
+            [attributes.UniqueIdentifier('1')])
+        payload.freeze()
+
+        payload.unique_identifiers.append(attributes.UniqueIdentifier('2'))
+        stream = utils.BytearrayStream()
+        payload.write(stream)
+
+        self.assertFalse(payload.is_frozen())
+        decoded = locate.LocateResponsePayload()
+        decoded.read(stream)
+        self.assertEqual(2, len(decoded.unique_identifiers))
+
+    def test_freeze_thaws_on_list_item_replacement(self):
+        payload = locate.LocateResponsePayload(
+            [attributes.UniqueIdentifier('1')])
+        payload.freeze()
+
+        payload.unique_identifiers[0] = attributes.UniqueIdentifier('2')
+
+        self.assertFalse(payload.is_frozen())
+
+    def test_freeze_with_mutable_stream(self):
+        key_material = objects.KeyMaterialStruct()
+        key_material.data.write(b'\x01')
+        key_value = objects.KeyValue()
+        key_value.key_material = key_material
+
+        key_value.freeze()
+        key_material.data.write(b'\x02')
+        stream = utils.BytearrayStream()
+        key_value.write(stream)
+
+        self.assertFalse(key_material.is_frozen())
+        self.assertFalse(key_value.is_frozen())
+        self.assertEqual(
+            b'\x42\x00\x45\x01\x00\x00\x00\x0a'
+            b'\x42\x00\x43\x01\x00\x00\x00\x02\x01\x02',
+            stream.buffer)
+
+    def test_freeze_thaws_every_owner(self):
+        name = attributes.Name.create(
+            'Key', enums.NameType.UNINTERPRETED_TEXT_STRING)
+        first = objects.Attribute(
+            attribute_name=objects.Attribute.AttributeName('Name'),
+            attribute_value=name)
+        second = objects.Attribute(
+            attribute_name=objects.Attribute.AttributeName('Name'),
+            attribute_value=name)
+        first.freeze()
+        second.freeze()
+        self.assertTrue(first.is_frozen())
+
+        name.name_type.value = enums.NameType.URI
+
+        self.assertFalse(first.is_frozen())
+        self.assertFalse(second.is_frozen())
+
+    def _encode_name(self, value):
+        stream = utils.BytearrayStream()
+        attributes.Name.create(
+            value, enums.NameType.UNINTERPRETED_TEXT_STRING).write(stream)
+        return stream.buffer
+
+    def _read_version(self, stream):
+        version = contents.ProtocolVersion()
+        version.read(stream)
+        return version
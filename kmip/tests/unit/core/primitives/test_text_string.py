@@ -141,6 +141,25 @@ class TestTextString(testtools.TestCase):
 
         self.assertRaises(errors.ReadValueError, ts.read, self.stream)
 
+    def test_read_on_short_value(self):
+        encoding = (b'\x42\x00\x00\x07\x00\x00\x00\x0B\x48\x65\x6C')
+        self.stream = utils.BytearrayStream(encoding)
+        ts = primitives.TextString()
+
+        self.assertRaises(errors.ReadValueError, ts.read, self.stream)
+
+    def test_read_multibyte(self):
+        encoding = (
+            b'\x42\x00\x00\x07\x00\x00\x00\x02\xC3\xA9\x00\x00\x00\x00\x00'
+            b'\x00')
+        self.stream = utils.BytearrayStream(encoding)
+        ts = primitives.TextString()
+        ts.read(self.stream)
+
+        expected = u'\u00e9'
+        self.assertEqual(expected, ts.value,
+                         self.bad_read.format('value', expected, ts.value))
+
     def test_write_value(self):
         encoding = (
             b'\x48\x65\x6C\x6C\x6F\x20\x57\x6F\x72\x6C\x64\x00\x00\x00\x00'
@@ -204,3 +223,15 @@ class TestTextString(testtools.TestCase):
         self.assertEqual(len_exp, len_rcv,
                          self.bad_length.format(len_exp, len_rcv))
         self.assertEqual(encoding, result, self.bad_encoding)
+
+    def test_write_multibyte(self):
+        encoding = (
+            b'\x42\x00\x00\x07\x00\x00\x00\x02\xC3\xA9\x00\x00\x00\x00\x00'
+            b'\x00')
+        self.stream = utils.BytearrayStream()
+        ts = primitives.TextString(u'\u00e9')
+        ts.write(self.stream)
+
+        result = self.stream.read()
+
+        self.assertEqual(encoding, result, self.bad_encoding)
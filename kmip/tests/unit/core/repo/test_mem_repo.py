@@ -0,0 +1,49 @@
+# Copyright (c) 2015 The Johns Hopkins University/Applied Physics Laboratory
+# All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import threading
+
+from testtools import TestCase
+
+from kmip.core.repo.mem_repo import MemRepo
+
+
+class TestMemRepo(TestCase):
+    """
+    A test suite for concurrent access to MemRepo.
+    """
+
+    def setUp(self):
+        super(TestMemRepo, self).setUp()
+        self.repo = MemRepo()
+
+    def tearDown(self):
+        super(TestMemRepo, self).tearDown()
+
+    def test_save_concurrently(self):
+        uuids = []
+
+        def save():
+            for _ in range(1000):
+                uuids.append(self.repo.save(None, []))
+
+        threads = [threading.Thread(target=save) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(4000, len(set(uuids)))
+        self.assertEqual(4000, len(self.repo.repo))
@@ -0,0 +1,159 @@
+# Copyright (c) 2015 The Johns Hopkins University/Applied Physics Laboratory
+# All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import os
+import shutil
+import tempfile
+
+from testtools import TestCase
+
+from kmip.core import enums
+from kmip.core import utils
+
+from kmip.core.factories.attributes import AttributeFactory
+
+from kmip.core.messages.payloads.locate import LocateRequestPayload
+
+from kmip.core.repo.sqlite_repo import SQLiteRepo
+
+from kmip.pie import factory
+from kmip.pie import objects
+
+
+def encode(obj):
+    stream = utils.BytearrayStream()
+    obj.write(stream)
+    return stream.buffer
+
+
+class TestSQLiteRepo(TestCase):
+    """
+    A test suite for the SQLiteRepo.
+    """
+
+    def setUp(self):
+        super(TestSQLiteRepo, self).setUp()
+
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        self.path = os.path.join(directory, 'kmip.db')
+        self.repo = SQLiteRepo(self.path)
+
+        self.key = factory.ObjectFactory().convert(objects.SymmetricKey(
+            enums.CryptographicAlgorithm.AES, 128, b'\x01' * 16))
+        self.attributes = [AttributeFactory().create_attribute(
+            enums.AttributeType.CRYPTOGRAPHIC_LENGTH, 128)]
+
+    def tearDown(self):
+        super(TestSQLiteRepo, self).tearDown()
+
+    def _assert_stored(self, uuid, repo=None):
+        managed_object, attributes = (repo or self.repo).get(uuid)
+        self.assertEqual(encode(self.key), encode(managed_object))
+        self.assertEqual(
+            [encode(attribute) for attribute in self.attributes],
+            [encode(attribute) for attribute in attributes])
+
+    def test_save(self):
+        uuid = self.repo.save(self.key, self.attributes)
+
+        self._assert_stored(uuid)
+
+    def test_save_unique_uuids(self):
+        uuids = [self.repo.save(self.key, []) for _ in range(3)]
+
+        self.assertEqual(3, len(set(uuids)))
+
+    def test_save_without_object(self):
+        uuid = self.repo.save(None, [])
+
+        self.assertEqual((None, []), self.repo.get(uuid))
+
+    def test_get_not_found(self):
+        for uuid in (None, 'unknown', '1'):
+            self.assertEqual((None, None), self.repo.get(uuid))
+
+    def test_update(self):
+        uuid = self.repo.save(None, [])
+
+        self.assertTrue(self.repo.update(uuid, self.key, self.attributes))
+        self._assert_stored(uuid)
+
+    def test_update_invalid_uuid(self):
+        self.assertFalse(self.repo.update(None, self.key, self.attributes))
+
+    def test_update_not_found(self):
+        uuid = self.repo.save(None, [])
+        self.repo.delete(uuid)
+
+        self.assertFalse(self.repo.update(uuid, self.key, self.attributes))
+        self.assertEqual((None, None), self.repo.get(uuid))
+
+    def test_locate(self):
+        other_attributes = [AttributeFactory().create_attribute(
+            enums.AttributeType.CRYPTOGRAPHIC_LENGTH, 256)]
+        first = self.repo.save(self.key, self.attributes)
+        self.repo.save(self.key, other_attributes)
+        third = self.repo.save(self.key, self.attributes)
+
+        uuids = self.repo.locate(None, None, None, self.attributes)
+
+        self.assertEqual([first, third], [uuid.value for uuid in uuids])
+
+    def test_locate_with_maximum_items(self):
+        uuids = [self.repo.save(self.key, self.attributes) for _ in range(3)]
+
+        located = self.repo.locate(
+            LocateRequestPayload.MaximumItems(2), None, None, [])
+
+        self.assertEqual(uuids[:2], [uuid.value for uuid in located])
+
+    def test_delete(self):
+        uuid = self.repo.save(self.key, self.attributes)
+
+        self.assertTrue(self.repo.delete(uuid))
+        self.assertEqual((None, None), self.repo.get(uuid))
+        self.assertFalse(self.repo.delete(uuid))
+
+    def test_shared(self):
+        other = SQLiteRepo(self.path)
+        uuid = other.save(self.key, self.attributes)
+
+        self._assert_stored(uuid)
+        self.assertTrue(self.repo.delete(uuid))
+        self.assertEqual((None, None), other.get(uuid))
+
+    def test_shared_by_processes(self):
+        pids = []
+        for _ in range(2):
+            pid = os.fork()
+            if pid == 0:
+                status = 1
+                try:
+                    repo = SQLiteRepo(self.path)
+                    for _ in range(50):
+                        repo.save(self.key, self.attributes)
+                    status = 0
+                finally:
+                    os._exit(status)
+            pids.append(pid)
+
+        for pid in pids:
+            self.assertEqual(0, os.waitpid(pid, 0)[1])
+
+        uuids = [str(uuid) for uuid in range(1, 101)]
+        for uuid in uuids:
+            self._assert_stored(uuid)
+        self.assertEqual((None, None), self.repo.get('101'))
@@ -0,0 +1,53 @@
+# Copyright (c) 2015 The Johns Hopkins University/Applied Physics Laboratory
+# All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import enum
+import testtools
+
+from kmip.core import enums
+
+
+class TestValueTables(testtools.TestCase):
+
+    def setUp(self):
+        super(TestValueTables, self).setUp()
+
+    def tearDown(self):
+        super(TestValueTables, self).tearDown()
+
+    def test_tables_cover_all_enumerations(self):
+        for obj in vars(enums).values():
+            if isinstance(obj, type) and issubclass(obj, enum.Enum):
+                if obj is enum.Enum:
+                    continue
+                self.assertIn(obj, enums.VALUE_TABLES)
+                table = enums.VALUE_TABLES[obj]
+                for member in obj:
+                    self.assertIs(member, table[member.value])
+
+    def test_lookup_member(self):
+        member = enums.lookup_member(enums.Operation, 0x0000000A)
+        self.assertIs(enums.Operation.GET, member)
+
+    def test_lookup_member_invalid_value(self):
+        self.assertRaises(
+            ValueError, enums.lookup_member, enums.Operation, 0xFFFFFFFF)
+
+    def test_lookup_member_foreign_enumeration(self):
+        class Color(enum.Enum):
+            RED = 1
+
+        self.assertIs(Color.RED, enums.lookup_member(Color, 1))
+        self.assertRaises(ValueError, enums.lookup_member, Color, 2)
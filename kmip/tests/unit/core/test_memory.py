@@ -0,0 +1,99 @@
+# Copyright (c) 2015 The Johns Hopkins University/Applied Physics Laboratory
+# All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import sys
+
+import testtools
+
+from kmip.core import attributes
+from kmip.core import enums
+from kmip.core import objects
+from kmip.core import primitives
+
+from kmip.core.factories.attributes import AttributeFactory
+
+
+def object_size(obj):
+    """
+    Return the bytes used by an object and its instance dictionary, if any.
+    """
+    size = sys.getsizeof(obj)
+    if hasattr(obj, '__dict__'):
+        size += sys.getsizeof(obj.__dict__)
+    return size
+
+
+def dictionary_size(obj):
+    """
+    Return the bytes an object would use with its attributes kept in an
+    instance dictionary, as they were before the classes used slots.
+    """
+    reference = type('Reference', (object, ), {})()
+    for name in primitives._slot_names(type(obj)):
+        if hasattr(obj, name):
+            reference.__dict__[name] = getattr(obj, name)
+    return object_size(reference)
+
+
+class TestMemory(testtools.TestCase):
+    """
+    A memory-per-object report for the encodeable classes, checking that they
+    are stored without instance dictionaries.
+    """
+
+    def setUp(self):
+        super(TestMemory, self).setUp()
+
+        factory = AttributeFactory()
+        self.objects = [
+            primitives.Integer(1),
+            primitives.LongInteger(1),
+            primitives.BigInteger(1),
+            primitives.Enumeration(enums.Tags.DEFAULT),
+            primitives.Boolean(True),
+            primitives.TextString('text'),
+            primitives.ByteString(b'bytes'),
+            primitives.DateTime(1),
+            primitives.Interval(1),
+            attributes.UniqueIdentifier('1'),
+            attributes.CryptographicAlgorithm(
+                enums.CryptographicAlgorithm.AES),
+            attributes.CryptographicLength(256),
+            attributes.CryptographicUsageMask(12),
+            attributes.Name.create(
+                'name', enums.NameType.UNINTERPRETED_TEXT_STRING),
+            factory.create_attribute(
+                enums.AttributeType.CRYPTOGRAPHIC_LENGTH, 256),
+            objects.Attribute(),
+        ]
+
+    def tearDown(self):
+        super(TestMemory, self).tearDown()
+
+    def test_no_instance_dictionary(self):
+        for obj in self.objects:
+            self.assertFalse(
+                hasattr(obj, '__dict__'),
+                '{0} has an instance dictionary'.format(type(obj).__name__))
+
+    def test_object_size_reduction(self):
+        for obj in self.objects:
+            size = object_size(obj)
+            reference = dictionary_size(obj)
+
+            self.assertLess(
+                size, reference,
+                '{0}: {1} bytes with slots, {2} bytes without'.format(
+                    type(obj).__name__, size, reference))
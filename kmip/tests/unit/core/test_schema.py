@@ -0,0 +1,166 @@
+# Copyright (c) 2015 The Johns Hopkins University/Applied Physics Laboratory
+# All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import testtools
+
+from kmip.core import attributes
+from kmip.core import errors
+from kmip.core import primitives
+from kmip.core import schema
+from kmip.core import utils
+
+from kmip.core.enums import Tags
+from kmip.core.messages.payloads import locate
+
+
+class MaximumItems(primitives.Integer):
+
+    def __init__(self, value=None):
+        super(MaximumItems, self).__init__(value, Tags.MAXIMUM_ITEMS)
+
+
+@schema.codec
+class ExamplePayload(primitives.Struct):
+
+    FIELDS = (
+        schema.Field('unique_identifier', Tags.UNIQUE_IDENTIFIER,
+                     attributes.UniqueIdentifier),
+        schema.Field('object_groups', Tags.OBJECT_GROUP,
+                     attributes.ObjectGroup, repeated=True),
+        schema.Field('maximum_items', Tags.MAXIMUM_ITEMS,
+                     factory=lambda payload: MaximumItems(), optional=True))
+
+    def __init__(self, unique_identifier=None, object_groups=None,
+                 maximum_items=None):
+        super(ExamplePayload, self).__init__(Tags.REQUEST_PAYLOAD)
+        self.unique_identifier = unique_identifier
+        self.object_groups = object_groups or []
+        self.maximum_items = maximum_items
+
+    def validate(self):
+        pass
+
+
+class TestSchema(testtools.TestCase):
+    """
+    A test suite for the Structs compiled from field specifications.
+    """
+
+    def setUp(self):
+        super(TestSchema, self).setUp()
+
+        self.unique_identifier = (
+            b'\x42\x00\x94\x07\x00\x00\x00\x01'
+            b'\x31\x00\x00\x00\x00\x00\x00\x00')
+        self.object_group = (
+            b'\x42\x00\x56\x07\x00\x00\x00\x01'
+            b'\x61\x00\x00\x00\x00\x00\x00\x00')
+        self.maximum_items = (
+            b'\x42\x00\x4F\x02\x00\x00\x00\x04'
+            b'\x00\x00\x00\x01\x00\x00\x00\x00')
+
+        self.encoding_full = (
+            b'\x42\x00\x79\x01\x00\x00\x00\x40' + self.unique_identifier +
+            self.object_group + self.object_group + self.maximum_items)
+        self.encoding_required = (
+            b'\x42\x00\x79\x01\x00\x00\x00\x10' + self.unique_identifier)
+
+    def tearDown(self):
+        super(TestSchema, self).tearDown()
+
+    def test_field_without_class_or_factory(self):
+        self.assertRaises(
+            ValueError, schema.Field, 'unique_identifier',
+            Tags.UNIQUE_IDENTIFIER)
+
+    def test_field_optional_and_repeated(self):
+        self.assertRaises(
+            ValueError, schema.Field, 'object_groups', Tags.OBJECT_GROUP,
+            attributes.ObjectGroup, optional=True, repeated=True)
+
+    def test_field_optional_without_tag(self):
+        self.assertRaises(
+            ValueError, schema.Field, 'object_group', None,
+            attributes.ObjectGroup, optional=True)
+
+    def test_read(self):
+        stream = utils.BytearrayStream(self.encoding_full)
+        payload = ExamplePayload()
+
+        payload.read(stream)
+
+        self.assertEqual('1', payload.unique_identifier.value)
+        self.assertEqual(2, len(payload.object_groups))
+        for object_group in payload.object_groups:
+            self.assertEqual('a', object_group.value)
+        self.assertIsInstance(payload.maximum_items, MaximumItems)
+        self.assertEqual(1, payload.maximum_items.value)
+        self.assertEqual(0, stream.length())
+
+    def test_read_required_only(self):
+        stream = utils.BytearrayStream(self.encoding_required)
+        payload = ExamplePayload()
+
+        payload.read(stream)
+
+        self.assertEqual('1', payload.unique_identifier.value)
+        self.assertEqual([], payload.object_groups)
+        self.assertIsNone(payload.maximum_items)
+
+    def test_read_missing_required(self):
+        stream = utils.BytearrayStream(
+            b'\x42\x00\x79\x01\x00\x00\x00\x10' + self.object_group)
+        payload = ExamplePayload()
+
+        self.assertRaises(errors.ReadValueError, payload.read, stream)
+
+    def test_read_oversized(self):
+        stream = utils.BytearrayStream(
+            b'\x42\x00\x79\x01\x00\x00\x00\x20' + self.unique_identifier +
+            self.unique_identifier)
+        payload = ExamplePayload()
+
+        self.assertRaises(errors.StreamNotEmptyError, payload.read, stream)
+
+    def test_write(self):
+        stream = utils.BytearrayStream()
+        payload = ExamplePayload(
+            attributes.UniqueIdentifier('1'),
+            [attributes.ObjectGroup('a'), attributes.ObjectGroup('a')],
+            MaximumItems(1))
+
+        payload.write(stream)
+
+        self.assertEqual(self.encoding_full, stream.buffer)
+
+    def test_write_required_only(self):
+        stream = utils.BytearrayStream()
+        payload = ExamplePayload(attributes.UniqueIdentifier('1'))
+
+        payload.write(stream)
+
+        self.assertEqual(self.encoding_required, stream.buffer)
+
+    def test_locate_request_payload(self):
+        stream = utils.BytearrayStream()
+        payload = locate.LocateRequestPayload(
+            maximum_items=locate.LocateRequestPayload.MaximumItems(1))
+
+        payload.write(stream)
+        decoded = locate.LocateRequestPayload()
+        decoded.read(utils.BytearrayStream(stream.buffer))
+
+        self.assertEqual(1, decoded.maximum_items.value)
+        self.assertEqual([], decoded.attributes)
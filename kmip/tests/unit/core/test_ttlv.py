@@ -0,0 +1,177 @@
+# Copyright (c) 2015 The Johns Hopkins University/Applied Physics Laboratory
+# All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import struct
+
+import testtools
+
+from kmip.core import errors
+from kmip.core import ttlv
+
+from kmip.core.enums import Tags
+from kmip.core.enums import Types
+from kmip.core.messages import contents
+from kmip.core.utils import BytearrayStream
+
+
+class TestTTLV(testtools.TestCase):
+    """
+    A test suite for the generic TTLV decoder and encoder.
+    """
+
+    def setUp(self):
+        super(TestTTLV, self).setUp()
+
+        # A Protocol Version structure for KMIP 1.1
+        self.protocol_version = (
+            b'\x42\x00\x69\x01\x00\x00\x00\x20'
+            b'\x42\x00\x6A\x02\x00\x00\x00\x04\x00\x00\x00\x01\x00\x00\x00'
+            b'\x00'
+            b'\x42\x00\x6B\x02\x00\x00\x00\x04\x00\x00\x00\x01\x00\x00\x00'
+            b'\x00')
+        self.protocol_version_tree = [
+            (Tags.PROTOCOL_VERSION.value, Types.STRUCTURE.value, [
+                (Tags.PROTOCOL_VERSION_MAJOR.value, Types.INTEGER.value, 1),
+                (Tags.PROTOCOL_VERSION_MINOR.value, Types.INTEGER.value, 1)])]
+
+        # One item of every type, with an unknown tag on the Big Integer
+        self.tree = [
+            (Tags.REQUEST_MESSAGE.value, Types.STRUCTURE.value, [
+                (Tags.BATCH_COUNT.value, Types.INTEGER.value, -2),
+                (Tags.DEFAULT.value, Types.LONG_INTEGER.value, -(2 ** 40)),
+                (0x540000, Types.BIG_INTEGER.value, b'\x00' * 7 + b'\x01'),
+                (Tags.OPERATION.value, Types.ENUMERATION.value, 0x0A),
+                (Tags.ASYNCHRONOUS_INDICATOR.value, Types.BOOLEAN.value,
+                 True),
+                (Tags.UNIQUE_IDENTIFIER.value, Types.TEXT_STRING.value,
+                 u'\u00e9t\u00e9'),
+                (Tags.KEY_MATERIAL.value, Types.BYTE_STRING.value,
+                 b'\x01\x02\x03'),
+                (Tags.TIME_STAMP.value, Types.DATE_TIME.value, 0x4f9a54e7),
+                (Tags.DEFAULT.value, Types.INTERVAL.value, 86400),
+                (Tags.ATTRIBUTE.value, Types.STRUCTURE.value, [])])]
+
+    def tearDown(self):
+        super(TestTTLV, self).tearDown()
+
+    def test_decode(self):
+        self.assertEqual(
+            self.protocol_version_tree, ttlv.decode(self.protocol_version))
+
+    def test_decode_buffer(self):
+        data = bytearray(self.protocol_version)
+
+        self.assertEqual(self.protocol_version_tree, ttlv.decode(data))
+        self.assertEqual(
+            self.protocol_version_tree, ttlv.decode(memoryview(data)))
+
+    def test_decode_empty(self):
+        self.assertEqual([], ttlv.decode(b''))
+
+    def test_decode_truncated_header(self):
+        self.assertRaises(
+            errors.ReadValueError, ttlv.decode, self.protocol_version[:4])
+
+    def test_decode_truncated_value(self):
+        self.assertRaises(
+            errors.ReadValueError, ttlv.decode, self.protocol_version[:-4])
+
+    def test_decode_invalid_type(self):
+        self.assertRaises(
+            errors.ReadValueError, ttlv.decode,
+            b'\x42\x00\x6A\x0B\x00\x00\x00\x00')
+
+    def test_decode_invalid_length(self):
+        self.assertRaises(
+            errors.ReadValueError, ttlv.decode,
+            b'\x42\x00\x6A\x02\x00\x00\x00\x08'
+            b'\x00\x00\x00\x01\x00\x00\x00\x00')
+
+    def test_decode_invalid_text_string(self):
+        self.assertRaises(
+            errors.ReadValueError, ttlv.decode,
+            b'\x42\x00\x55\x07\x00\x00\x00\x02'
+            b'\xC3\x28\x00\x00\x00\x00\x00\x00')
+
+    def test_decode_invalid_boolean(self):
+        self.assertRaises(
+            errors.ReadValueError, ttlv.decode,
+            b'\x42\x00\x07\x06\x00\x00\x00\x08'
+            b'\x00\x00\x00\x00\x00\x00\x00\x02')
+
+    def test_decode_invalid_padding(self):
+        self.assertRaises(
+            errors.ReadValueError, ttlv.decode,
+            self.protocol_version[:-1] + b'\x01')
+
+    def test_decode_deeply_nested(self):
+        # Far deeper than the interpreter stack allows for recursion
+        depth = 100000
+        data = b''.join(
+            struct.pack('!II', 0x42000801, 8 * (depth - i - 1))
+            for i in range(depth))
+
+        items = ttlv.decode(data)
+
+        for _ in range(depth - 1):
+            self.assertEqual(1, len(items))
+            items = items[0][2]
+        self.assertEqual([(0x420008, Types.STRUCTURE.value, [])], items)
+        self.assertEqual(data, ttlv.encode(ttlv.decode(data)))
+
+    def test_decode_deeply_nested_truncated(self):
+        # The innermost Structure holds half of a header
+        depth = 100000
+        data = b''.join(
+            struct.pack('!II', 0x42000801, 8 * (depth - i - 1) + 4)
+            for i in range(depth)) + b'\x42\x00\x08\x01'
+
+        self.assertRaises(errors.ReadValueError, ttlv.decode, data)
+
+    def test_encode(self):
+        self.assertEqual(
+            self.protocol_version, ttlv.encode(self.protocol_version_tree))
+
+    def test_encode_enumerations(self):
+        tree = [
+            (Tags.PROTOCOL_VERSION, Types.STRUCTURE, [
+                (Tags.PROTOCOL_VERSION_MAJOR, Types.INTEGER, 1),
+                (Tags.PROTOCOL_VERSION_MINOR, Types.INTEGER, 1)])]
+
+        self.assertEqual(self.protocol_version, ttlv.encode(tree))
+
+    def test_encode_invalid_type(self):
+        self.assertRaises(
+            errors.WriteValueError, ttlv.encode,
+            [(Tags.DEFAULT.value, 0x0B, 0)])
+
+    def test_encode_value_out_of_range(self):
+        self.assertRaises(
+            errors.WriteValueError, ttlv.encode,
+            [(Tags.BATCH_COUNT.value, Types.INTEGER.value, 2 ** 31)])
+
+    def test_round_trip(self):
+        encoding = ttlv.encode(self.tree)
+
+        self.assertEqual(0, len(encoding) % 8)
+        self.assertEqual(self.tree, ttlv.decode(encoding))
+
+    def test_matches_primitives(self):
+        stream = BytearrayStream()
+        contents.ProtocolVersion.create(1, 1).write(stream)
+
+        self.assertEqual(self.protocol_version, stream.buffer)
+        self.assertEqual(
+            self.protocol_version_tree, ttlv.decode(stream.buffer))
@@ -102,12 +102,145 @@ class TestBytearrayStream(TestCase):
         self.assertEqual(0, length, msg)
 
     def test_read(self):
-        # TODO (peter-hamilton) Finish implementation.
-        self.skip('')
+        value = b'\x00\x01\x02\x03'
+        b = utils.BytearrayStream(value)
+
+        self.assertEqual(b'\x00\x01', b.read(2))
+        self.assertEqual(b'\x02\x03', b.read(2))
+        self.assertEqual(b'', b.read(2))
+        self.assertEqual(0, b.length())
+
+    def test_read_overflow(self):
+        value = b'\x00\x01\x02\x03'
+        b = utils.BytearrayStream(value)
+
+        self.assertEqual(b'\x00', b.read(1))
+        self.assertEqual(b'\x01\x02\x03', b.read(8))
+        self.assertEqual(0, b.length())
+
+    def test_read_all(self):
+        value = b'\x00\x01\x02\x03'
+        b = utils.BytearrayStream(value)
+
+        b.read(1)
+        result = b.read()
+
+        self.assertIsInstance(result, bytes)
+        self.assertEqual(b'\x01\x02\x03', result)
+        self.assertEqual(b'', b.read())
+
+    def test_read_view(self):
+        value = b'\x00\x01\x02\x03'
+        b = utils.BytearrayStream(value)
+
+        b.read(1)
+        view = b.read_view(2)
+
+        self.assertIsInstance(view, memoryview)
+        self.assertEqual(b'\x01\x02', view.tobytes())
+        self.assertEqual(b'\x03', b.buffer)
+
+    def test_init_with_view(self):
+        value = b'\x00\x01\x02\x03'
+        parent = utils.BytearrayStream(value)
+        parent.read(1)
+        b = utils.BytearrayStream(parent.read_view(2))
+
+        self.assertEqual(2, b.length())
+        self.assertEqual(b'\x01', b.read(1))
+        self.assertEqual(b'\x02', b.peek())
+        self.assertEqual(b'\x03', parent.read())
 
     def test_write(self):
-        # TODO (peter-hamilton) Finish implementation.
-        self.skip('')
+        b = utils.BytearrayStream()
+
+        self.assertEqual(2, b.write(b'\x00\x01'))
+        self.assertEqual(2, b.write(bytearray(b'\x02\x03')))
+        self.assertEqual(1, b.write(memoryview(b'\x04')))
+
+        self.assertEqual(b'\x00\x01\x02\x03\x04', b.buffer)
+        self.assertEqual(5, b.length())
+
+    def test_write_after_read(self):
+        b = utils.BytearrayStream(b'\x00\x01')
+
+        b.read(1)
+        b.write(b'\x02')
+
+        self.assertEqual(b'\x01\x02', b.buffer)
+        self.assertEqual(b'\x01', b.read(1))
+        self.assertEqual(b'\x02', b.read())
+
+    def test_write_growth(self):
+        b = utils.BytearrayStream()
+        value = bytes(bytearray(range(256)))
+
+        for _ in range(100):
+            b.write(value)
+
+        self.assertEqual(25600, b.length())
+        self.assertEqual(value * 100, b.buffer)
+
+    def test_write_preserves_views(self):
+        b = utils.BytearrayStream(size_hint=4)
+        b.write(b'\x00\x01\x02\x03')
+
+        view = b.getbuffer()
+        b.write(b'\x04' * 1024)
+
+        self.assertEqual(b'\x00\x01\x02\x03', view.tobytes())
+        self.assertEqual(1028, b.length())
+
+    def test_reserve(self):
+        b = utils.BytearrayStream()
+        b.write(b'\x01')
+
+        position = b.reserve(2)
+        b.write(b'\x04')
+
+        self.assertEqual(1, position)
+        self.assertEqual(4, b.tell())
+        self.assertEqual(b'\x01\x00\x00\x04', b.buffer)
+
+    def test_patch(self):
+        b = utils.BytearrayStream()
+        b.write(b'\x01')
+        position = b.reserve(2)
+        b.write(b'\x04' * 1024)
+
+        b.patch(position, b'\x02\x03')
+
+        self.assertEqual(b'\x01\x02\x03\x04', b.read(4))
+
+    def test_patch_after_read(self):
+        b = utils.BytearrayStream()
+        b.write(b'\x01\x02')
+        b.read(1)
+        position = b.reserve(1)
+        b.write(b'\x04' * 1024)
+
+        b.patch(position, b'\x03')
+
+        self.assertEqual(b'\x02\x03\x04', b.read(3))
+
+    def test_patch_invalid_position(self):
+        b = utils.BytearrayStream()
+        position = b.reserve(2)
+        b.read(1)
+
+        self.assertRaises(ValueError, b.patch, position, b'\x00\x00')
+        self.assertRaises(ValueError, b.patch, position + 1, b'\x00\x00')
+
+    def test_getbuffer(self):
+        b = utils.BytearrayStream(size_hint=16)
+        b.write(b'\x00\x01\x02\x03')
+        b.read(1)
+
+        view = b.getbuffer()
+
+        self.assertIsInstance(view, memoryview)
+        self.assertEqual(b'\x01\x02\x03', view.tobytes())
+        self.assertEqual(3, b.length())
 
     def test_peek(self):
         # TODO (peter-hamilton) Finish implementation.
@@ -118,17 +251,34 @@ class TestBytearrayStream(TestCase):
         b = utils.BytearrayStream(value)
 
     def test_peek_overflow(self):
-        # TODO (peter-hamilton) Finish implementation.
-        self.skip('')
+        value = b'\x00\x01\x02\x03'
+        b = utils.BytearrayStream(value)
+
+        self.assertEqual(value, b.peek(8))
+        self.assertEqual(4, b.length())
 
     def test_peek_empty(self):
-        # TODO (peter-hamilton) Finish implementation.
-        self.skip('')
+        b = utils.BytearrayStream()
+
+        self.assertEqual(b'', b.peek(1))
 
     def test_peek_none(self):
-        # TODO (peter-hamilton) Finish implementation.
-        self.skip('')
+        value = b'\x00\x01\x02\x03'
+        b = utils.BytearrayStream(value)
+
+        b.read(1)
+
+        self.assertEqual(b'\x01\x02\x03', b.peek())
+        self.assertEqual(3, b.length())
 
     def test_length(self):
-        # TODO (peter-hamilton) Finish implementation.
-        self.skip('')
+        value = b'\x00\x01\x02\x03'
+        b = utils.BytearrayStream(value)
+
+        self.assertEqual(4, b.length())
+        self.assertEqual(4, len(b))
+
+        b.read(3)
+
+        self.assertEqual(1, b.length())
+        self.assertEqual(1, len(b))
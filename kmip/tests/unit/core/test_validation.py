@@ -0,0 +1,101 @@
+# Copyright (c) 2015 The Johns Hopkins University/Applied Physics Laboratory
+# All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import threading
+
+from mock import MagicMock
+from testtools import TestCase
+
+from kmip.core import primitives
+from kmip.core import validation
+
+from kmip.core.validation import ValidationLevel
+
+
+class TestValidation(TestCase):
+    """
+    A test suite for the validation policy.
+    """
+
+    def setUp(self):
+        super(TestValidation, self).setUp()
+        self.obj = MagicMock()
+
+    def tearDown(self):
+        super(TestValidation, self).tearDown()
+        validation.set_level(ValidationLevel.STRICT)
+
+    def _test_level(self, validation_level, created, decoded):
+        with validation.level(validation_level):
+            validation.validate_created(self.obj)
+            self.assertEqual(created, self.obj.validate.call_count)
+            validation.validate_decoded(self.obj)
+            self.assertEqual(
+                created + decoded, self.obj.validate.call_count)
+
+    def test_default_level(self):
+        self.assertEqual(ValidationLevel.STRICT, validation.get_level())
+
+    def test_strict(self):
+        self._test_level(ValidationLevel.STRICT, 1, 1)
+
+    def test_decode_only(self):
+        self._test_level(ValidationLevel.DECODE_ONLY, 0, 1)
+
+    def test_off(self):
+        self._test_level(ValidationLevel.OFF, 0, 0)
+
+    def test_level_restored(self):
+        with validation.level(ValidationLevel.OFF):
+            with validation.level(ValidationLevel.DECODE_ONLY):
+                self.assertEqual(
+                    ValidationLevel.DECODE_ONLY, validation.get_level())
+            self.assertEqual(ValidationLevel.OFF, validation.get_level())
+        self.assertEqual(ValidationLevel.STRICT, validation.get_level())
+
+    def test_level_is_per_thread(self):
+        levels = []
+
+        def get_level():
+            levels.append(validation.get_level())
+
+        with validation.level(ValidationLevel.OFF):
+            thread = threading.Thread(target=get_level)
+            thread.start()
+            thread.join()
+
+        self.assertEqual([ValidationLevel.STRICT], levels)
+
+    def test_set_level(self):
+        validation.set_level(ValidationLevel.OFF)
+
+        self.assertEqual(ValidationLevel.OFF, validation.get_level())
+
+    def test_set_level_with_invalid(self):
+        self.assertRaises(TypeError, validation.set_level, 'off')
+
+    def test_level_with_invalid(self):
+        with self.assertRaises(TypeError):
+            with validation.level('off'):
+                pass
+
+    def test_create_invalid_with_strict(self):
+        self.assertRaises(TypeError, primitives.Integer, 'invalid')
+
+    def test_create_invalid_with_decode_only(self):
+        with validation.level(ValidationLevel.DECODE_ONLY):
+            integer = primitives.Integer('invalid')
+
+        self.assertEqual('invalid', integer.value)
@@ -269,6 +269,26 @@ class TestProxyKmipClient(testtools.TestCase):
         self.assertRaisesRegexp(
             KmipOperationFailure, error_msg, client.create, *args)
 
+    @mock.patch('kmip.pie.client.KMIPProxy',
+                mock.MagicMock(spec_set=KMIPProxy))
+    def test_build_key_attributes_after_change(self):
+        """
+        Test that changing a reused key attribute does not change the key
+        attributes built for later requests.
+        """
+        client = ProxyKmipClient()
+        algorithm = enums.CryptographicAlgorithm.AES
+
+        changed = client._build_key_attributes(algorithm, 256)
+        changed[1].attribute_value.value = 128
+        rebuilt = client._build_key_attributes(algorithm, 256)
+        reused = client._build_key_attributes(algorithm, 256)
+
+        self.assertEqual(256, rebuilt[1].attribute_value.value)
+        self.assertTrue(all(a.is_frozen() for a in rebuilt))
+        self.assertIsNot(changed[0], rebuilt[0])
+        self.assertIs(rebuilt[0], reused[0])
+
     @mock.patch('kmip.pie.client.KMIPProxy',
                 mock.MagicMock(spec_set=KMIPProxy))
     def test_create_key_pair(self):
@@ -414,6 +414,18 @@ class TestObjectFactory(testtools.TestCase):
         value = core_obj.opaque_data_value.value
         self.assertEqual(self.opaque_bytes, value)
 
+    def test_convert_opaque_object_without_copy(self):
+        """
+        Test that a Pie opaque object holding a memoryview can be converted
+        into a core opaque object and back without copying its value.
+        """
+        view = memoryview(self.opaque_bytes)
+        pie_obj = pobjects.OpaqueObject(view, enums.OpaqueDataType.NONE)
+        core_obj = self.factory.convert(pie_obj)
+
+        self.assertIs(view, core_obj.opaque_data_value.value)
+        self.assertIs(view, self.factory.convert(core_obj).value)
+
     def test_convert_opaque_object_core_to_pie(self):
         """
         Test that a core opaque object can be converted into a Pie opaque
@@ -0,0 +1,229 @@
+# Copyright (c) 2015 The Johns Hopkins University/Applied Physics Laboratory
+# All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import os
+import socket
+import ssl
+import struct
+import sys
+import threading
+import time
+import unittest
+
+from testtools import TestCase
+
+from kmip.core import enums
+
+from kmip.core.messages import messages
+
+from kmip.services.kmip_protocol import KMIPProtocol
+
+from kmip.tests.unit.services.test_kmip_server import build_destroy_request
+from kmip.tests.unit.services.test_kmip_server import CERTS_PATH
+from kmip.tests.unit.services.test_kmip_server import free_port
+
+if sys.version_info < (3, 7):
+    raise unittest.SkipTest('AsyncKMIPServer needs Python 3.7 or later')
+
+from kmip.services.kmip_async_server import AsyncKMIPServer  # noqa: E402
+
+
+class TestAsyncKMIPServer(TestCase):
+    """
+    A test suite for the AsyncKMIPServer, served over TLS on the loopback
+    interface.
+    """
+
+    def setUp(self):
+        super(TestAsyncKMIPServer, self).setUp()
+
+        self.port = free_port()
+        self.server = AsyncKMIPServer(
+            host='127.0.0.1', port=self.port,
+            keyfile=os.path.join(CERTS_PATH, 'server.key'),
+            certfile=os.path.join(CERTS_PATH, 'server.crt'),
+            cert_reqs='CERT_NONE', ssl_version='PROTOCOL_TLS_SERVER',
+            ca_certs='None', max_connections=2, worker_threads=1)
+        self.server.start()
+
+        self.thread = threading.Thread(target=self.server.loop.run_forever)
+        self.thread.daemon = True
+        self.thread.start()
+
+        self.context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+        self.context.check_hostname = False
+        self.context.verify_mode = ssl.CERT_NONE
+
+        self.connections = []
+
+    def tearDown(self):
+        super(TestAsyncKMIPServer, self).tearDown()
+
+        for connection in self.connections:
+            connection.close()
+
+        self.server.loop.call_soon_threadsafe(self.server.loop.stop)
+        self.thread.join(5)
+        self.server.close()
+
+    def _connect(self, session=None):
+        connection = self.context.wrap_socket(
+            socket.create_connection(('127.0.0.1', self.port), timeout=5),
+            session=session)
+        self.connections.append(connection)
+        return connection
+
+    def _read_response(self, connection):
+        message = messages.ResponseMessage()
+        message.read(KMIPProtocol(connection).read())
+        return message
+
+    def _wait_for_failures(self, failures):
+        # The server counts a failed handshake after closing the connection
+        deadline = time.time() + 5
+        while (self.server.handshake_stats.failures < failures and
+               time.time() < deadline):
+            time.sleep(0.01)
+        self.assertEqual(failures, self.server.handshake_stats.failures)
+
+    def test_sockets(self):
+        self.assertEqual(
+            self.port, self.server.sockets[0].getsockname()[1])
+
+    def test_init(self):
+        port = free_port()
+        server = AsyncKMIPServer(
+            host='127.0.0.1', port=port, reuse_port=True,
+            keyfile=os.path.join(CERTS_PATH, 'server.key'),
+            certfile=os.path.join(CERTS_PATH, 'server.crt'),
+            cert_reqs='CERT_NONE', ssl_version='PROTOCOL_TLS_SERVER',
+            ca_certs='None', worker_threads=1)
+
+        try:
+            self.assertEqual(port, server.socket.getsockname()[1])
+            self.assertTrue(server.socket.getsockopt(
+                socket.SOL_SOCKET, socket.SO_REUSEPORT))
+            self.assertIsNotNone(server._processor)
+            self.assertIsNotNone(server.handshake_stats)
+        finally:
+            server.close()
+
+        self.assertEqual(-1, server.socket.fileno())
+
+    def test_request(self):
+        connection = self._connect()
+
+        for _ in range(2):
+            connection.sendall(build_destroy_request('1'))
+            message = self._read_response(connection)
+
+            self.assertEqual(1, message.response_header.batch_count.value)
+            self.assertEqual(
+                enums.Operation.DESTROY,
+                message.batch_items[0].operation.enum)
+
+    def test_request_records_handshake(self):
+        connection = self._connect()
+        connection.sendall(build_destroy_request('1'))
+        self._read_response(connection)
+
+        self.assertEqual(1, self.server.handshake_stats.handshakes)
+        self.assertEqual(0, self.server.handshake_stats.failures)
+
+    def test_failed_handshake(self):
+        connection = socket.create_connection(
+            ('127.0.0.1', self.port), timeout=5)
+        self.connections.append(connection)
+
+        connection.sendall(b'\x00' * 64)
+
+        self.assertEqual(b'', connection.recv(1))
+        self._wait_for_failures(1)
+        self.assertEqual(0, self.server.handshake_stats.handshakes)
+        self.assertEqual(1, self.server.handshake_stats.failures)
+        self.assertEqual(0, self.server.handshake_stats.timeouts)
+
+    def test_slow_handshake(self):
+        self.server.handshake_timeout = 0.2
+        connection = socket.create_connection(
+            ('127.0.0.1', self.port), timeout=5)
+        self.connections.append(connection)
+
+        # The client never starts the handshake
+        self.assertEqual(b'', connection.recv(1))
+        self._wait_for_failures(1)
+        self.assertEqual(1, self.server.handshake_stats.timeouts)
+
+        # The connection no longer counts towards max_connections
+        for _ in range(2):
+            connection = self._connect()
+            connection.sendall(build_destroy_request('1'))
+            self._read_response(connection)
+
+    def test_request_with_resumed_session(self):
+        connection = self._connect()
+        connection.sendall(build_destroy_request('1'))
+        self._read_response(connection)
+
+        # The session ticket has been received with the response
+        connection = self._connect(session=connection.session)
+
+        self.assertTrue(connection.session_reused)
+        connection.sendall(build_destroy_request('1'))
+        message = self._read_response(connection)
+        self.assertEqual(
+            enums.Operation.DESTROY, message.batch_items[0].operation.enum)
+
+    def test_request_pipelined(self):
+        connection = self._connect()
+
+        # Requests sent together, split at any point, are each answered
+        data = b''.join(build_destroy_request(str(i)) for i in range(3))
+        connection.sendall(data[:5])
+        connection.sendall(data[5:])
+
+        for _ in range(3):
+            message = self._read_response(connection)
+            self.assertEqual(
+                enums.Operation.DESTROY,
+                message.batch_items[0].operation.enum)
+
+    def test_request_with_idle_connection(self):
+        self._connect()
+        connection = self._connect()
+
+        connection.sendall(build_destroy_request('1'))
+        message = self._read_response(connection)
+
+        self.assertEqual(1, message.response_header.batch_count.value)
+
+    def test_too_many_connections(self):
+        # Both connections are open once their requests are answered
+        for _ in range(2):
+            connection = self._connect()
+            connection.sendall(build_destroy_request('1'))
+            self._read_response(connection)
+
+        # The connection is closed before its TLS handshake
+        self.assertRaises(OSError, self._connect)
+
+    def test_frame_too_large(self):
+        connection = self._connect()
+
+        # A Request Message header announcing one byte too many
+        connection.sendall(struct.pack(
+            '!II', 0x42007801, self.server.max_frame_size - 7))
+
+        self.assertEqual(b'', connection.recv(1))
@@ -0,0 +1,211 @@
+# Copyright (c) 2015 The Johns Hopkins University/Applied Physics Laboratory
+# All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import logging
+import warnings
+
+from testtools import TestCase
+
+from kmip.core import errors
+
+from kmip.core.messages.contents import ProtocolVersion
+from kmip.core.utils import BytearrayStream
+
+from kmip.services.kmip_protocol import KMIPFramer
+from kmip.services.kmip_protocol import KMIPProtocol
+
+
+class FakeSocket(object):
+    """
+    A socket returning the given data in chunks of at most chunk_size bytes.
+    """
+
+    def __init__(self, data, chunk_size=None):
+        self.data = data
+        self.chunk_size = chunk_size
+        self.sent = b''
+
+    def recv_into(self, view):
+        size = len(view)
+        if self.chunk_size is not None:
+            size = min(size, self.chunk_size)
+        chunk, self.data = self.data[:size], self.data[size:]
+        view[:len(chunk)] = chunk
+        return len(chunk)
+
+    def sendall(self, data):
+        self.sent += bytes(data)
+
+
+class TestKMIPProtocol(TestCase):
+
+    def setUp(self):
+        super(TestKMIPProtocol, self).setUp()
+
+        # A Protocol Version structure for KMIP 1.1
+        self.frame = (
+            b'\x42\x00\x69\x01\x00\x00\x00\x20'
+            b'\x42\x00\x6A\x02\x00\x00\x00\x04\x00\x00\x00\x01\x00\x00\x00'
+            b'\x00'
+            b'\x42\x00\x6B\x02\x00\x00\x00\x04\x00\x00\x00\x01\x00\x00\x00'
+            b'\x00')
+
+    def tearDown(self):
+        super(TestKMIPProtocol, self).tearDown()
+
+    def test_read(self):
+        protocol = KMIPProtocol(FakeSocket(self.frame + self.frame))
+
+        for _ in range(2):
+            stream = protocol.read()
+            self.assertIsInstance(stream, BytearrayStream)
+            self.assertEqual(self.frame, stream.buffer)
+
+    def test_read_in_chunks(self):
+        protocol = KMIPProtocol(FakeSocket(self.frame, chunk_size=3))
+
+        version = ProtocolVersion()
+        version.read(protocol.read())
+
+        self.assertEqual(ProtocolVersion.create(1, 1), version)
+
+    def test_read_truncated(self):
+        protocol = KMIPProtocol(FakeSocket(self.frame[:-1]))
+
+        self.assertRaises(Exception, protocol.read)
+
+    def test_read_oversized(self):
+        protocol = KMIPProtocol(
+            FakeSocket(self.frame), max_frame_size=len(self.frame) - 1)
+
+        self.assertRaises(ValueError, protocol.read)
+
+    def test_read_with_debug_logging(self):
+        protocol = KMIPProtocol(FakeSocket(self.frame))
+        protocol.logger = logging.getLogger('kmip.tests.protocol')
+        protocol.logger.setLevel(logging.DEBUG)
+
+        self.assertEqual(self.frame, protocol.read().buffer)
+
+    def test_init_with_buffer_size(self):
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+            protocol = KMIPProtocol(FakeSocket(self.frame), 4096)
+
+        self.assertEqual(1, len(caught))
+        self.assertIs(DeprecationWarning, caught[0].category)
+        self.assertEqual(self.frame, protocol.read().buffer)
+
+    def test_write(self):
+        socket = FakeSocket(b'')
+        protocol = KMIPProtocol(socket)
+
+        protocol.write(memoryview(self.frame))
+
+        self.assertEqual(self.frame, socket.sent)
+
+
+class TestKMIPFramer(TestCase):
+
+    def setUp(self):
+        super(TestKMIPFramer, self).setUp()
+
+        # A Protocol Version structure for KMIP 1.1
+        self.frame = (
+            b'\x42\x00\x69\x01\x00\x00\x00\x20'
+            b'\x42\x00\x6A\x02\x00\x00\x00\x04\x00\x00\x00\x01\x00\x00\x00'
+            b'\x00'
+            b'\x42\x00\x6B\x02\x00\x00\x00\x04\x00\x00\x00\x01\x00\x00\x00'
+            b'\x00')
+
+    def tearDown(self):
+        super(TestKMIPFramer, self).tearDown()
+
+    def test_feed_whole_frame(self):
+        framer = KMIPFramer()
+
+        frames = framer.feed(self.frame)
+
+        self.assertEqual(1, len(frames))
+        self.assertIsInstance(frames[0], BytearrayStream)
+        self.assertEqual(self.frame, frames[0].buffer)
+        self.assertEqual(0, framer.pending())
+
+    def test_feed_byte_by_byte(self):
+        framer = KMIPFramer()
+        frames = []
+
+        for i in range(len(self.frame)):
+            frames.extend(framer.feed(self.frame[i:i + 1]))
+            if i < len(self.frame) - 1:
+                self.assertEqual([], frames)
+                self.assertEqual(i + 1, framer.pending())
+
+        self.assertEqual(1, len(frames))
+        self.assertEqual(self.frame, frames[0].buffer)
+        self.assertEqual(0, framer.pending())
+
+    def test_feed_several_frames(self):
+        framer = KMIPFramer()
+        data = self.frame * 3
+
+        frames = framer.feed(data[:50])
+        frames.extend(framer.feed(data[50:]))
+
+        self.assertEqual(3, len(frames))
+        for frame in frames:
+            self.assertEqual(self.frame, frame.buffer)
+        self.assertEqual(0, framer.pending())
+
+    def test_feed_keeps_partial_frame(self):
+        framer = KMIPFramer()
+
+        frames = framer.feed(self.frame + self.frame[:12])
+
+        self.assertEqual(1, len(frames))
+        self.assertEqual(12, framer.pending())
+
+    def test_feed_empty(self):
+        framer = KMIPFramer()
+
+        self.assertEqual([], framer.feed(b''))
+        self.assertEqual(0, framer.pending())
+
+    def test_feed_with_message_class(self):
+        framer = KMIPFramer(message_class=ProtocolVersion)
+
+        frames = framer.feed(self.frame)
+
+        self.assertEqual([ProtocolVersion.create(1, 1)], frames)
+
+    def test_feed_with_invalid_message(self):
+        framer = KMIPFramer(message_class=ProtocolVersion)
+        # A Protocol Version whose minor version has the wrong tag
+        invalid = self.frame[:24] + b'\x42\x00\x6C' + self.frame[27:]
+
+        self.assertRaises(
+            errors.ReadValueError, framer.feed,
+            self.frame * 2 + invalid + self.frame[:12])
+        self.assertEqual(12, framer.pending())
+
+        frames = framer.feed(self.frame[12:])
+
+        self.assertEqual([ProtocolVersion.create(1, 1)] * 3, frames)
+        self.assertEqual(0, framer.pending())
+
+    def test_feed_oversized_frame(self):
+        framer = KMIPFramer(max_frame_size=len(self.frame) - 1)
+
+        self.assertRaises(ValueError, framer.feed, self.frame[:8])
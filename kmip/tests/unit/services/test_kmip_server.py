@@ -0,0 +1,375 @@
+# Copyright (c) 2015 The Johns Hopkins University/Applied Physics Laboratory
+# All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import os
+import resource
+import socket
+import ssl
+import threading
+
+from mock import MagicMock
+from mock import patch
+from testtools import TestCase
+
+from kmip.core import attributes
+from kmip.core import enums
+from kmip.core import utils
+
+from kmip.core.messages import contents
+from kmip.core.messages import messages
+from kmip.core.messages.payloads import destroy
+
+from kmip.services.kmip_protocol import KMIPProtocol
+from kmip.services.kmip_server import HandshakeStats
+from kmip.services.kmip_server import KMIPServer
+
+CERTS_PATH = os.path.normpath(os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), '../../../demos/certs'))
+
+
+def build_destroy_request(uuid):
+    header = messages.RequestHeader(
+        protocol_version=contents.ProtocolVersion.create(1, 1),
+        batch_count=contents.BatchCount(1))
+    batch_item = messages.RequestBatchItem(
+        operation=contents.Operation(enums.Operation.DESTROY),
+        request_payload=destroy.DestroyRequestPayload(
+            attributes.UniqueIdentifier(uuid)))
+    message = messages.RequestMessage(
+        request_header=header, batch_items=[batch_item])
+
+    stream = utils.BytearrayStream()
+    message.write(stream)
+    return stream.buffer
+
+
+def free_port():
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    try:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+    finally:
+        sock.close()
+
+
+class TestKMIPServer(TestCase):
+    """
+    A test suite for the concurrent handling of connections by KMIPServer.
+    """
+
+    def setUp(self):
+        super(TestKMIPServer, self).setUp()
+
+        # The listening socket is never used, no SSL context is created, and
+        # TLS is not set up on the connections served directly by the tests
+        socket_patcher = patch('kmip.services.kmip_server.socket')
+        socket_patcher.start()
+        self.addCleanup(socket_patcher.stop)
+
+        self.server = KMIPServer(
+            host='127.0.0.1', port=5696, max_connections=2, worker_threads=1)
+        self.server._create_ssl_context = MagicMock()
+        self.server._wrap_socket = lambda connection: connection
+
+        self.connections = []
+
+    def tearDown(self):
+        super(TestKMIPServer, self).tearDown()
+        for connection in self.connections:
+            connection.close()
+
+    def _connect(self):
+        client, server = socket.socketpair()
+        client.settimeout(5)
+        self.connections.append(client)
+
+        self.server._connections.acquire()
+        thread = threading.Thread(
+            target=self.server._serve_connection, args=(server, None))
+        thread.daemon = True
+        thread.start()
+        return client
+
+    def _request(self, client):
+        protocol = KMIPProtocol(client)
+        protocol.write(build_destroy_request('1'))
+
+        message = messages.ResponseMessage()
+        message.read(protocol.read())
+        return message
+
+    def test_init(self):
+        self.assertEqual(2, self.server.max_connections)
+        self.assertEqual(1, self.server.worker_threads)
+
+    def test_serve_connection(self):
+        client = self._connect()
+
+        for _ in range(2):
+            message = self._request(client)
+            self.assertEqual(1, message.response_header.batch_count.value)
+
+    def test_serve_connection_with_idle_connection(self):
+        # An idle client holds its own thread, but no worker
+        self._connect()
+        client = self._connect()
+
+        message = self._request(client)
+
+        self.assertEqual(
+            enums.Operation.DESTROY, message.batch_items[0].operation.enum)
+
+    def test_serve_connection_releases_connection(self):
+        client = self._connect()
+        client.close()
+
+        # Both connections can be acquired again once the thread exits
+        for _ in range(2):
+            self.assertTrue(self.server._connections.acquire(timeout=5))
+
+    def test_serve_with_too_many_connections(self):
+        connection = MagicMock()
+        self.server.socket.accept.side_effect = [
+            (connection, ('127.0.0.1', 1)), ValueError('stop')]
+        for _ in range(2):
+            self.server._connections.acquire()
+
+        self.assertRaises(ValueError, self.server.serve)
+        connection.close.assert_called_once_with()
+
+    def test_serve_creates_ssl_context_once(self):
+        self.server.socket.accept.side_effect = ValueError('stop')
+
+        for _ in range(2):
+            self.assertRaises(ValueError, self.server.serve)
+
+        self.server._create_ssl_context.assert_called_once_with()
+        self.assertEqual(
+            self.server._create_ssl_context.return_value,
+            self.server.ssl_context)
+
+
+class TestKMIPServerTLS(TestCase):
+    """
+    A test suite for the TLS set up by KMIPServer on its connections.
+    """
+
+    def setUp(self):
+        super(TestKMIPServerTLS, self).setUp()
+
+        self.server = self._create_server()
+
+        self.connections = []
+
+    def tearDown(self):
+        super(TestKMIPServerTLS, self).tearDown()
+        for connection in self.connections:
+            connection.close()
+
+    def _create_server(self, **kwargs):
+        server = KMIPServer(
+            host='127.0.0.1', port=0,
+            keyfile=os.path.join(CERTS_PATH, 'server.key'),
+            certfile=os.path.join(CERTS_PATH, 'server.crt'),
+            cert_reqs='CERT_NONE', ssl_version='PROTOCOL_TLS_SERVER',
+            ca_certs='None', max_connections=1, **kwargs)
+        self.addCleanup(server.socket.close)
+        return server
+
+    def test_init_with_booleans(self):
+        for value in (True, 'True', 'true'):
+            server = self._create_server(session_tickets=value)
+            self.assertTrue(server.session_tickets)
+        for value in (False, 'False'):
+            server = self._create_server(session_tickets=value)
+            self.assertFalse(server.session_tickets)
+
+        server = self._create_server(
+            do_handshake_on_connect=False, suppress_ragged_eofs=False)
+        self.assertFalse(server.do_handshake_on_connect)
+        self.assertFalse(server.suppress_ragged_eofs)
+
+    def test_init_with_handshake_timeout(self):
+        self.assertEqual(10.0, self.server.handshake_timeout)
+        server = self._create_server(handshake_timeout=0)
+        self.assertEqual(0.0, server.handshake_timeout)
+        server = self._create_server(handshake_timeout='2.5')
+        self.assertEqual(2.5, server.handshake_timeout)
+
+    def test_create_ssl_context(self):
+        context = self.server._create_ssl_context()
+
+        self.assertEqual(ssl.CERT_NONE, context.verify_mode)
+        self.assertTrue(context.options & ssl.OP_CIPHER_SERVER_PREFERENCE)
+        self.assertFalse(context.options & ssl.OP_NO_TICKET)
+
+    def test_create_ssl_context_with_ciphers(self):
+        server = self._create_server(ciphers='AES256-SHA')
+        context = server._create_ssl_context()
+
+        names = [cipher['name'] for cipher in context.get_ciphers()
+                 if cipher['protocol'] != 'TLSv1.3']
+        self.assertEqual(['AES256-SHA'], names)
+
+    def test_create_ssl_context_without_session_tickets(self):
+        server = self._create_server(session_tickets='False')
+        context = server._create_ssl_context()
+
+        self.assertTrue(context.options & ssl.OP_NO_TICKET)
+        self.assertEqual(0, context.num_tickets)
+
+    def test_wrap_socket(self):
+        self.server.ssl_context = MagicMock()
+        connection = MagicMock()
+
+        wrapped = self.server._wrap_socket(connection)
+
+        self.server.ssl_context.wrap_socket.assert_called_once_with(
+            connection, server_side=True, do_handshake_on_connect=False,
+            suppress_ragged_eofs=True)
+        self.assertEqual(
+            self.server.ssl_context.wrap_socket.return_value, wrapped)
+        wrapped.do_handshake.assert_called_once_with()
+        wrapped.setblocking.assert_any_call(False)
+        wrapped.setblocking.assert_called_with(True)
+        self.assertEqual(1, self.server.handshake_stats.handshakes)
+
+    def test_wrap_socket_with_failed_handshake(self):
+        self.server.ssl_context = MagicMock()
+        wrapped = self.server.ssl_context.wrap_socket.return_value
+        wrapped.do_handshake.side_effect = ssl.SSLError('handshake')
+
+        self.assertRaises(
+            ssl.SSLError, self.server._wrap_socket, MagicMock())
+        self.assertEqual(0, self.server.handshake_stats.handshakes)
+        self.assertEqual(1, self.server.handshake_stats.failures)
+        self.assertEqual(0, self.server.handshake_stats.timeouts)
+
+    def test_serve_connection_with_slow_handshake(self):
+        server = self._create_server(handshake_timeout=0.1)
+        server.ssl_context = server._create_ssl_context()
+
+        # The client never starts the handshake
+        client, connection = socket.socketpair()
+        self.connections.append(client)
+        server._connections.acquire()
+        thread = threading.Thread(
+            target=server._serve_connection, args=(connection, None))
+        thread.daemon = True
+        thread.start()
+
+        thread.join(5)
+        self.assertFalse(thread.is_alive())
+        self.assertEqual(1, server.handshake_stats.failures)
+        self.assertEqual(1, server.handshake_stats.timeouts)
+        self.assertTrue(server._connections.acquire(False))
+
+    def test_handshake_with_high_descriptor(self):
+        # select cannot wait on descriptors from FD_SETSIZE, usually 1024
+        descriptor = 2048
+        soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+        if soft <= descriptor:
+            if hard != resource.RLIM_INFINITY and hard <= descriptor:
+                self.skipTest('cannot open descriptor {0}'.format(descriptor))
+            resource.setrlimit(resource.RLIMIT_NOFILE, (descriptor + 1, hard))
+            self.addCleanup(
+                resource.setrlimit, resource.RLIMIT_NOFILE, (soft, hard))
+
+        self.server.ssl_context = self.server._create_ssl_context()
+        client, connection = socket.socketpair()
+        self.connections.append(client)
+        os.dup2(connection.fileno(), descriptor)
+        connection.close()
+        connection = socket.socket(fileno=descriptor)
+        self.connections.append(connection)
+
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+        context.check_hostname = False
+        context.verify_mode = ssl.CERT_NONE
+        thread = threading.Thread(
+            target=context.wrap_socket, args=(client, ))
+        thread.daemon = True
+        thread.start()
+
+        wrapped = self.server._wrap_socket(connection)
+        self.connections.append(wrapped)
+        thread.join(5)
+
+        self.assertEqual(descriptor, wrapped.fileno())
+        self.assertEqual(1, self.server.handshake_stats.handshakes)
+
+    def test_serve_connection_with_slow_drip_handshake(self):
+        server = self._create_server(handshake_timeout=0.5)
+        server.ssl_context = server._create_ssl_context()
+
+        # The client sends the start of a large TLS record, then one byte at
+        # a time, each well within the timeout
+        client, connection = socket.socketpair()
+        self.connections.append(client)
+        stop = threading.Event()
+
+        def drip():
+            try:
+                client.sendall(b'\x16\x03\x01\x40\x00')
+                while not stop.wait(0.05):
+                    client.sendall(b'\x00')
+            except socket.error:
+                pass
+
+        dripper = threading.Thread(target=drip)
+        dripper.daemon = True
+        dripper.start()
+        self.addCleanup(stop.set)
+
+        server._connections.acquire()
+        thread = threading.Thread(
+            target=server._serve_connection, args=(connection, None))
+        thread.daemon = True
+        thread.start()
+
+        thread.join(5)
+        self.assertFalse(thread.is_alive())
+        self.assertEqual(1, server.handshake_stats.timeouts)
+        self.assertTrue(server._connections.acquire(False))
+
+
+class TestHandshakeStats(TestCase):
+    """
+    A test suite for the HandshakeStats kept by KMIPServer.
+    """
+
+    def setUp(self):
+        super(TestHandshakeStats, self).setUp()
+        self.stats = HandshakeStats()
+
+    def tearDown(self):
+        super(TestHandshakeStats, self).tearDown()
+
+    def test_snapshot(self):
+        self.assertEqual(
+            {'handshakes': 0, 'failures': 0, 'timeouts': 0,
+             'mean_time': 0.0, 'max_time': 0.0},
+            self.stats.snapshot())
+
+    def test_record(self):
+        self.stats.record(0.5)
+        self.stats.record(1.5)
+        self.stats.record(3.0, ssl.SSLError('handshake'))
+        self.stats.record(3.0, socket.timeout('timed out'))
+
+        self.assertEqual(
+            {'handshakes': 2, 'failures': 2, 'timeouts': 1,
+             'mean_time': 1.0, 'max_time': 1.5},
+            self.stats.snapshot())
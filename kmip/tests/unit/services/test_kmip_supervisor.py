@@ -0,0 +1,156 @@
+# Copyright (c) 2015 The Johns Hopkins University/Applied Physics Laboratory
+# All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import os
+import shutil
+import signal
+import tempfile
+import time
+
+from testtools import TestCase
+
+from kmip.services.kmip_server import KMIPServer
+from kmip.services.kmip_supervisor import KMIPServerSupervisor
+
+from kmip.tests.unit.services.test_kmip_server import free_port
+
+
+class Stop(Exception):
+    pass
+
+
+class FakeServer(object):
+    """
+    A server that records each start in a file, then exits, or sleeps when
+    asked to. Once it has been started enough times, it signals the
+    supervisor, after a short delay so the supervisor is not interrupted
+    while it is still forking.
+    """
+
+    def __init__(self, reuse_port, path, starts, sleep=False,
+                 signum=signal.SIGUSR1):
+        self.reuse_port = reuse_port
+        self.path = path
+        self.starts = starts
+        self.sleep = sleep
+        self.signum = signum
+
+    def serve(self):
+        with open(self.path, 'a') as f:
+            f.write('{0} {1}\n'.format(os.getpid(), self.reuse_port))
+        with open(self.path) as f:
+            if len(f.readlines()) == self.starts:
+                time.sleep(0.1)
+                os.kill(os.getppid(), self.signum)
+        if self.sleep:
+            time.sleep(60)
+
+    def close(self):
+        pass
+
+
+class TestKMIPServerSupervisor(TestCase):
+    """
+    A test suite for the KMIPServerSupervisor, with worker processes running
+    fake servers.
+    """
+
+    def setUp(self):
+        super(TestKMIPServerSupervisor, self).setUp()
+
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        self.path = os.path.join(directory, 'starts')
+
+        for signum in (signal.SIGTERM, signal.SIGUSR1):
+            self.addCleanup(signal.signal, signum, signal.getsignal(signum))
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        signal.signal(signal.SIGUSR1, self._stop)
+
+    def tearDown(self):
+        super(TestKMIPServerSupervisor, self).tearDown()
+
+    def _stop(self, signum, frame):
+        raise Stop()
+
+    def _starts(self):
+        with open(self.path) as f:
+            return [line.split() for line in f.readlines()]
+
+    def _serve(self, supervisor):
+        supervisor.RESTART_DELAY = 0
+        try:
+            self.assertRaises(Stop, supervisor.serve)
+        finally:
+            supervisor.close()
+
+    def test_init(self):
+        supervisor = KMIPServerSupervisor(processes=3, port=5696)
+
+        self.assertEqual(3, supervisor.processes)
+        self.assertEqual(KMIPServer, supervisor.server_class)
+        self.assertEqual({'port': 5696}, supervisor.server_args)
+
+    def test_serve(self):
+        supervisor = KMIPServerSupervisor(
+            processes=2, server_class=FakeServer, path=self.path, starts=2,
+            sleep=True)
+
+        self._serve(supervisor)
+
+        starts = self._starts()
+        self.assertEqual(2, len(set(pid for pid, _ in starts)))
+        self.assertEqual(['True', 'True'], [port for _, port in starts])
+
+    def test_serve_restarts_workers(self):
+        supervisor = KMIPServerSupervisor(
+            processes=1, server_class=FakeServer, path=self.path, starts=3)
+
+        self._serve(supervisor)
+
+        self.assertEqual(3, len(set(pid for pid, _ in self._starts())))
+
+    def test_close(self):
+        supervisor = KMIPServerSupervisor(
+            processes=2, server_class=FakeServer, path=self.path, starts=2,
+            sleep=True)
+
+        self._serve(supervisor)
+
+        self.assertEqual({}, supervisor._workers)
+        for pid, _ in self._starts():
+            self.assertRaises(OSError, os.kill, int(pid), 0)
+
+    def test_serve_stops_workers(self):
+        supervisor = KMIPServerSupervisor(
+            processes=2, server_class=FakeServer, path=self.path, starts=2,
+            sleep=True, signum=signal.SIGTERM)
+        supervisor.RESTART_DELAY = 0
+
+        self.assertRaises(SystemExit, supervisor.serve)
+
+        self.assertEqual({}, supervisor._workers)
+        for pid, _ in self._starts():
+            self.assertRaises(OSError, os.kill, int(pid), 0)
+        self.assertEqual(signal.SIG_DFL, signal.getsignal(signal.SIGTERM))
+
+    def test_reuse_port(self):
+        port = free_port()
+        servers = [KMIPServer(host='127.0.0.1', port=port, reuse_port=True)
+                   for _ in range(2)]
+
+        for server in servers:
+            self.assertEqual(port, server.socket.getsockname()[1])
+            server.socket.close()
@@ -0,0 +1,90 @@
+# Copyright (c) 2015 The Johns Hopkins University/Applied Physics Laboratory
+# All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import mock
+import os
+import shutil
+import tempfile
+
+from testtools import TestCase
+
+from kmip.core import enums
+from kmip.core import validation
+
+from kmip.core.factories.attributes import AttributeFactory
+
+from kmip.core.messages.payloads.destroy import DestroyRequestPayload
+from kmip.core.messages.payloads.locate import LocateRequestPayload
+
+from kmip.core.repo.sqlite_repo import SQLiteRepo
+
+from kmip.core.server import KMIPImpl
+
+from kmip.services.processor import Processor
+
+
+class TestProcessor(TestCase):
+    """
+    A test suite for the Processor.
+    """
+
+    def setUp(self):
+        super(TestProcessor, self).setUp()
+
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        self.repo = SQLiteRepo(os.path.join(directory, 'kmip.db'))
+        self.processor = Processor(KMIPImpl(repo=self.repo))
+
+    def tearDown(self):
+        super(TestProcessor, self).tearDown()
+
+    def test_process_locate_request(self):
+        attributes = [AttributeFactory().create_attribute(
+            enums.AttributeType.CRYPTOGRAPHIC_LENGTH, 128)]
+        uuid = self.repo.save(None, attributes)
+        payload = LocateRequestPayload(
+            maximum_items=LocateRequestPayload.MaximumItems(1),
+            attributes=attributes)
+
+        status, reason, message, response_payload = \
+            self.processor._process_locate_request(payload)
+
+        self.assertEqual(enums.ResultStatus.SUCCESS, status.enum)
+        self.assertEqual(
+            [uuid],
+            [uid.value for uid in response_payload.unique_identifiers])
+
+    def test_process_request_validation_level(self):
+        levels = []
+
+        def record_level(*args, **kwargs):
+            levels.append(validation.get_level())
+            return mock.MagicMock()
+
+        handler = mock.MagicMock()
+        handler.destroy.side_effect = record_level
+        processor = Processor(handler)
+        payload = DestroyRequestPayload()
+
+        with mock.patch('kmip.services.processor.DestroyResponsePayload',
+                        side_effect=record_level):
+            processor._process_destroy_request(payload)
+
+        # Only the response is built without validation on creation
+        self.assertEqual(
+            [validation.ValidationLevel.STRICT,
+             validation.ValidationLevel.DECODE_ONLY],
+            levels)